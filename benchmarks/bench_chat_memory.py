@@ -0,0 +1,118 @@
+"""Chat nativo: QTextEdit com append por mensagem (legado) vs. ChatLayer com buffer circular
+
+Sobe o servidor IRC local (irc_standin.py) mandando RATE mensagens/s e deixa cada
+versão recebendo por DURATION segundos (tempo real, plataforma offscreen). A cada 2 s
+mede a memória do processo (RSS) e quantas mensagens estão guardadas; no fim mostra
+frames pintados e lotes aplicados pelo ChatLayer.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_chat_memory.py [segundos] [mensagens/s]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import synthetic  # noqa: F401 (coloca src/ no sys.path)
+from PySide6 import QtCore, QtWidgets
+from core.frame_scheduler import FrameScheduler
+from core.topic_bus import TopicBus
+from core.twitch_irc import TwitchIrcClient
+from irc_standin import IrcStandIn
+from layers.chat_layer import ChatLayer
+
+DURATION = 20.0
+RATE = 50.0
+SAMPLE_EVERY = 2.0
+
+
+class FakeApp:
+    locked = False
+
+    def __init__(self):
+        self.bus = TopicBus()
+        self.frame_scheduler = FrameScheduler(self.bus)
+
+
+def rss_mb():
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class LegacyChat(QtWidgets.QTextEdit):
+    """ChatLayer antigo: cada mensagem vira um append no QTextEdit, sem limite"""
+
+    def __init__(self, host, port):
+        super().__init__()
+        self.setReadOnly(True)
+        self.setStyleSheet("background-color: rgba(0,0,0,120); color: white; font-size: 12px;")
+        self.client = TwitchIrcClient("canal", host=host, port=port, max_pending=10**9, parent=self)
+        self.client.messages_pending.connect(self._drain)
+        self.client.start()
+
+    def _drain(self):
+        for message in self.client.take_pending():
+            self.append(f"[{message.time}] {message.user}: {message.text}")
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+    def stored(self):
+        return self.document().blockCount()
+
+
+def run(app, widget, stored, duration):
+    widget.resize(400, 600)
+    widget.show()
+    samples = []
+    start = time.perf_counter()
+    next_sample = start
+    while time.perf_counter() - start < duration:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        if time.perf_counter() >= next_sample:
+            samples.append((time.perf_counter() - start, rss_mb(), stored()))
+            next_sample += SAMPLE_EVERY
+    samples.append((time.perf_counter() - start, rss_mb(), stored()))
+    return samples
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else DURATION
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else RATE
+    app = QtWidgets.QApplication([])
+    server = IrcStandIn(rate=rate).start()
+    print(f"IRC local {server.host}:{server.port}, {rate:.0f} msg/s, {duration:.0f} s por versão")
+
+    legacy = LegacyChat(server.host, server.port)
+    legacy_samples = run(app, legacy, legacy.stored, duration)
+    legacy.client.stop()
+    legacy.deleteLater()
+    app.processEvents()
+
+    layer = ChatLayer(FakeApp())
+    layer.client.host, layer.client.port = server.host, server.port
+    layer.client.start()
+    layer.frames_painted = 0
+    native_samples = run(app, layer, lambda: len(layer.messages), duration)
+    layer.client.stop()
+    server.stop()
+
+    print(f"{'t (s)':>6} | {'legado MB':>9} | {'msgs':>6} | {'nativo MB':>9} | {'msgs':>6}")
+    for old, new in zip(legacy_samples, native_samples):
+        print(f"{old[0]:>6.1f} | {old[1]:>9.1f} | {old[2]:>6} | {new[1]:>9.1f} | {new[2]:>6}")
+    # segunda metade: o buffer circular já está cheio
+    half = len(legacy_samples) // 2
+    growth_old = legacy_samples[-1][1] - legacy_samples[half][1]
+    growth_new = native_samples[-1][1] - native_samples[half][1]
+    print(f"crescimento na segunda metade: legado {growth_old:+.1f} MB, nativo {growth_new:+.1f} MB")
+    print(
+        f"nativo: {layer.messages.total} mensagens recebidas, {len(layer.messages)} guardadas "
+        f"(capacidade {layer.messages.capacity}), {layer.batches} lotes, {layer.frames_painted} frames pintados"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Delta para a melhor volta: estimativa linear (% da volta x melhor tempo) vs. DeltaEngine
+
+Player sozinho numa pista sintética (SyntheticSim a 240 Hz) com tempo de volta e
+traçado (força das curvas) mudando a cada volta. A verdade vem do histórico de
+distância a 240 Hz: tempo desde a linha agora menos o tempo da melhor volta no mesmo
+ponto. O engine recebe só 1 de cada 4 amostras (60 Hz, como o produto "delta").
+Compara, duas vezes por segundo:
+- linear: tempo da volta atual - LapDistPct * melhor volta;
+- engine: delta contra a melhor volta gravada em DELTA_BINS pontos;
+e a volta prevista (melhor volta + delta), nos últimos 20% da volta, contra o tempo real. Depois mede o custo por
+amostra e a memória alocada ao longo de várias voltas.
+
+Uso: python benchmarks/bench_delta.py [minutos]
+"""
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+import synthetic
+from core.delta_engine import DELTA_BINS, DeltaEngine
+
+SIM_RATE = 240
+TICK_RATE = 60
+EVAL_EVERY = SIM_RATE // 2
+# volta prevista só é comparada no fim da volta: antes disso o resto da volta ainda vai variar
+PREDICT_FROM = 0.8
+
+
+def run_laps(minutes):
+    sim = synthetic.SyntheticSim(num_cars=1, seed=11, tick_rate=SIM_RATE)
+    rng = np.random.default_rng(11)
+    sim.pct[:] = 0.0
+    shape = {"amp": 0.5}
+    sim.speed_profile = lambda pct: 1.0 + shape["amp"] * np.sin(2 * np.pi * 4 * pct)
+    engine = DeltaEngine()
+
+    steps = int(minutes * 60 * SIM_RATE)
+    times = np.empty(steps)
+    dists = np.empty(steps)
+    evals = []  # (passo, delta do engine, volta prevista)
+    lap = sim.lap[0]
+    for step in range(steps):
+        sim.step()
+        if sim.lap[0] != lap:
+            lap = sim.lap[0]
+            sim.lap_time[0] = 90.0 + rng.normal(0.0, 0.4)
+            shape["amp"] = 0.5 + rng.normal(0.0, 0.02)
+        times[step] = sim.session_time
+        dists[step] = (sim.lap[0] - 1) + sim.pct[0]
+        if step % (SIM_RATE // TICK_RATE):
+            continue
+        engine.update(sim.session_time, float(sim.pct[0]))
+        if step % EVAL_EVERY == 0 and engine.predicted == engine.predicted:
+            evals.append((step, engine.delta, engine.predicted))
+    sim.close()
+
+    def at(x):
+        return np.interp(x, dists, times)
+
+    first_lap = int(np.ceil(dists[0]))
+    errors = {"linear": [], "engine": [], "prevista linear": [], "prevista engine": []}
+    for step, delta, predicted in evals:
+        d = dists[step]
+        k = int(d)
+        # melhor volta completa antes de agora
+        done = np.arange(first_lap, k)
+        lap_times = at(done + 1.0) - at(done.astype(float))
+        best = done[np.argmin(lap_times)]
+        best_time = lap_times.min()
+        elapsed = times[step] - at(float(k))
+        true_delta = elapsed - (at(best + (d - k)) - at(float(best)))
+        linear = elapsed - (d - k) * best_time
+        errors["linear"].append(abs(linear - true_delta))
+        errors["engine"].append(abs(delta - true_delta))
+        if dists[-1] >= k + 1 and d - k >= PREDICT_FROM:
+            lap_time = at(k + 1.0) - at(float(k))
+            errors["prevista linear"].append(abs(best_time + linear - lap_time))
+            errors["prevista engine"].append(abs(predicted - lap_time))
+    return errors
+
+
+def cost(laps=20):
+    """µs por amostra a 60 Hz (com o fechamento das voltas) e memória retida ao final"""
+    engine = DeltaEngine()
+    samples = int(laps * 90.0 * TICK_RATE)
+    t = np.arange(samples) / TICK_RATE
+    pct = (t / 90.0 + 0.01 * np.sin(2 * np.pi * t / 90.0 * 4)) % 1.0
+    t, pct = t.tolist(), pct.tolist()
+
+    def run():
+        engine.reset()
+        for i in range(samples):
+            engine.update(t[i], pct[i])
+
+    per_sample = min(timeit.repeat(run, number=1, repeat=3)) / samples * 1e6
+    engine.reset()
+    tracemalloc.start()
+    for i in range(samples // 2):
+        engine.update(t[i], pct[i])
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(samples // 2, samples):
+        engine.update(t[i], pct[i])
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return per_sample, after - before
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 15.0
+    errors = run_laps(minutes)
+    print(f"player sozinho, {minutes:.0f} min, referência em {DELTA_BINS} pontos, engine a {TICK_RATE} Hz")
+    print(f"{'versão':>15} | {'amostras':>8} | {'erro p50 (ms)':>13} | {'erro p95 (ms)':>13} | {'erro máx (ms)':>13}")
+    for name, err in errors.items():
+        err = np.array(err) * 1000
+        print(f"{name:>15} | {len(err):>8} | {np.percentile(err, 50):>13.1f} | {np.percentile(err, 95):>13.1f} | {err.max():>13.1f}")
+
+    per_sample, retained = cost()
+    print()
+    print(f"engine.update: {per_sample:.1f} us por amostra; memória retida em 10 voltas: {retained} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Latência de entrar/sair do modo edição: setWindowFlags (legado) vs. alças dentro da janela
+
+Cria N layers (standings, fuel, car_lr, repetidos) e alterna o modo edição TOGGLES
+vezes, como o ControlPanel faz. Mede o tempo de cada troca (chamadas + event loop até
+esvaziar) e quantas janelas nativas foram recriadas (eventos WinIdChange).
+Roda num diretório temporário: no legado a troca de flags esconde a janela, e o
+hideEvent do standings grava a config.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_edit_toggle.py [layers]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import synthetic  # noqa: F401 (coloca src/ no sys.path)
+from PySide6 import QtCore, QtWidgets
+from core.frame_scheduler import FrameScheduler
+from core.topic_bus import TopicBus
+from layers.car_lr_layer import CarLRLayer
+from layers.fuel_layer import FuelLayer
+from layers.standings_layer import StandingsLayer
+
+TOGGLES = 20
+LAYER_TYPES = (StandingsLayer, FuelLayer, CarLRLayer)
+
+
+class FakeApp:
+    locked = False
+
+    def __init__(self):
+        self.bus = TopicBus()
+        self.frame_scheduler = FrameScheduler(self.bus)
+
+
+def legacy_toggle(layers, editing):
+    """ControlPanel.toggle_edit_mode + BaseLayer.set_edit_mode antes das alças internas"""
+    for layer in layers:
+        layer._editing = editing
+        if editing:
+            layer.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.WindowStaysOnTopHint)
+        else:
+            layer.setWindowFlags(QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool)
+        layer.show()
+    if not editing:
+        # a troca de flags esconde a janela: passada de visibilidade do painel
+        for layer in layers:
+            layer.show()
+            layer.raise_()
+            layer.activateWindow()
+
+
+def in_window_toggle(layers, editing):
+    for layer in layers:
+        layer.set_edit_mode(editing)
+
+
+class WinIdCounter(QtCore.QObject):
+    """Conta as trocas de janela nativa (WinIdChange) dos layers"""
+
+    def __init__(self, layers):
+        super().__init__()
+        self.changes = 0
+        for layer in layers:
+            layer.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.WinIdChange:
+            self.changes += 1
+        return False
+
+
+def run(app, layers, toggle):
+    times = []
+    counter = WinIdCounter(layers)
+    for i in range(TOGGLES):
+        start = time.perf_counter()
+        toggle(layers, i % 2 == 0)
+        app.processEvents()
+        app.processEvents()  # paints agendados pelo primeiro passe
+        times.append((time.perf_counter() - start) * 1000)
+    return times, counter.changes
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    os.chdir(tempfile.mkdtemp())  # layers gravam overlay_config.json ao esconder/fechar
+    app = QtWidgets.QApplication([])
+    fake = FakeApp()
+    print(f"{count} layers, {TOGGLES} trocas de modo edição")
+    print(f"{'versão':>8} | {'mediana (ms)':>12} | {'máx (ms)':>8} | {'janelas recriadas':>17}")
+    for label, toggle in (("legado", legacy_toggle), ("alças", in_window_toggle)):
+        layers = []
+        for i in range(count):
+            layer = LAYER_TYPES[i % len(LAYER_TYPES)](fake)
+            layer.setGeometry(40 + 30 * i, 40 + 30 * i, 320, 200)
+            layer.show()
+            layers.append(layer)
+        app.processEvents()
+        times, recreated = run(app, layers, toggle)
+        print(f"{label:>8} | {statistics.median(times):>12.2f} | {max(times):>8.2f} | {recreated:>17}")
+        for layer in layers:
+            layer.close()
+            layer.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Entrega ao layer: singleShot por pacote (legado) vs. TopicBus + FrameScheduler
+
+Uma thread publica pacotes a POLL_HZ (como o IRacingClient com polling rápido) e o
+layer gasta UPDATE_MS em cada atualização (update + paint). Mede quantas atualizações
+rodaram, a idade dos dados no momento da atualização e quantos pacotes ainda estavam
+na fila quando o produtor parou.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_frame_pacing.py
+"""
+import os
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import synthetic  # noqa: F401 (coloca src/ no sys.path)
+from PySide6 import QtCore, QtWidgets
+from core.frame_scheduler import FrameScheduler
+from core.topic_bus import TopicBus
+
+DURATION = 3.0
+POLL_HZ = 240
+UPDATE_MS = 6.0
+
+
+class Producer(QtCore.QObject):
+    data_ready = QtCore.Signal(dict)
+
+    def run(self, stop):
+        interval = 1.0 / POLL_HZ
+        next_tick = time.perf_counter()
+        while not stop.is_set():
+            self.data_ready.emit({"car_lr": time.perf_counter()})
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+
+
+class Layer:
+    """Layer fictício: custo fixo por atualização, guarda a idade do dado exibido"""
+
+    def __init__(self):
+        self.ages = []
+
+    def update_ui(self, stamp):
+        self.ages.append(time.perf_counter() - stamp)
+        end = time.perf_counter() + UPDATE_MS / 1000
+        while time.perf_counter() < end:
+            pass
+
+
+def run(app, connect):
+    producer = Producer()
+    layer = Layer()
+    connect(producer, layer)
+    stop = threading.Event()
+    thread = threading.Thread(target=producer.run, args=(stop,), daemon=True)
+    thread.start()
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+    stop.set()
+    thread.join()
+    updates = len(layer.ages)
+    # o que ficou enfileirado ainda seria entregue depois que os dados pararam
+    drain_start = time.perf_counter()
+    while time.perf_counter() - drain_start < 5.0:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        if len(layer.ages) == updates and time.perf_counter() - drain_start > 0.2:
+            break
+    backlog = len(layer.ages) - updates
+    ages = sorted(layer.ages[:updates])
+    return updates, backlog, sum(ages) / len(ages) * 1000, ages[int(len(ages) * 0.99)] * 1000
+
+
+def legacy(producer, layer):
+    # como os layers faziam: cada pacote vira um singleShot(0) na fila do event loop
+    producer.data_ready.connect(
+        lambda packet: QtCore.QTimer.singleShot(0, lambda: layer.update_ui(packet["car_lr"])),
+        QtCore.Qt.QueuedConnection,
+    )
+
+
+def paced(app):
+    def connect(producer, layer):
+        bus = TopicBus()
+        scheduler = FrameScheduler(bus, max_fps=60)
+        bus.subscribe(lambda packet: layer.update_ui(packet["car_lr"]), ("car_lr",))
+        producer.data_ready.connect(bus.publish, QtCore.Qt.QueuedConnection)
+        paced.scheduler = scheduler
+
+    return connect
+
+
+def main():
+    app = QtWidgets.QApplication([])
+    print(f"pacotes a {POLL_HZ} Hz, {UPDATE_MS:.0f} ms por atualização, {DURATION:.0f} s")
+    print(f"{'versão':>8} | {'atualizações':>12} | {'fila no fim':>11} | {'idade média':>11} | {'idade p99':>9}")
+    for label, connect in (("legado", legacy), ("frames", paced(app))):
+        updates, backlog, avg_age, p99_age = run(app, connect)
+        print(f"{label:>8} | {updates:>12} | {backlog:>11} | {avg_age:>8.1f} ms | {p99_age:>6.1f} ms")
+    print(f"FrameScheduler: {paced.scheduler.format_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Combustível: média refeita do zero a cada amostra vs. FuelEngine (incremental, uma vez por volta)
+
+Corrida por tempo sintética (SyntheticSim, só o player) com consumo variando volta a
+volta e um período de safety car (CAUTION_LAPS, consumo CAUTION_USE do normal) no meio.
+O engine é alimentado no ritmo do produto "fuel" (1 Hz). A verdade é o combustível que
+o carro ainda gastou de cada amostra até a volta em que o tempo acabou. Compara o
+combustível até o fim previsto com cada janela de consumo (3 voltas, 5 voltas, só
+bandeira verde) antes do safety car, nas WINDOW_AFTER voltas depois dele e no resto da
+corrida, e mede o custo por amostra contra refazer as médias do histórico inteiro.
+Antes confere FuelEngine.strategy em casos fixos (sem parada, uma parada, várias).
+
+Uso: python benchmarks/bench_fuel.py [minutos]
+"""
+import math
+import sys
+import timeit
+
+import numpy as np
+
+import synthetic
+from core.fuel_engine import CAUTION_FLAGS, FuelEngine
+
+TICK_RATE = 4
+FUEL_RATE = 1
+BASE_USE = 2.5
+CAUTION_LAPS = range(12, 15)
+CAUTION_USE = 0.4
+START_FUEL = 120.0
+WINDOW_AFTER = 5  # voltas depois do safety car em que as médias ainda o enxergam
+
+
+class RecomputeFuel:
+    """Referência: guarda toda amostra de (pct, combustível) e refaz as médias a cada chamada"""
+
+    def __init__(self):
+        self.samples = []
+
+    def update(self, session_time, pct, fuel, on_pit_road=False, flags=0):
+        self.samples.append((pct, fuel, bool(flags & CAUTION_FLAGS)))
+        pcts = np.array([s[0] for s in self.samples])
+        fuels = np.array([s[1] for s in self.samples])
+        caution = np.array([s[2] for s in self.samples])
+        lines = np.flatnonzero(np.diff(pcts) < -0.5) + 1
+        used = fuels[lines[:-1]] - fuels[lines[1:]]
+        green = np.array([not caution[a:b].any() for a, b in zip(lines[:-1], lines[1:])], dtype=bool)
+        return used[-3:].mean() if len(used) else math.nan, used[green][-5:].mean() if green.any() else math.nan
+
+
+# (combustível, capacidade, voltas até o fim, consumo) -> (até o fim, próxima parada, paradas, janela)
+STRATEGY_CASES = [
+    ((30.0, 50.0, 10.0, 2.0), (20.0, 0.0, 0, None, None)),  # sobra combustível
+    ((30.0, 50.0, 30.0, 2.0), (60.0, 30.0, 1, 5, 15)),  # uma parada, janela pelo tamanho do tanque
+    ((10.0, 50.0, 40.0, 2.0), (80.0, 50.0, 2, 0, 5)),  # nem um tanque cheio chega: a próxima enche
+    ((9.0, 50.0, 29.2, 2.0), (58.4, 49.0, 2, 0, 4)),  # cabe num tanque, mas não parando numa volta inteira
+    ((10.0, 0.0, 40.0, 2.0), (80.0, 70.0, None, 0, 5)),  # capacidade desconhecida
+]
+
+
+def check_strategy():
+    engine = FuelEngine()
+    for args, expected in STRATEGY_CASES:
+        result = engine.strategy(*args)
+        ok = all(
+            r == e if e is None or isinstance(e, int) else math.isclose(r, e)
+            for r, e in zip(result, expected)
+        )
+        assert ok, f"strategy{args} = {result}, esperado {expected}"
+    return len(STRATEGY_CASES)
+
+
+def run_race(minutes):
+    sim = synthetic.SyntheticSim(num_cars=1, seed=13, tick_rate=TICK_RATE)
+    rng = np.random.default_rng(13)
+    sim.fuel = START_FUEL
+    sim.fuel_per_lap = BASE_USE
+    engine = FuelEngine()
+    race_s = minutes * 60.0
+    samples = []  # (volta, combustível, previsões)
+    trace_fuel = []
+    lap = sim.lap[0]
+    ended_lap = None
+    while ended_lap is None or sim.lap[0] <= ended_lap:
+        sim.step()
+        if sim.lap[0] != lap:
+            lap = sim.lap[0]
+            use = BASE_USE * (1.0 + rng.normal(0.0, 0.03))
+            sim.fuel_per_lap = use * (CAUTION_USE if lap in CAUTION_LAPS else 1.0)
+        fuel = sim.fuel - sim.pct[0] * sim.fuel_per_lap
+        trace_fuel.append(fuel)
+        remain = max(0.0, race_s - sim.session_time)
+        if remain == 0 and ended_lap is None:
+            ended_lap = sim.lap[0]  # o tempo acabou: termina esta volta
+        if sim.session_tick % (TICK_RATE // FUEL_RATE) or ended_lap is not None:
+            continue
+        flags = 0x4000 if lap in CAUTION_LAPS else 0x4
+        engine.update(sim.session_time, float(sim.pct[0]), fuel, False, flags)
+        if engine.count < 5 or lap in CAUTION_LAPS:
+            continue
+        to_go = engine.laps_to_go(None, remain)
+        predictions = {
+            "3 voltas": to_go * engine.avg_short,
+            "5 voltas": to_go * engine.avg_long,
+            "bandeira verde": to_go * engine.avg_green,
+        }
+        samples.append((lap, fuel, predictions))
+    sim.close()
+
+    final_fuel = trace_fuel[-1]
+    errors = {}
+    for lap, fuel, predictions in samples:
+        true = fuel - final_fuel
+        # antes do safety car ninguém prevê a economia; logo depois as janelas curtas ainda o contêm
+        if lap < CAUTION_LAPS.start:
+            stage = 0
+        elif lap < CAUTION_LAPS.stop + WINDOW_AFTER:
+            stage = 1
+        else:
+            stage = 2
+        for name, predicted in predictions.items():
+            errors.setdefault(name, ([], [], []))
+            errors[name][stage].append(abs(predicted - true))
+    return errors
+
+
+def cost():
+    engine, recompute = FuelEngine(), RecomputeFuel()
+    rate = FUEL_RATE
+    samples = int(60 * 60 * rate)  # uma hora de amostras
+    t = np.arange(samples) / rate
+    pct = (t / 90.0) % 1.0
+    fuel = START_FUEL - t / 90.0 * BASE_USE
+    t, pct, fuel = t.tolist(), pct.tolist(), fuel.tolist()
+
+    def feed(version, count):
+        for i in range(count):
+            version.update(t[i], pct[i], fuel[i], False, 0x4)
+
+    # cada repetição continua de onde a anterior parou (SessionTime sempre andando)
+    number, repeat = 100, 5
+    start = samples - number * repeat
+    feed(engine, start)
+    feed(recompute, start)
+
+    def timed(version):
+        state = {"i": start}
+
+        def step():
+            i = state["i"]
+            state["i"] += 1
+            version.update(t[i], pct[i], fuel[i], False, 0x4)
+
+        return min(timeit.repeat(step, number=number, repeat=repeat)) / number * 1e6
+
+    return timed(recompute), timed(engine)
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    print(f"estratégia: {check_strategy()} casos ok")
+    errors = run_race(minutes)
+    print(f"corrida por tempo sintética: {minutes:.0f} min, safety car nas voltas {CAUTION_LAPS.start}-{CAUTION_LAPS.stop - 1}")
+    print("erro p95 do combustível até o fim (L)")
+    print(f"{'janela':>14} | {'antes do SC':>11} | {f'{WINDOW_AFTER} voltas pós-SC':>16} | {'resto':>6}")
+    for name, stages in errors.items():
+        p95 = [f"{np.percentile(err, 95):.2f}" if err else "--" for err in stages]
+        print(f"{name:>14} | {p95[0]:>11} | {p95[1]:>16} | {p95[2]:>6}")
+
+    recompute_us, engine_us = cost()
+    print()
+    print(f"custo por amostra após 1 h: refazendo tudo {recompute_us:.0f} us, engine {engine_us:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
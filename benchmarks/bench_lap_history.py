@@ -0,0 +1,127 @@
+"""Histórico de voltas: listas por carro (crescem a corrida toda) vs. LapHistory (ring buffers fixos)
+
+Corrida sintética (SyntheticSim) de 60 carros amostrada no ritmo do standings (4 Hz),
+com CarIdxLastLapTime chegando alguns ticks depois do CarIdxLapCompleted, como no
+iRacing, e uma parada no box a cada PIT_EVERY voltas. As listas guardam toda volta
+(é também a verdade para conferir melhor volta, média de PACE_LAPS voltas e ritmo do stint).
+Mostra a memória das duas versões ao longo da corrida e o custo das consultas no fim.
+
+Uso: python benchmarks/bench_lap_history.py [horas]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import synthetic
+from core.lap_history import PACE_LAPS, LapHistory
+
+NUM_CARS = 60
+TICK_RATE = 4
+LAST_LAP_DELAY = 2  # ticks até o CarIdxLastLapTime ser atualizado
+PIT_EVERY = 25  # voltas entre paradas
+FLOAT_BYTES = sys.getsizeof(1.0)
+SAMPLES_H = (1, 6, 12, 24)
+
+
+class ListHistory:
+    """Referência: uma lista por carro com (tempo, box) de todas as voltas"""
+
+    def __init__(self, num_cars):
+        self.laps = [[] for _ in range(num_cars)]
+
+    def add(self, car, time, pit):
+        self.laps[car].append((time, pit))
+
+    def best(self):
+        return [min((t for t, pit in laps if not pit), default=np.nan) for laps in self.laps]
+
+    def average(self, n):
+        out = []
+        for laps in self.laps:
+            clean = [t for t, pit in laps[-n:] if not pit]
+            out.append(sum(clean) / len(clean) if clean else np.nan)
+        return out
+
+    def stint_pace(self):
+        out = []
+        for laps in self.laps:
+            stint = []
+            for t, pit in reversed(laps):
+                if pit:
+                    break
+                stint.append(t)
+            out.append(sum(stint) / len(stint) if stint else np.nan)
+        return out
+
+    def nbytes(self):
+        # lista + tupla + float por volta (o bool é compartilhado)
+        total = 0
+        for laps in self.laps:
+            total += sys.getsizeof(laps) + len(laps) * (sys.getsizeof((0.0, False)) + FLOAT_BYTES)
+        return total
+
+
+def store_bytes(history):
+    arrays = (history.times, history.lap, history.pit, history.incidents)
+    return sum(a.nbytes for a in arrays)
+
+
+def main():
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 24.0
+    sim = synthetic.SyntheticSim(num_cars=NUM_CARS, seed=7, tick_rate=TICK_RATE)
+    history, lists = LapHistory(), ListHistory(NUM_CARS)
+    delayed = [sim.last.copy() for _ in range(LAST_LAP_DELAY)]
+    pit_lap = np.full(NUM_CARS, 0)
+
+    steps = int(hours * 3600 * TICK_RATE)
+    samples = {int(h * 3600 * TICK_RATE): h for h in SAMPLES_H if h <= hours}
+    print(f"corrida sintética: {NUM_CARS} carros, {hours:.0f} h, CarIdxLastLapTime {LAST_LAP_DELAY} ticks atrasado")
+    print(f"{'hora':>4} | {'voltas':>7} | {'listas (KB)':>11} | {'LapHistory (KB)':>15}")
+    for step in range(1, steps + 1):
+        prev_lap = sim.lap.copy()
+        sim.step()
+        done = np.flatnonzero(sim.lap != prev_lap)
+        for car in done:
+            pit = bool(sim.on_pit_road[car])
+            lists.add(car, float(sim.last[car]), pit)
+        # box: a volta inteira marcada como de box (entrada e saída)
+        sim.on_pit_road[:] = (sim.lap - pit_lap) % PIT_EVERY == 0
+        delayed.append(sim.last.copy())
+        history.update(sim.session_time, sim.lap - 1, delayed.pop(0), sim.on_pit_road, sim.incidents)
+        if step in samples:
+            laps = sum(len(laps) for laps in lists.laps)
+            print(f"{samples[step]:>4.0f} | {laps:>7} | {lists.nbytes() / 1024:>11.0f} | {store_bytes(history) / 1024:>15.0f}")
+    # as últimas voltas ainda esperam o tempo atrasado
+    for _ in range(LAST_LAP_DELAY):
+        sim.step(0.0)
+        delayed.append(sim.last.copy())
+        history.update(sim.session_time, sim.lap - 1, delayed.pop(0), sim.on_pit_road, sim.incidents)
+    sim.close()
+
+    cars = slice(0, NUM_CARS)
+    checks = {
+        "melhor volta": (history.best[cars], lists.best()),
+        f"média {PACE_LAPS} voltas": (history.average(PACE_LAPS)[cars], lists.average(PACE_LAPS)),
+        "ritmo do stint": (history.stint_pace()[cars], lists.stint_pace()),
+    }
+    number = 200
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+    queries = {
+        "melhor volta": (lambda: history.best[cars], lists.best),
+        f"média {PACE_LAPS} voltas": (lambda: history.average(PACE_LAPS), lambda: lists.average(PACE_LAPS)),
+        "ritmo do stint": (history.stint_pace, lists.stint_pace),
+    }
+    print()
+    print(f"{'consulta':>15} | {'igual':>5} | {'listas (us)':>11} | {'LapHistory (us)':>15}")
+    for name, (engine_fn, list_fn) in queries.items():
+        ours, ref = checks[name]
+        same = np.allclose(ours, np.array(ref), equal_nan=True, atol=1e-6)
+        print(f"{name:>15} | {'sim' if same else 'NÃO':>5} | {best(list_fn):>11.1f} | {best(engine_fn):>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Repaints por layer: redraw por timer / tabela recriada (legado) vs. dirty tracking
+
+CarLRLayer recebe CarLeftRight a 60 Hz e FuelLayer recebe FuelSnapshot a 10 Hz durante
+DURATION segundos (tempo real, plataforma offscreen). Mede frames pintados, tempo gasto
+em paint e área repintada em relação ao tamanho do widget.
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_layer_repaint.py
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import synthetic  # noqa: F401 (coloca src/ no sys.path)
+from PySide6 import QtCore, QtGui, QtWidgets
+from core.snapshots import CarLRSnapshot, FuelSnapshot
+from layers.car_lr_layer import CarLRLayer
+from layers.fuel_layer import FuelLayer
+
+DURATION = 3.0
+
+
+class FakeApp:
+    locked = False
+
+
+class LegacyCarLRLayer(CarLRLayer):
+    """CarLRLayer antes do dirty tracking: timer de 50 ms e dois gradientes por frame"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.update)
+        self.timer.start(50)
+
+    def update_from_iracing(self, data):
+        val = data["car_lr"].val
+        self.left_active = val in (2, 4)
+        self.right_active = val in (3, 4)
+        self.update()
+
+    def paint_layer(self, painter, rect):
+        painter.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+        self._draw_box(painter, self._box_rect(True), self.left_active, "#fffb00", "#fbff00")
+        self._draw_box(painter, self._box_rect(False), self.right_active, "#fffb00", "#fbff00")
+
+
+class LegacyFuelLayer(FuelLayer):
+    """FuelLayer antes do dirty tracking: itens de valor recriados a cada snapshot"""
+
+    def _update_ui(self, fuel):
+        values = [f"{fuel.level:.1f} L", f"{fuel.capacity:.1f} L", f"{fuel.use_per_lap:.2f} L", str(fuel.laps)]
+        for i, val in enumerate(values):
+            item = QtWidgets.QTableWidgetItem(val)
+            item.setTextAlignment(QtCore.Qt.AlignCenter)
+            bg_color = QtGui.QColor(0, 0, 0, self.alpha) if i % 2 == 0 else QtGui.QColor(30, 30, 30, self.alpha)
+            item.setBackground(QtGui.QBrush(bg_color))
+            item.setForeground(QtGui.QBrush(QtGui.QColor("white")))
+            self.table.setItem(i, 1, item)
+
+
+class PaintMeter(QtCore.QObject):
+    """Soma área e tempo dos paint events de um widget"""
+
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+        self.area = 0
+        self.seconds = 0.0
+        self._start = None
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            for rect in event.region():
+                self.area += rect.width() * rect.height()
+            self._start = time.perf_counter()
+        return False
+
+    def stop_timing(self):
+        # chamado após o processEvents: o paint termina antes de voltar ao loop
+        if self._start is not None:
+            self.seconds += time.perf_counter() - self._start
+            self._start = None
+
+
+def car_lr_values(hz):
+    """CarLeftRight: pista livre a maior parte do tempo, carros ao lado de vez em quando"""
+    rng = random.Random(1)
+    values = []
+    while len(values) < DURATION * hz:
+        values += [1] * rng.randint(hz // 2, hz * 2)
+        values += [rng.choice((2, 3, 4))] * rng.randint(hz // 4, hz)
+    return values[: int(DURATION * hz)]
+
+
+def fuel_values(hz):
+    level = 60.0
+    values = []
+    for i in range(int(DURATION * hz)):
+        level -= 0.013
+        values.append(FuelSnapshot(level, 100.0, 2.61, int(level / 2.61)))
+    return values
+
+
+def run(app, layer, meter, packets, hz, deliver):
+    layer.set_power_mode("active")
+    layer.show()
+    app.processEvents()
+    layer.frames_painted = 0
+    meter.area = 0
+    meter.seconds = 0.0
+
+    start = time.perf_counter()
+    for i, packet in enumerate(packets):
+        deliver(packet)
+        while time.perf_counter() - start < (i + 1) / hz:
+            app.processEvents(QtCore.QEventLoop.AllEvents, 1)
+            meter.stop_timing()
+    frames = layer.frames_painted
+    size = meter.widget.width() * meter.widget.height()
+    layer.set_power_mode("disconnected")
+    layer.hide()
+    return frames, meter.seconds * 1e3, meter.area / max(frames, 1) / size * 100
+
+
+def main():
+    app = QtWidgets.QApplication([])
+    fake = FakeApp()
+    print(f"{'layer':>6} | {'versão':>6} | {'frames':>6} | {'paint (ms)':>10} | {'área/frame':>10}")
+
+    car_lr = car_lr_values(60)
+    for label, cls in (("legado", LegacyCarLRLayer), ("dirty", CarLRLayer)):
+        layer = cls(fake)
+        layer.resize(300, 120)
+        meter = PaintMeter(layer)
+        result = run(app, layer, meter, car_lr, 60, lambda v: layer.update_from_iracing({"car_lr": CarLRSnapshot(v)}))
+        print(f"{'car_lr':>6} | {label:>6} | {result[0]:>6} | {result[1]:>10.1f} | {result[2]:>9.1f}%")
+        layer.deleteLater()
+
+    fuel = fuel_values(10)
+    for label, cls in (("legado", LegacyFuelLayer), ("dirty", FuelLayer)):
+        layer = cls(fake)
+        layer.resize(260, 160)
+        meter = PaintMeter(layer.table.viewport())
+        result = run(app, layer, meter, fuel, 10, layer._update_ui)
+        print(f"{'fuel':>6} | {label:>6} | {result[0]:>6} | {result[1]:>10.1f} | {result[2]:>9.1f}%")
+        layer.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Tempos de setor: laço por carro com o instante da amostra vs. SectorEngine (vetorizado, interpolado)
+
+Corrida sintética (SyntheticSim) com velocidade variando ao longo da volta e os
+setores do SplitTimeInfo do YAML sintético. A verdade vem do histórico de distância
+de cada carro, simulado a 240 Hz: instante em que passou por cada fronteira. Compara o tempo de
+cada setor fechado por:
+- laço: um carro por vez, setor fechado no SessionTime da amostra em que cruzou;
+- engine 60 Hz: SectorEngine a cada tick (produto "sectors");
+- engine 4 Hz: SectorEngine só no intervalo antigo do standings.
+Depois mede o custo por tick para 20/40/64 carros.
+
+Uso: python benchmarks/bench_sectors.py [minutos]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import synthetic
+from core.sector_engine import SectorEngine
+
+NUM_CARS = 40
+TICK_RATE = 60
+SIM_RATE = 240  # a verdade é mais fina que o que os engines recebem
+EVERY = {"laço 60 Hz": SIM_RATE // TICK_RATE, "engine 60 Hz": SIM_RATE // TICK_RATE, "engine 4 Hz": SIM_RATE // 4}
+SECTORS = (0.0, 0.3308, 0.6612)  # o mesmo SplitTimeInfo do YAML sintético
+
+
+def corners(pct):
+    """Retas e curvas: a velocidade varia de 0,45x a 1,55x ao longo da volta"""
+    return 1.0 + 0.55 * np.sin(2 * np.pi * 5 * pct)
+
+
+class LoopSectors:
+    """Referência: detecção carro a carro, setor fechado no instante da amostra"""
+
+    def __init__(self, boundaries, max_cars=synthetic.MAX_CARS):
+        self.starts = list(boundaries)
+        self.current = [-1] * max_cars
+        self.current_start = [0.0] * max_cars
+        self.last = np.full((max_cars, len(boundaries)), np.nan)
+        self.prev = [None] * max_cars
+
+    def update(self, session_time, laps, lap_dist_pct):
+        for car in range(len(self.prev)):
+            if laps[car] < 0 or lap_dist_pct[car] < 0:
+                self.prev[car] = None
+                continue
+            dist = laps[car] + lap_dist_pct[car]
+            prev = self.prev[car]
+            self.prev[car] = dist
+            if prev is None or not 0 < dist - prev <= 0.5:
+                continue
+            for boundary, start in enumerate(self.starts):
+                if np.floor(dist - start) > np.floor(prev - start):
+                    ended = (boundary - 1) % len(self.starts)
+                    if self.current[car] == ended:
+                        self.last[car, ended] = session_time - self.current_start[car]
+                    self.current[car] = boundary
+                    self.current_start[car] = session_time
+
+
+def inputs(sim):
+    laps = np.full(synthetic.MAX_CARS, -1, dtype=np.int64)
+    pct = np.full(synthetic.MAX_CARS, -1.0)
+    laps[: sim.num_cars] = sim.lap
+    pct[: sim.num_cars] = sim.pct
+    return laps, pct
+
+
+def closed(before, after):
+    """(carro, setor) cujo último tempo mudou nesta amostra
+
+    O laço fecha setores em múltiplos de 1/60 s: um setor com o mesmo tempo do anterior não conta.
+    """
+    changed = (after != before) & ~np.isnan(after)
+    return [(int(c), int(s)) for c, s in np.argwhere(changed)]
+
+
+def run_race(minutes):
+    sim = synthetic.SyntheticSim(num_cars=NUM_CARS, seed=5, tick_rate=SIM_RATE)
+    sim.speed_profile = corners
+    versions = {"laço 60 Hz": LoopSectors(SECTORS), "engine 60 Hz": SectorEngine(SECTORS), "engine 4 Hz": SectorEngine(SECTORS)}
+    starts = np.array(SECTORS)
+
+    steps = int(minutes * 60 * SIM_RATE)
+    times = np.empty(steps)
+    dists = np.empty((NUM_CARS, steps))
+    events = {name: [] for name in versions}  # (carro, setor, tempo medido, distância ao fechar)
+    for step in range(steps):
+        sim.step()
+        times[step] = sim.session_time
+        dists[:, step] = (sim.lap - 1) + sim.pct
+        laps, pct = inputs(sim)
+        for name, version in versions.items():
+            if step % EVERY[name]:
+                continue
+            before = version.last.copy()
+            version.update(sim.session_time, laps, pct)
+            for car, sector in closed(before, version.last):
+                events[name].append((car, sector, version.last[car, sector], dists[car, step]))
+    sim.close()
+
+    errors = {}
+    for name, closed_sectors in events.items():
+        errors[name] = []
+        for car, sector, measured, dist in closed_sectors:
+            # posição absoluta do fim e do início do setor fechado
+            end = starts[(sector + 1) % len(starts)]
+            x_end = np.floor(dist - end) + end
+            x_start = x_end - (end - starts[sector]) % 1.0
+            true = np.interp(x_end, dists[car], times) - np.interp(x_start, dists[car], times)
+            errors[name].append(abs(measured - true))
+    return errors
+
+
+def cost(num_cars):
+    sim = synthetic.SyntheticSim(num_cars=num_cars, seed=1, tick_rate=TICK_RATE)
+    loop, engine = LoopSectors(SECTORS), SectorEngine(SECTORS)
+    for _ in range(TICK_RATE * 5):
+        sim.step()
+        laps, pct = inputs(sim)
+        loop.update(sim.session_time, laps, pct)
+        engine.update(sim.session_time, laps, pct)
+    sim.close()
+    state = {"t": sim.session_time}
+
+    def tick(version):
+        state["t"] += 1.0 / TICK_RATE
+        pct[:num_cars] += 1.0 / 90.0 / TICK_RATE
+        wrapped = pct[:num_cars] >= 1.0
+        pct[:num_cars][wrapped] -= 1.0
+        laps[:num_cars][wrapped] += 1
+        version.update(state["t"], laps, pct)
+
+    number = 2000
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+    return best(lambda: tick(loop)), best(lambda: tick(engine))
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    errors = run_race(minutes)
+    print(f"corrida sintética: {NUM_CARS} carros, {minutes:.0f} min, setores {SECTORS}")
+    print(f"{'versão':>12} | {'setores':>7} | {'erro p50 (ms)':>13} | {'erro p95 (ms)':>13} | {'erro máx (ms)':>13}")
+    for name, err in errors.items():
+        err = np.array(err) * 1000
+        print(f"{name:>12} | {len(err):>7} | {np.percentile(err, 50):>13.3f} | {np.percentile(err, 95):>13.3f} | {err.max():>13.3f}")
+
+    print()
+    print(f"{'carros':>6} | {'laço (us)':>9} | {'engine (us)':>11}")
+    for num_cars in (20, 40, 64):
+        loop_us, engine_us = cost(num_cars)
+        print(f"{num_cars:>6} | {loop_us:>9.1f} | {engine_us:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
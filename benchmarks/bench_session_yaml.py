@@ -0,0 +1,43 @@
+"""Benchmark: parse completo do YAML da sessão (como o pyirsdk) vs. extração seletiva
+
+Uso: python benchmarks/bench_session_yaml.py
+"""
+import timeit
+
+import yaml
+from irsdk import CustomYamlSafeLoader
+
+import synthetic
+from core.session_cache import SessionStatic
+from core.session_parser import parse_session_yaml
+
+
+def full_parse(raw):
+    data = yaml.load(raw.decode("cp1252"), Loader=CustomYamlSafeLoader)
+    return {key: data.get(key) for key in ("DriverInfo", "SessionInfo", "WeekendInfo", "SplitTimeInfo")}
+
+
+def build(sections):
+    return SessionStatic.from_sections(1, sections["DriverInfo"], sections["SessionInfo"], sections["WeekendInfo"], sections["SplitTimeInfo"])
+
+
+def main():
+    print(f"{'carros':>6} | {'YAML (KB)':>9} | {'completo (ms)':>13} | {'seletivo (ms)':>13}")
+    for num_cars in (20, 40, 64):
+        drivers = synthetic.make_drivers(num_cars)
+        raw = synthetic.make_session_yaml(drivers)
+
+        full, selective = build(full_parse(raw)), build(parse_session_yaml(raw))
+        assert full.drivers.rows == selective.drivers.rows
+        assert (full.sof, full.class_sof, full.session_length, full.track_temp, full.sectors) == (
+            selective.sof, selective.class_sof, selective.session_length, selective.track_temp, selective.sectors
+        )
+
+        number = 5
+        t_full = min(timeit.repeat(lambda: full_parse(raw), number=number, repeat=3)) / number
+        t_sel = min(timeit.repeat(lambda: parse_session_yaml(raw), number=number, repeat=3)) / number
+        print(f"{num_cars:>6} | {len(raw) / 1024:>9.0f} | {t_full * 1e3:>13.1f} | {t_sel * 1e3:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
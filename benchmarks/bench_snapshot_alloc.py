@@ -0,0 +1,137 @@
+"""Alocações por tick: dicts por piloto + deepcopy (legado) vs. snapshots imutáveis
+
+Mede, com tracemalloc, quantos blocos/bytes cada tick deixa vivos (o que é publicado
+para os layers) e o pico de memória temporária, num grid de 64 carros.
+
+Uso: python benchmarks/bench_snapshot_alloc.py
+"""
+import copy
+import time
+import tracemalloc
+
+import synthetic
+from core.iracing_client import IRacingClient
+from core.standings_engine import GAP_LAPPED, GAP_LEADER, GAP_TIME, format_lap_time, window_bounds
+from core.snapshots import STATIC_FIELDS
+
+TICKS = 200
+
+
+def legacy_standings(frame):
+    """format_window como era antes: um dict de 16 chaves por piloto"""
+    start, end = window_bounds(len(frame.order), None, 0)
+    sel = frame.order[start:end]
+    columns = zip(
+        sel.tolist(),
+        frame.table.car_idx[sel].tolist(),
+        frame.pos[sel].tolist(),
+        frame.pos_gain[sel].tolist(),
+        frame.gap_kind[sel].tolist(),
+        frame.lap_diff[sel].tolist(),
+        frame.gap[sel].tolist(),
+        frame.last_lap[sel].tolist(),
+        frame.incidents[sel].tolist(),
+    )
+    data = []
+    for i, car_idx, pos, pos_gain, kind, lap_diff, gap, last_lap, incidents in columns:
+        if kind == GAP_LEADER:
+            gap = "Líder"
+        elif kind == GAP_LAPPED:
+            gap = f"+{lap_diff} volta{'s' if lap_diff > 1 else ''}"
+        elif kind == GAP_TIME:
+            gap = f"+{gap:.1f}s"
+        else:
+            gap = "---"
+        row = {
+            "id": car_idx,
+            "pos": pos,
+            "pos_gain": pos_gain,
+            "ir_delta": "",
+            "last_lap": format_lap_time(last_lap),
+            "gap": gap,
+            "incidents": incidents,
+        }
+        row.update(zip(STATIC_FIELDS, frame.table.rows[i]))
+        data.append(row)
+    return data
+
+
+def compute_frame(client):
+    ir = client.telemetry
+    return client._standings_engine.compute(
+        client._session_cache.static.drivers,
+        positions=ir["CarIdxPosition"],
+        qual_pos=ir["CarIdxQualPosition"],
+        last_laps=ir["CarIdxLastLapTime"],
+        incidents=ir["CarIdxIncidentCount"],
+        lap_dist_pct=ir["CarIdxLapDistPct"],
+        session_time=ir["SessionTime"],
+    )
+
+
+def legacy_tick(client):
+    packet = {
+        "standings": legacy_standings(compute_frame(client)),
+        "session": client._get_session_info()._asdict(),
+        "fuel": client._get_fuel()._asdict(),
+        "car_lr": client._get_car_lr()._asdict(),
+    }
+    # StandingsLayer.update_from_iracing copiava tudo antes de agendar o redraw
+    return packet, copy.deepcopy({"standings": packet["standings"], "session": packet["session"]})
+
+
+def snapshot_tick(client):
+    packet = {
+        "standings": client._get_standings(),
+        "session": client._get_session_info(),
+        "fuel": client._get_fuel(),
+        "car_lr": client._get_car_lr(),
+    }
+    return packet, dict(packet)
+
+
+def measure(tick, client):
+    tick(client)  # aquece caches (DriverTable, imports)
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    kept = [None] * TICKS
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    peak = 0
+    for i in range(TICKS):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        kept[i] = tick(client)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+    after = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in diff)
+    size = sum(stat.size_diff for stat in diff)
+    return blocks / TICKS, size / TICKS, peak
+
+
+def main():
+    sim = synthetic.SyntheticSim(64)
+    sim.step()
+    client = IRacingClient(test_file=sim.path)
+    client._try_connect()
+    client._has_new_data()
+    # espera o parse do YAML em background
+    while not len(client._session_cache.get(client.telemetry).drivers):
+        time.sleep(0.01)
+
+    print(f"64 carros, {TICKS} ticks (standings completo + sessão + fuel + car L/R)")
+    print(f"{'':>22} | {'blocos/tick':>11} | {'bytes/tick':>10} | {'pico temp. (bytes)':>18}")
+    for label, tick in (("dicts + deepcopy", legacy_tick), ("snapshots imutáveis", snapshot_tick)):
+        blocks, size, peak = measure(tick, client)
+        print(f"{label:>22} | {blocks:>11.0f} | {size:>10.0f} | {peak:>18}")
+
+    client.stop()
+    client.ir.shutdown()
+    sim.close()
+
+
+if __name__ == "__main__":
+    main()
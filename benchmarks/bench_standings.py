@@ -0,0 +1,221 @@
+"""Micro-benchmark: standings em loop Python (legado) vs. StandingsEngine vetorizado
+
+"legado" e "engine, estimativa" recebem as listas do FakeIR (pyirsdk) e passam pela
+estimativa de gap pela última volta; as saídas das duas são comparadas. As colunas
+"cliente" fazem o caminho do IRacingClient: corrida sintética (SyntheticSim) lida pelo
+TelemetryReader, o produto "timing" a cada tick (60 Hz) e, a cada STANDINGS_EVERY
+ticks, o StandingsEngine com CarIdxLap, EstTime, F2Time, LapCompleted e OnPitRoad
+(TimingEngine e LapHistory). "timing" é o custo de um tick do produto de 60 Hz.
+
+Uso: python benchmarks/bench_standings.py
+"""
+import time
+import timeit
+
+import numpy as np
+
+import synthetic  # noqa: F401  (ajusta sys.path)
+from core.standings_engine import DriverTable, StandingsEngine, argb_to_hex, format_lap_time
+from core.telemetry_reader import TelemetryReader
+
+TICK_RATE = 60
+STANDINGS_EVERY = 15  # 4 Hz
+WARMUP_S = 120.0  # mais que uma volta: passagens gravadas e voltas completadas para todos
+
+
+def legacy_standings(ir, starting_positions):
+    """Cópia do IRacingClient._get_standings original (loop por piloto)"""
+    data = []
+    drivers = ir["DriverInfo"]["Drivers"] or []
+    positions = ir["CarIdxPosition"] or []
+    qual_pos = ir["CarIdxQualPosition"] or []
+    last_laps = ir["CarIdxLastLapTime"] or []
+    incidents = ir["CarIdxIncidentCount"] or []
+    lap_dist_pct = ir["CarIdxLapDistPct"] or []
+    session_time = ir["SessionTime"] or 0.0
+
+    leader_idx = None
+    if positions:
+        try:
+            leader_idx = positions.index(1)
+        except ValueError:
+            leader_idx = None
+
+    for drv in drivers:
+        name = drv.get("UserName")
+        car_idx = drv.get("CarIdx")
+        if name is None or car_idx is None:
+            continue
+
+        pos = positions[car_idx] if car_idx < len(positions) else 0
+        if pos <= 0:
+            pos = car_idx + 1
+
+        if "StartingGridPosition" in drv and drv["StartingGridPosition"] > 0:
+            grid = drv["StartingGridPosition"]
+        elif car_idx < len(qual_pos) and qual_pos[car_idx] > 0:
+            grid = qual_pos[car_idx]
+        elif "QualPosition" in drv and drv["QualPosition"] > 0:
+            grid = drv["QualPosition"]
+        elif car_idx in starting_positions:
+            grid = starting_positions[car_idx]
+        else:
+            starting_positions[car_idx] = pos
+            grid = pos
+
+        pos_gain = grid - pos if grid and grid > 0 and pos > 0 else 0
+
+        gap = "---"
+        if leader_idx is not None and car_idx < len(lap_dist_pct) and leader_idx < len(lap_dist_pct):
+            leader_pct = lap_dist_pct[leader_idx]
+            my_pct = lap_dist_pct[car_idx]
+            leader_pos = positions[leader_idx] if leader_idx < len(positions) else 0
+            my_pos = positions[car_idx] if car_idx < len(positions) else 0
+            lap_diff = leader_pos - my_pos
+            if pos == 1:
+                gap = "Líder"
+            elif lap_diff > 0:
+                gap = f"+{lap_diff} volta{'s' if lap_diff > 1 else ''}"
+            else:
+                leader_time = session_time - (1 - leader_pct) * (last_laps[leader_idx] or 0)
+                my_time = session_time - (1 - my_pct) * (last_laps[car_idx] or 0)
+                if leader_time and my_time:
+                    gap = f"+{my_time - leader_time:.1f}s"
+
+        last_val = last_laps[car_idx] if car_idx < len(last_laps) else -1
+        car_logo = f"assets/cars/{drv['CarPath']}.png" if "CarPath" in drv else None
+
+        data.append(
+            {
+                "id": car_idx,
+                "pos": pos,
+                "pos_gain": pos_gain,
+                "driver": name,
+                "car_number": drv.get("CarNumberRaw", "--"),
+                "car_logo": car_logo,
+                "license": drv.get("LicString", "--"),
+                "license_color": argb_to_hex(drv.get("LicColor")),
+                "class_id": drv.get("CarClassID"),
+                "class_color": argb_to_hex(drv.get("CarClassColor")),
+                "irating": drv.get("IRating", 0),
+                "ir_delta": "",
+                "last_lap": format_lap_time(last_val),
+                "gap": gap,
+                "incidents": incidents[car_idx] if car_idx < len(incidents) else 0,
+                "country": drv.get("Country") or drv.get("ClubName", "") or "",
+            }
+        )
+
+    data.sort(key=lambda d: d["pos"])
+    return data
+
+
+def engine_standings(ir, engine, max_rows, table=None):
+    # como no IRacingClient, a tabela estática só é refeita quando o DriverInfo muda
+    table = table or DriverTable.from_drivers(ir["DriverInfo"]["Drivers"])
+    frame = engine.compute(
+        table,
+        positions=ir["CarIdxPosition"],
+        qual_pos=ir["CarIdxQualPosition"],
+        last_laps=ir["CarIdxLastLapTime"],
+        incidents=ir["CarIdxIncidentCount"],
+        lap_dist_pct=ir["CarIdxLapDistPct"],
+        session_time=ir["SessionTime"],
+    )
+    return frame.format_window(ir["PlayerCarIdx"], max_rows)
+
+
+def client_standings(ir, engine, table, max_rows):
+    """Cópia do IRacingClient._get_standings (com as views do TelemetryReader)"""
+    frame = engine.compute(
+        table,
+        positions=ir["CarIdxPosition"],
+        qual_pos=ir["CarIdxQualPosition"],
+        last_laps=ir["CarIdxLastLapTime"],
+        incidents=ir["CarIdxIncidentCount"],
+        lap_dist_pct=ir["CarIdxLapDistPct"],
+        session_time=ir["SessionTime"] or 0.0,
+        laps=ir["CarIdxLap"],
+        est_time=ir["CarIdxEstTime"],
+        f2_time=ir["CarIdxF2Time"],
+        laps_completed=ir["CarIdxLapCompleted"],
+        on_pit_road=ir["CarIdxOnPitRoad"],
+    )
+    return frame.format_window(ir["PlayerCarIdx"], max_rows)
+
+
+def update_timing(ir, engine):
+    """Cópia do IRacingClient._update_timing (produto "timing")"""
+    engine.timing.update(ir["SessionTime"] or 0.0, ir["CarIdxLap"], ir["CarIdxLapDistPct"])
+
+
+def client_cost(num_cars, repeat=5, calls=200):
+    """(tabela inteira, 11 linhas, timing) em us, cada um o melhor de `repeat` médias"""
+    sim = synthetic.SyntheticSim(num_cars=num_cars, seed=1, tick_rate=TICK_RATE)
+    ir = TelemetryReader(sim.mem)
+    table = DriverTable.from_drivers(sim.drivers)
+    engine = StandingsEngine()
+    ticks = 0
+    while sim.session_time < WARMUP_S:
+        sim.step()
+        ir.freeze()
+        update_timing(ir, engine)
+        ticks += 1
+        if ticks % STANDINGS_EVERY == 0:
+            client_standings(ir, engine, table, 0)
+
+    results = {"tabela": [], "11 linhas": [], "timing": []}
+    for _ in range(repeat):
+        spent = dict.fromkeys(results, 0.0)
+        for i in range(calls * STANDINGS_EVERY):
+            sim.step()
+            ir.freeze()
+            start = time.perf_counter()
+            update_timing(ir, engine)
+            spent["timing"] += time.perf_counter() - start
+            if i % STANDINGS_EVERY:
+                continue
+            # o mesmo tick nas duas: a segunda já não grava passagens de novo
+            for name, max_rows in (("tabela", 0), ("11 linhas", 11)):
+                start = time.perf_counter()
+                client_standings(ir, engine, table, max_rows)
+                spent[name] += time.perf_counter() - start
+        results["tabela"].append(spent["tabela"] / calls)
+        results["11 linhas"].append(spent["11 linhas"] / calls)
+        results["timing"].append(spent["timing"] / (calls * STANDINGS_EVERY))
+    sim.close()
+    return tuple(min(values) * 1e6 for values in results.values())
+
+
+def main():
+    print(
+        f"{'carros':>6} | {'legado (us)':>11} | {'engine, estimativa (us)':>23} | {'cliente (us)':>12} | "
+        f"{'cliente 11 linhas (us)':>22} | {'timing (us)':>11}"
+    )
+    for num_cars in (20, 40, 64):
+        ir = synthetic.FakeIR(num_cars)
+
+        # as duas implementações precisam produzir exatamente a mesma saída
+        legacy_rows = legacy_standings(ir, {})
+        engine_rows = [row._asdict() for row in engine_standings(ir, StandingsEngine(), 0)]
+        # o engine tem campos a mais (intervalo, melhor volta, ritmo); compara os do legado
+        assert legacy_rows == [{k: row[k] for k in legacy_rows[0]} for row in engine_rows]
+
+        number = 500
+
+        def best(fn):
+            return min(timeit.repeat(fn, number=number, repeat=5))
+
+        legacy = best(lambda: legacy_standings(ir, {}))
+        engine = StandingsEngine()
+        table = DriverTable.from_drivers(ir["DriverInfo"]["Drivers"])
+        estimate = best(lambda: engine_standings(ir, engine, 0, table))
+        full, window, timing = client_cost(num_cars)
+        print(
+            f"{num_cars:>6} | {legacy / number * 1e6:>11.1f} | {estimate / number * 1e6:>23.1f} | {full:>12.1f} | "
+            f"{window:>22.1f} | {timing:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Standings: QTableWidget recriado a cada tick (legado) vs. StandingsModel incremental
+
+Reproduz uma corrida sintética a 4 Hz e mede, por tick, o custo da atualização da
+tabela, o custo do repaint e a área repintada do viewport (plataforma offscreen).
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_standings_view.py
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import synthetic
+from PySide6 import QtCore, QtGui, QtWidgets
+from core.iracing_client import IRacingClient
+from ui.standings_model import COLUMNS, COUNTRY_FLAGS, StandingsModel
+
+TICKS = 120
+ROW_HEIGHT = 22
+
+
+def legacy_update(table, standings, my_driver_id, alpha=220):
+    """Miolo do StandingsLayer._update_ui antes do model: recria todos os itens"""
+    table.setRowCount(len(standings))
+    for i, d in enumerate(standings):
+        pos = QtWidgets.QTableWidgetItem(str(d.pos))
+        delta_val = d.pos_gain
+        if delta_val > 0:
+            delta = QtWidgets.QTableWidgetItem(f"+{delta_val}")
+            delta.setForeground(QtGui.QBrush(QtGui.QColor("lime")))
+        elif delta_val < 0:
+            delta = QtWidgets.QTableWidgetItem(str(delta_val))
+            delta.setForeground(QtGui.QBrush(QtGui.QColor("red")))
+        else:
+            delta = QtWidgets.QTableWidgetItem("0")
+            delta.setForeground(QtGui.QBrush(QtGui.QColor("lightgray")))
+        car_num = QtWidgets.QTableWidgetItem(str(d.car_number))
+        logo_item = QtWidgets.QTableWidgetItem()
+        if d.car_logo:
+            logo_item.setIcon(QtGui.QIcon(d.car_logo))
+        drv = QtWidgets.QTableWidgetItem(d.driver)
+        flag_item = QtWidgets.QTableWidgetItem(COUNTRY_FLAGS.get((d.country or "").title(), "🏳️"))
+        flag_item.setTextAlignment(QtCore.Qt.AlignCenter)
+        lic = QtWidgets.QTableWidgetItem(d.license)
+        lic.setBackground(QtGui.QBrush(QtGui.QColor(d.license_color)))
+        ir = QtWidgets.QTableWidgetItem(f"{d.irating} {d.ir_delta}")
+        lap = QtWidgets.QTableWidgetItem(d.last_lap)
+        gap = QtWidgets.QTableWidgetItem(d.gap)
+        if d.id == my_driver_id:
+            bg_color = QtGui.QColor(70, 130, 180, 200)
+        else:
+            bg_color = QtGui.QColor(0, 0, 0, alpha) if i % 2 == 0 else QtGui.QColor(30, 30, 30, alpha)
+        for col, item in enumerate([pos, delta, car_num, logo_item, flag_item, drv, lic, ir, lap, gap]):
+            if col == 5:
+                item.setTextAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
+            else:
+                item.setTextAlignment(QtCore.Qt.AlignCenter)
+            item.setBackground(QtGui.QBrush(bg_color))
+            table.setItem(i, col, item)
+        if d.pos == 1:
+            for item in [pos, drv, ir, lap, gap]:
+                item.setForeground(QtGui.QBrush(QtGui.QColor("#FFD700")))
+                font = item.font()
+                font.setBold(True)
+                item.setFont(font)
+
+
+class PaintMeter(QtCore.QObject):
+    """Soma a área dos paint events do viewport"""
+
+    def __init__(self, viewport):
+        super().__init__()
+        self.area = 0
+        viewport.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            for rect in event.region():
+                self.area += rect.width() * rect.height()
+        return False
+
+
+def record_ticks(num_rows):
+    """Standings de TICKS ticks consecutivos (corrida sintética, 4 Hz)"""
+    sim = synthetic.SyntheticSim(64)
+    sim.step()
+    client = IRacingClient(test_file=sim.path)
+    client.standings_window = 0 if num_rows >= 64 else num_rows
+    client._try_connect()
+    client._has_new_data()
+    while not len(client._session_cache.get(client.telemetry).drivers):
+        time.sleep(0.01)
+
+    ticks = []
+    for _ in range(TICKS):
+        for _ in range(15):  # 60 Hz -> 4 Hz
+            sim.step()
+        client._has_new_data()
+        ticks.append((client._get_standings(), client.telemetry["PlayerCarIdx"]))
+    client.stop()
+    client.ir.shutdown()
+    sim.close()
+    return ticks
+
+
+def make_view(view, num_rows):
+    view.verticalHeader().setVisible(False)
+    view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+    view.resize(700, num_rows * ROW_HEIGHT + 40)
+    view.show()
+    return PaintMeter(view.viewport())
+
+
+def run(app, view, update, ticks):
+    meter = make_view(view, len(ticks[0][0]))
+    update(*ticks[0])
+    app.processEvents()
+    meter.area = 0
+    t_update = t_paint = 0.0
+    for standings, my_id in ticks[1:]:
+        start = time.perf_counter()
+        update(standings, my_id)
+        t_update += time.perf_counter() - start
+        start = time.perf_counter()
+        app.processEvents()
+        t_paint += time.perf_counter() - start
+    n = len(ticks) - 1
+    viewport = view.viewport().width() * view.viewport().height()
+    view.close()
+    return t_update / n * 1e6, t_paint / n * 1e6, meter.area / n / viewport * 100
+
+
+def main():
+    app = QtWidgets.QApplication([])
+    print(f"{'linhas':>6} | {'versão':>11} | {'update (us)':>11} | {'paint (us)':>10} | {'área repintada':>14}")
+    for num_rows in (11, 30, 64):
+        ticks = record_ticks(num_rows)
+
+        table = QtWidgets.QTableWidget()
+        table.setColumnCount(len(COLUMNS))
+        table.setHorizontalHeaderLabels(COLUMNS)
+        legacy = run(app, table, lambda rows, my_id: legacy_update(table, rows, my_id), ticks)
+
+        view = QtWidgets.QTableView()
+        model = StandingsModel(view)
+        model.attach(view)
+        incremental = run(app, view, model.set_rows, ticks)
+
+        for label, (upd, paint, area) in (("legado", legacy), ("model", incremental)):
+            print(f"{num_rows:>6} | {label:>11} | {upd:>11.1f} | {paint:>10.1f} | {area:>13.1f}%")
+
+
+if __name__ == "__main__":
+    main()
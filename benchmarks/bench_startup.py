@@ -0,0 +1,84 @@
+"""Tempo de inicialização: do início do processo até o primeiro frame de um overlay
+
+Roda `src/main.py --exit-after-first-frame` RUNS vezes num diretório temporário (com
+uma cópia do config.json, para não gravar nada no repositório) e mede:
+- externo: do spawn do processo até a linha "[Startup]" aparecer na saída;
+- interno: o valor que o próprio app reporta (desde o início do main.py).
+Também roda com o chat da Twitch desmarcado, para ver o custo do QtWebEngine.
+A última linha é fácil de acompanhar no CI: "startup_ms=<mediana externa>".
+
+Uso: QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py
+"""
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+MAIN = os.path.join(ROOT, "src", "main.py")
+RUNS = 5
+TIMEOUT = 60
+STARTUP_LINE = re.compile(r"\[Startup\] primeiro frame em (\d+) ms .*QtWebEngine carregado: (\w+)")
+
+
+def run_once(workdir):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, MAIN, "--exit-after-first-frame"],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+    result = None
+    for line in proc.stdout:
+        match = STARTUP_LINE.search(line)
+        if match:
+            result = ((time.perf_counter() - start) * 1000, int(match.group(1)), match.group(2))
+            break
+    try:
+        proc.wait(TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    return result
+
+
+def measure(label, layer_states):
+    workdir = tempfile.mkdtemp(prefix="m_overlay_startup_")
+    try:
+        shutil.copy(os.path.join(ROOT, "config.json"), workdir)
+        with open(os.path.join(workdir, "overlay_layout.json"), "w", encoding="utf-8") as f:
+            json.dump({"layers_state": layer_states}, f)
+        results = [r for r in (run_once(workdir) for _ in range(RUNS)) if r]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if not results:
+        print(f"{label:>14} | sem frame (o app não abriu nenhum layer?)")
+        return None
+    external = statistics.median(r[0] for r in results)
+    internal = statistics.median(r[1] for r in results)
+    print(f"{label:>14} | {external:>12.0f} | {internal:>12.0f} | {results[-1][2]:>11}")
+    return external
+
+
+def main():
+    print(f"{'layers':>14} | {'externo (ms)':>12} | {'interno (ms)':>12} | {'QtWebEngine':>11}")
+    all_layers = {"standings": True, "fuel": True, "car_lr": True, "twitchchat": True}
+    external = measure("todos", all_layers)
+    measure("sem chat", dict(all_layers, twitchchat=False))
+    if external is not None:
+        print(f"startup_ms={external:.0f}")
+
+
+if __name__ == "__main__":
+    main()
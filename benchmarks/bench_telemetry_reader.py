@@ -0,0 +1,62 @@
+"""Benchmark: acesso por nome do pyirsdk vs. views NumPy do TelemetryReader
+
+Uso:
+    python benchmarks/bench_telemetry_reader.py              (dump sintético)
+    python benchmarks/bench_telemetry_reader.py sessao.bin   (dump gravado com `irsdk --dump sessao.bin`)
+"""
+import sys
+import timeit
+
+import irsdk
+
+import synthetic
+from core.telemetry_reader import TelemetryReader
+
+# o que o IRacingClient lê a cada tick
+TICK_VARS = [
+    "SessionTime", "SessionTick", "PlayerCarIdx", "CarLeftRight", "FuelLevel", "FuelUsePerLap",
+    "CarIdxPosition", "CarIdxLastLapTime", "CarIdxIncidentCount", "CarIdxLapDistPct",
+]
+
+
+def main():
+    sim = None
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        sim = synthetic.SyntheticSim(64)
+        for _ in range(120):
+            sim.step()
+        path = sim.path
+
+    ir = irsdk.IRSDK()
+    ir.startup(test_file=path)
+    reader = TelemetryReader(ir._shared_mem)
+    names = [name for name in TICK_VARS if name in reader]
+
+    def pyirsdk_tick():
+        ir.freeze_var_buffer_latest()
+        return [ir[name] for name in names]
+
+    def reader_tick():
+        reader.freeze()
+        return [reader[name] for name in names]
+
+    # os dois precisam ler os mesmos valores
+    for a, b in zip(pyirsdk_tick(), reader_tick()):
+        assert list(a) == list(b) if isinstance(a, list) else a == b
+
+    number = 2000
+    t_ir = min(timeit.repeat(pyirsdk_tick, number=number, repeat=5)) / number
+    t_reader = min(timeit.repeat(reader_tick, number=number, repeat=5)) / number
+    print(f"{len(names)} variáveis por tick ({path})")
+    print(f"pyirsdk (freeze + lookup + unpack): {t_ir * 1e6:8.1f} us/tick")
+    print(f"TelemetryReader (freeze + views):   {t_reader * 1e6:8.1f} us/tick")
+
+    ir.shutdown()
+    if sim:
+        sim.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Gap e intervalo: estimativa pela última volta (legado) vs. TimingEngine (passagens gravadas)
+
+Corrida sintética (SyntheticSim) com tempos de volta bem diferentes, para haver
+retardatários, velocidade variando ao longo da volta (curvas) e três carros que param
+RACE_PIT_S segundos no box. A verdade vem do histórico de distância de cada carro:
+gap = agora - quando o carro da frente passou no ponto onde o outro está. Compara, uma vez por segundo:
+- legado: StandingsEngine sem CarIdxLap (session_time - (1 - pct) * última volta);
+- engine 60 Hz: TimingEngine alimentado a cada tick (produto "timing");
+- engine 2 Hz: só nos ticks do standings, no intervalo antigo de 0,5 s.
+Depois mede o custo por tick para 20/40/64 carros.
+
+Uso: python benchmarks/bench_timing.py [minutos]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import synthetic
+from core.standings_engine import GAP_LAPPED, GAP_TIME, DriverTable, StandingsEngine
+
+NUM_CARS = 40
+TICK_RATE = 60
+STANDINGS_EVERY = 15  # 4 Hz
+WARMUP_S = 120.0  # uma volta inteira antes de medir (o engine precisa ver a pista)
+EVAL_EVERY = 4  # compara com a verdade 1x/s (a cada 4 ticks de standings)
+HISTORY_S = 200.0  # mais que uma volta + parada no box: basta para achar a passagem
+PIT_CARS = (5, 17, 30)
+RACE_PIT_S = 25.0
+
+
+def corners(pct):
+    """Retas e curvas: a velocidade varia de 0,45x a 1,55x ao longo da volta"""
+    return 1.0 + 0.55 * np.sin(2 * np.pi * 5 * pct)
+
+
+def sim_inputs(sim):
+    """Arrays CarIdx* como o _publish do SyntheticSim (sem passar pelo mmap)"""
+    n = sim.num_cars
+    dist = (sim.lap - 1) + sim.pct
+    positions = np.zeros(synthetic.MAX_CARS, dtype=np.int64)
+    positions[np.argsort(-dist, kind="stable")] = np.arange(1, n + 1)
+
+    def full(values, fill):
+        out = np.full(synthetic.MAX_CARS, fill, dtype=np.float64)
+        out[:n] = values
+        return out
+
+    return {
+        "positions": positions,
+        "qual_pos": np.zeros(synthetic.MAX_CARS, dtype=np.int64),
+        "last_laps": full(sim.last, -1.0),
+        "incidents": np.zeros(synthetic.MAX_CARS, dtype=np.int64),
+        "lap_dist_pct": full(sim.pct, -1.0),
+        "session_time": sim.session_time,
+        "laps": full(sim.lap, -1).astype(np.int64),
+        "est_time": full(sim.pct * sim.lap_time, 0.0),
+        "f2_time": full((dist.max() - dist) * sim.lap_time, 0.0),
+    }
+
+
+def truth(times, dists, car, target, now):
+    """Segundos desde que `target` passou na distância atual de `car` (nan se não está à frente)"""
+    d, d_target = dists[car, -1], dists[target, -1]
+    if not d < d_target < d + 1.0:
+        return np.nan
+    return now - np.interp(d, dists[target], times)
+
+
+def run_race(minutes):
+    sim = synthetic.SyntheticSim(num_cars=NUM_CARS, seed=3, tick_rate=TICK_RATE)
+    sim.lap_time = 88.0 + np.random.default_rng(3).random(NUM_CARS) * 10.0  # retardatários em ~10 voltas
+    sim.speed_profile = corners
+    table = DriverTable.from_drivers(sim.drivers)
+    legacy, fast, slow = StandingsEngine(), StandingsEngine(), StandingsEngine()
+    pit_windows = {car: (WARMUP_S + 60.0 * (i + 1), WARMUP_S + 60.0 * (i + 1) + RACE_PIT_S) for i, car in enumerate(PIT_CARS)}
+
+    steps = int(minutes * 60 * TICK_RATE)
+    times = np.empty(steps)
+    dists = np.empty((NUM_CARS, steps))  # uma linha contígua por carro
+    history = int(HISTORY_S * TICK_RATE)
+    errors = {"legado": ([], []), "engine 60 Hz": ([], []), "engine 2 Hz": ([], [])}
+    lapped = {name: [0, 0] for name in errors}  # [acertos, total de retardatários]
+
+    held = {}
+    for step in range(steps):
+        sim.step()
+        for car, (start, end) in pit_windows.items():
+            if start <= sim.session_time < end:
+                held.setdefault(car, sim.pct[car])
+                sim.pct[car] = held[car]
+                sim.on_pit_road[car] = True
+            elif car in held:
+                sim.on_pit_road[car] = False
+
+        times[step] = sim.session_time
+        dists[:, step] = (sim.lap - 1) + sim.pct
+        inputs = sim_inputs(sim)
+        fast.timing.update(sim.session_time, inputs["laps"], inputs["lap_dist_pct"])
+        if step % STANDINGS_EVERY:
+            continue
+
+        base = {k: inputs[k] for k in ("positions", "qual_pos", "last_laps", "incidents", "lap_dist_pct")}
+        frames = {"legado": legacy.compute(table, session_time=sim.session_time, **base)}
+        frames["engine 60 Hz"] = fast.compute(table, **inputs)
+        if step % (STANDINGS_EVERY * 2) == 0:
+            # 2 Hz: o avaliado é sempre o da amostra atual (EVAL_EVERY é par)
+            frames["engine 2 Hz"] = slow.compute(table, **inputs)
+        if sim.session_time < WARMUP_S or step % (STANDINGS_EVERY * EVAL_EVERY):
+            continue
+
+        first = max(0, step + 1 - history)
+        window_times, window_dists = times[first : step + 1], dists[:, first : step + 1]
+        dist_now = window_dists[:, -1]
+        positions = inputs["positions"][:NUM_CARS]
+        leader = int(np.flatnonzero(positions == 1)[0])
+        ahead_of = {int(c): int(np.flatnonzero(positions == positions[c] - 1)[0]) for c in range(NUM_CARS) if positions[c] > 1}
+        for car, ahead in ahead_of.items():
+            true_gap = truth(window_times, window_dists, car, leader, sim.session_time)
+            true_int = truth(window_times, window_dists, car, ahead, sim.session_time)
+            laps_down = dist_now[leader] - dist_now[car] >= 1.0
+            for name, frame in frames.items():
+                row = int(np.flatnonzero(frame.table.car_idx == car)[0])
+                if laps_down:
+                    lapped[name][1] += 1
+                    lapped[name][0] += int(frame.gap_kind[row] == GAP_LAPPED)
+                elif frame.gap_kind[row] == GAP_TIME and true_gap == true_gap:
+                    errors[name][0].append(abs(frame.gap[row] - true_gap))
+                if true_int == true_int and frame.interval[row] == frame.interval[row]:
+                    errors[name][1].append(abs(frame.interval[row] - true_int))
+    sim.close()
+    return errors, lapped
+
+
+def cost(num_cars):
+    sim = synthetic.SyntheticSim(num_cars=num_cars, seed=1, tick_rate=TICK_RATE)
+    table = DriverTable.from_drivers(sim.drivers)
+    legacy, engine = StandingsEngine(), StandingsEngine()
+    for _ in range(TICK_RATE * 5):
+        sim.step()
+        inputs = sim_inputs(sim)
+        engine.timing.update(sim.session_time, inputs["laps"], inputs["lap_dist_pct"])
+    base = {k: inputs[k] for k in ("positions", "qual_pos", "last_laps", "incidents", "lap_dist_pct")}
+    state = {"t": sim.session_time}
+
+    def timing_tick():
+        state["t"] += 1.0 / TICK_RATE
+        inputs["lap_dist_pct"][:num_cars] = (inputs["lap_dist_pct"][:num_cars] + 1.0 / 90.0 / TICK_RATE) % 1.0
+        engine.timing.update(state["t"], inputs["laps"], inputs["lap_dist_pct"])
+
+    number = 2000
+
+    def best(fn):
+        return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+    result = (
+        best(lambda: legacy.compute(table, session_time=sim.session_time, **base)),
+        best(lambda: engine.compute(table, **dict(inputs, session_time=state["t"]))),
+        best(timing_tick),
+    )
+    sim.close()
+    return result
+
+
+def main():
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 20.0
+    errors, lapped = run_race(minutes)
+    print(f"corrida sintética: {NUM_CARS} carros, {minutes:.0f} min, box de {RACE_PIT_S:.0f} s em {len(PIT_CARS)} carros")
+    print(f"{'versão':>13} | {'gap p50':>7} | {'gap p95':>7} | {'int. p50':>8} | {'int. p95':>8} | {'amostras':>8} | {'retardatários':>13}")
+    for name, (gap_err, int_err) in errors.items():
+        hits, total = lapped[name]
+        gap_p = [f"{np.percentile(gap_err, q):.3f}" if gap_err else "--" for q in (50, 95)]
+        int_p = [f"{np.percentile(int_err, q):.3f}" if int_err else "--" for q in (50, 95)]
+        print(
+            f"{name:>13} | {gap_p[0]:>7} | {gap_p[1]:>7} | {int_p[0]:>8} | {int_p[1]:>8} | {len(gap_err):>8} | "
+            f"{hits:>6}/{total:<6}"
+        )
+
+    print()
+    print(f"{'carros':>6} | {'legado (us)':>11} | {'engine (us)':>11} | {'timing.update (us)':>18}")
+    for num_cars in (20, 40, 64):
+        legacy_us, engine_us, update_us = cost(num_cars)
+        print(f"{num_cars:>6} | {legacy_us:>11.1f} | {engine_us:>11.1f} | {update_us:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
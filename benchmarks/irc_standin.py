@@ -0,0 +1,115 @@
+"""Servidor IRC local que imita o chat do Twitch (para testar o ChatLayer sem internet)
+
+Aceita qualquer NICK/JOIN, responde PING e manda PRIVMSG com tags (display-name,
+color) na taxa pedida para todos os clientes conectados.
+
+Uso: python benchmarks/irc_standin.py [porta] [mensagens/s]
+     e no overlay_config.json: "chat": {"irc_host": "127.0.0.1", "irc_port": <porta>}
+"""
+import random
+import socket
+import sys
+import threading
+import time
+
+USERS = ["Luiz", "Racer01", "Speedy", "ChatBot", "Fan99", "PitWall", "Apex_Hunter", "Slipstream"]
+COLORS = ["#FF4500", "#1E90FF", "#00FF7F", "#DAA520", "#FF69B4", "", "#9ACD32"]
+WORDS = "boa corrida força no braço vai dar P1 hoje box this lap bela ultrapassagem cuidado na curva 3".split()
+
+
+class IrcStandIn:
+    def __init__(self, host="127.0.0.1", port=0, rate=50.0, seed=1):
+        self.rate = rate
+        self.sent = 0
+        self._rng = random.Random(seed)
+        self._clients = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind((host, port))
+        self._server.listen()
+        self.host, self.port = self._server.getsockname()
+
+    def start(self):
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        threading.Thread(target=self._send_loop, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._server.close()
+        with self._lock:
+            for conn in self._clients:
+                conn.close()
+            self._clients.clear()
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._client_loop, args=(conn,), daemon=True).start()
+
+    def _client_loop(self, conn):
+        buffer = b""
+        channel = None
+        while not self._stop.is_set():
+            try:
+                data = conn.recv(4096)
+            except OSError:
+                break
+            if not data:
+                break
+            buffer += data
+            *lines, buffer = buffer.split(b"\r\n")
+            for line in lines:
+                text = line.decode("utf-8", errors="replace")
+                if text.startswith("PING"):
+                    conn.sendall(b"PONG :tmi.twitch.tv\r\n")
+                elif text.startswith("NICK"):
+                    conn.sendall(b":tmi.twitch.tv 001 justinfan :Welcome, GLHF!\r\n")
+                elif text.startswith("JOIN"):
+                    channel = text.split()[1]
+                    conn.sendall(f":justinfan!justinfan@justinfan.tmi.twitch.tv JOIN {channel}\r\n".encode())
+                    with self._lock:
+                        self._clients.append(conn)
+        with self._lock:
+            if conn in self._clients:
+                self._clients.remove(conn)
+        conn.close()
+
+    def _message(self):
+        rng = self._rng
+        user = rng.choice(USERS)
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 25)))
+        tags = f"@color={rng.choice(COLORS)};display-name={user}"
+        return f"{tags} :{user.lower()}!{user.lower()}@tmi.twitch.tv PRIVMSG #canal :{text}\r\n".encode()
+
+    def _send_loop(self):
+        interval = 1.0 / self.rate
+        next_send = time.perf_counter()
+        while not self._stop.is_set():
+            line = self._message()
+            with self._lock:
+                for conn in list(self._clients):
+                    try:
+                        conn.sendall(line)
+                    except OSError:
+                        self._clients.remove(conn)
+            self.sent += 1
+            next_send += interval
+            time.sleep(max(0.0, next_send - time.perf_counter()))
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 6667
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+    server = IrcStandIn(port=port, rate=rate).start()
+    print(f"IRC local em {server.host}:{server.port}, {rate:.0f} msg/s (Ctrl+C para sair)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,393 @@
+"""Sessão sintética do iRacing para benchmarks (sem precisar do simulador)"""
+import os
+import random
+import sys
+import mmap
+import struct
+import tempfile
+
+import numpy as np
+
+# permite importar core.*, layers.* e ui.* como em src/main.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+MAX_CARS = 64
+COUNTRIES = ["Brazil", "United States", "Germany", "France", "Italy", "Spain", "Portugal", "Argentina"]
+
+
+def make_drivers(num_cars, seed=1):
+    rnd = random.Random(seed)
+    drivers = []
+    for idx in range(num_cars):
+        drivers.append(
+            {
+                "CarIdx": idx,
+                "UserName": f"Driver {idx:02d}",
+                "CarNumberRaw": rnd.randint(1, 999),
+                "CarPath": rnd.choice(["mx5 mx52016", "porsche992cup", "bmwm4gt3"]),
+                "LicString": rnd.choice(["A 4.12", "B 3.01", "C 2.50", "R 1.00"]),
+                "LicColor": rnd.randint(0, 0xFFFFFF),
+                "CarClassID": 1,
+                "CarClassColor": 0xFFDA59,
+                "IRating": rnd.randint(800, 5000),
+                "Country": rnd.choice(COUNTRIES),
+            }
+        )
+    return drivers
+
+
+def make_session_yaml(drivers, num_sessions=3, laps=200):
+    """YAML no formato do iRacing; ResultsPositions cresce com `laps` como em treinos longos"""
+    lines = [
+        "---",
+        "WeekendInfo:",
+        " TrackName: interlagos",
+        " TrackSurfaceTemp: 31.20 C",
+        " TrackAirTemp: 24.00 C",
+        " WeekendOptions:",
+        "  NumStarters: %d" % len(drivers),
+        "  StartingGrid: 2x2 inline pole on left",
+        " TelemetryOptions:",
+        "  TelemetryDiskFile: \"\"",
+        "",
+        "SessionInfo:",
+        " Sessions:",
+    ]
+    for num in range(num_sessions):
+        lines += [
+            " - SessionNum: %d" % num,
+            "   SessionLaps: unlimited",
+            "   SessionTime: 3600.0000 sec",
+            "   SessionType: Practice",
+            "   StrengthOfField: 2100",
+            "   ResultsLapsComplete: %d" % laps,
+            "   ResultsPositions:",
+        ]
+        for pos, drv in enumerate(drivers, start=1):
+            lines += [
+                "   - Position: %d" % pos,
+                "     ClassPosition: %d" % (pos - 1),
+                "     CarIdx: %d" % drv["CarIdx"],
+                "     Lap: %d" % laps,
+                "     Time: 5432.1234",
+                "     FastestLap: 12",
+                "     FastestTime: 91.2345",
+                "     LastTime: 92.3456",
+                "     LapsLed: 0",
+                "     LapsComplete: %d" % laps,
+                "     JokerLapsComplete: 0",
+                "     LapsDriven: %d.000" % laps,
+                "     Incidents: 2",
+                "     ReasonOutId: 0",
+                "     ReasonOutStr: Running",
+            ]
+        lines += [
+            "   ResultsFastestLap:",
+            "   - CarIdx: 0",
+            "     FastestLap: 12",
+            "     FastestTime: 91.2345",
+        ]
+    lines += [
+        "",
+        "DriverInfo:",
+        " DriverCarIdx: 0",
+        " DriverCarFuelMaxLtr: 110.000",
+        " DriverCarMaxFuelPct: 0.600",
+        " Drivers:",
+    ]
+    for drv in drivers:
+        lines += [
+            " - CarIdx: %d" % drv["CarIdx"],
+            "   UserName: %s" % drv["UserName"],
+            "   AbbrevName: \"\"",
+            "   CarNumber: \"%d\"" % drv["CarNumberRaw"],
+            "   CarNumberRaw: %d" % drv["CarNumberRaw"],
+            "   CarPath: %s" % drv["CarPath"],
+            "   CarClassID: %d" % drv["CarClassID"],
+            "   CarClassColor: 0x%06x" % drv["CarClassColor"],
+            "   IRating: %d" % drv["IRating"],
+            "   LicString: %s" % drv["LicString"],
+            "   LicColor: 0x%06x" % drv["LicColor"],
+            "   ClubName: %s" % drv["Country"],
+            "   TeamName: %s" % drv["UserName"],
+            "   CarDesignStr: 0,ffffff,000000,ff0000",
+            "   HelmetDesignStr: 0,ffffff,000000,ff0000",
+        ]
+    lines += ["", "SplitTimeInfo:", " Sectors:"]
+    for num, start in enumerate((0.0, 0.3308, 0.6612)):
+        lines += [" - SectorNum: %d" % num, "   SectorStartPct: %.6f" % start]
+    lines += ["", ""]
+    return "\n".join(lines).encode("cp1252")
+
+
+class FakeIR:
+    """Imita irsdk.IRSDK: acesso por nome a variáveis de telemetria e seções YAML"""
+
+    def __init__(self, num_cars, seed=1):
+        self.rnd = random.Random(seed)
+        self.num_cars = num_cars
+        self.session_info_update = 1
+        self.values = {
+            "DriverInfo": {"Drivers": make_drivers(num_cars, seed)},
+            "SessionInfo": {
+                "Sessions": [
+                    {
+                        "StrengthOfField": 2100,
+                        "SessionLaps": "unlimited",
+                        "SessionTime": 3600.0,
+                        "ResultsLapsComplete": 0,
+                        "ResultsPositions": [],
+                    }
+                ]
+            },
+            "WeekendInfo": {"TrackSurfaceTemp": "31.20 C"},
+            "PlayerCarIdx": num_cars // 2,
+            "SessionTime": 600.0,
+            "SessionTick": 36000,
+            "SessionTimeRemain": 3000.0,
+            "FuelLevel": 40.0,
+            "FuelCapacity": 60.0,
+            "FuelUsePerLap": 2.5,
+            "CarLeftRight": 1,
+        }
+        self.step(0.0)
+
+    def step(self, dt=0.25):
+        """Avança a corrida sintética em `dt` segundos"""
+        v = self.values
+        v["SessionTime"] += dt
+        v["SessionTick"] += int(dt * 60)
+        order = list(range(self.num_cars))
+        self.rnd.shuffle(order)
+        positions = [0] * MAX_CARS
+        pct = [-1.0] * MAX_CARS
+        last = [-1.0] * MAX_CARS
+        for p, idx in enumerate(order, start=1):
+            positions[idx] = p
+            pct[idx] = self.rnd.random()
+            last[idx] = 90.0 + self.rnd.random() * 5
+        v["CarIdxPosition"] = positions
+        v["CarIdxQualPosition"] = [0] * MAX_CARS
+        v["CarIdxLapDistPct"] = pct
+        v["CarIdxLastLapTime"] = last
+        v["CarIdxIncidentCount"] = [self.rnd.randint(0, 8) for _ in range(MAX_CARS)]
+
+    def __getitem__(self, key):
+        return self.values.get(key)
+
+
+# variáveis publicadas pelo SyntheticSim: (nome, irsdk_VarType, count)
+SIM_VARS = [
+    ("SessionTime", 5, 1),
+    ("SessionTick", 2, 1),
+    ("SessionNum", 2, 1),
+    ("SessionState", 2, 1),
+    ("SessionFlags", 3, 1),
+    ("SessionTimeRemain", 5, 1),
+    ("PlayerCarIdx", 2, 1),
+    ("IsOnTrack", 1, 1),
+    ("IsOnTrackCar", 1, 1),
+    ("OnPitRoad", 1, 1),
+    ("CarLeftRight", 2, 1),
+    ("FuelLevel", 4, 1),
+    ("FuelUsePerLap", 4, 1),
+    ("Lap", 2, 1),
+    ("LapCompleted", 2, 1),
+    ("LapDistPct", 4, 1),
+    ("LapCurrentLapTime", 4, 1),
+    ("LapLastLapTime", 4, 1),
+    ("LapBestLapTime", 4, 1),
+    ("CarIdxPosition", 2, MAX_CARS),
+    ("CarIdxClassPosition", 2, MAX_CARS),
+    ("CarIdxQualPosition", 2, MAX_CARS),
+    ("CarIdxLap", 2, MAX_CARS),
+    ("CarIdxLapCompleted", 2, MAX_CARS),
+    ("CarIdxLapDistPct", 4, MAX_CARS),
+    ("CarIdxLastLapTime", 4, MAX_CARS),
+    ("CarIdxBestLapTime", 4, MAX_CARS),
+    ("CarIdxEstTime", 4, MAX_CARS),
+    ("CarIdxF2Time", 4, MAX_CARS),
+    ("CarIdxOnPitRoad", 1, MAX_CARS),
+    ("CarIdxTrackSurface", 2, MAX_CARS),
+    ("CarIdxIncidentCount", 2, MAX_CARS),
+]
+_VAR_SIZES = {0: 1, 1: 1, 2: 4, 3: 4, 4: 4, 5: 8}
+_VAR_DTYPES = {0: "S1", 1: "?", 2: "<i4", 3: "<u4", 4: "<f4", 5: "<f8"}
+_NUM_BUF = 3
+_SESSION_INFO_SIZE = 512 * 1024
+
+
+class SyntheticSim:
+    """Escreve um arquivo no formato da memória compartilhada do iRacing e simula uma corrida
+
+    O arquivo funciona como um dump `.bin`: `irsdk.IRSDK().startup(test_file=sim.path)`
+    e o TelemetryReader leem dele, e cada `step()` publica um tick novo.
+    """
+
+    def __init__(self, num_cars=64, seed=1, path=None, tick_rate=60):
+        self.rnd = np.random.default_rng(seed)
+        self.num_cars = num_cars
+        self.tick_rate = tick_rate
+        self.drivers = make_drivers(num_cars, seed)
+
+        # layout: header | var headers | session info | var buffers
+        offset = 0
+        offsets = []
+        for _name, var_type, count in SIM_VARS:
+            size = _VAR_SIZES[var_type]
+            offset = (offset + size - 1) // size * size
+            offsets.append(offset)
+            offset += size * count
+        self.buf_len = (offset + 15) // 16 * 16
+        self.dtype = np.dtype(
+            {
+                "names": [v[0] for v in SIM_VARS],
+                "formats": [_VAR_DTYPES[t] if c == 1 else (_VAR_DTYPES[t], (c,)) for _n, t, c in SIM_VARS],
+                "offsets": offsets,
+                "itemsize": self.buf_len,
+            }
+        )
+
+        var_header_offset = 112
+        self.session_info_offset = var_header_offset + len(SIM_VARS) * 144
+        buf_offset = (self.session_info_offset + _SESSION_INFO_SIZE + 15) // 16 * 16
+        self.buf_offsets = [buf_offset + i * self.buf_len for i in range(_NUM_BUF)]
+        size = self.buf_offsets[-1] + self.buf_len
+
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".bin")
+            os.close(fd)
+        self.path = path
+        with open(path, "wb") as f:
+            f.truncate(size)
+        self._file = open(path, "r+b")
+        self.mem = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_WRITE)
+
+        struct.pack_into(
+            "<10i", self.mem, 0,
+            2, 1, tick_rate, 0, _SESSION_INFO_SIZE, self.session_info_offset,
+            len(SIM_VARS), var_header_offset, _NUM_BUF, self.buf_len,
+        )
+        for i, ((name, var_type, count), var_offset) in enumerate(zip(SIM_VARS, offsets)):
+            struct.pack_into(
+                "<3i?3x32s64s32s", self.mem, var_header_offset + i * 144,
+                var_type, var_offset, count, False, name.encode(), b"", b"",
+            )
+        for i, off in enumerate(self.buf_offsets):
+            struct.pack_into("<3i", self.mem, 48 + i * 16, 0, off, 0)
+
+        self.write_session_yaml(make_session_yaml(self.drivers))
+
+        # estado da corrida
+        n = num_cars
+        self.lap_time = 90.0 + self.rnd.random(n) * 3.0
+        self.pct = self.rnd.random(n) * 0.2
+        self.lap = np.ones(n, dtype=np.int32)
+        self.lap_start = -self.pct * self.lap_time
+        self.last = np.full(n, -1.0)
+        self.best = np.full(n, -1.0)
+        self.on_pit_road = np.zeros(n, dtype=bool)
+        # velocidade relativa ao longo da volta (f(pct) -> fator); None = constante
+        self.speed_profile = None
+        self.session_time = 0.0
+        self.session_tick = 0
+        self.tick = 0
+        self.player = n // 2
+        self.fuel = 40.0
+        self.fuel_per_lap = 2.5
+        self.session_flags = 0x4  # green
+        self.on_track = True
+        self.car_left_right = 1
+        self.incidents = np.zeros(n, dtype=np.int32)
+        self.step(0.0)
+
+    def write_session_yaml(self, raw):
+        self.mem[self.session_info_offset : self.session_info_offset + _SESSION_INFO_SIZE] = (
+            raw[:_SESSION_INFO_SIZE].ljust(_SESSION_INFO_SIZE, b"\x00")
+        )
+        update = struct.unpack_from("<i", self.mem, 12)[0]
+        struct.pack_into("<i", self.mem, 12, update + 1)
+
+    def step(self, dt=None, paused=False):
+        """Avança `dt` segundos (padrão: um tick) e publica um novo var buffer"""
+        dt = 1.0 / self.tick_rate if dt is None else dt
+        if not paused:
+            self.session_time += dt
+            self.session_tick += max(1, int(round(dt * self.tick_rate))) if dt else 0
+            speed = 1.0 + self.rnd.normal(0.0, 0.01, self.num_cars)
+            if self.speed_profile is not None:
+                speed *= self.speed_profile(self.pct)
+            self.pct += dt / self.lap_time * speed
+            crossed = self.pct >= 1.0
+            if crossed.any():
+                self.pct[crossed] -= 1.0
+                self.lap[crossed] += 1
+                lap_done = self.session_time - self.lap_start[crossed] - self.pct[crossed] * self.lap_time[crossed]
+                self.last[crossed] = lap_done
+                self.best[crossed] = np.where(
+                    self.best[crossed] > 0, np.minimum(self.best[crossed], lap_done), lap_done
+                )
+                self.lap_start[crossed] = self.session_time - self.pct[crossed] * self.lap_time[crossed]
+                if crossed[self.player]:
+                    self.fuel = max(0.0, self.fuel - self.fuel_per_lap)
+        self._publish()
+
+    def _publish(self):
+        n = self.num_cars
+        dist = (self.lap - 1) + self.pct
+        order = np.argsort(-dist, kind="stable")
+        position = np.zeros(MAX_CARS, dtype=np.int32)
+        position[order] = np.arange(1, n + 1)
+        leader = order[0]
+
+        buf = self.buf_offsets[self.tick % _NUM_BUF]
+        rec = np.ndarray((), dtype=self.dtype, buffer=self.mem, offset=buf)
+        # tickCountBegin antes de escrever, tickCount depois (detecção de leitura rasgada)
+        slot = 48 + (self.tick % _NUM_BUF) * 16
+        self.tick += 1
+        struct.pack_into("<i", self.mem, slot + 8, self.tick)
+
+        def fill(name, values, default=0):
+            col = np.full(MAX_CARS, default, dtype=self.dtype[name].base)
+            col[:n] = values
+            rec[name] = col
+
+        rec["SessionTime"] = self.session_time
+        rec["SessionTick"] = self.session_tick
+        rec["SessionNum"] = 0
+        rec["SessionState"] = 4
+        rec["SessionTimeRemain"] = max(0.0, 3600.0 - self.session_time)
+        rec["SessionFlags"] = self.session_flags
+        rec["PlayerCarIdx"] = self.player
+        rec["IsOnTrack"] = self.on_track
+        rec["IsOnTrackCar"] = self.on_track
+        rec["OnPitRoad"] = bool(self.on_pit_road[self.player])
+        rec["CarLeftRight"] = self.car_left_right
+        rec["FuelLevel"] = self.fuel - self.pct[self.player] * self.fuel_per_lap
+        rec["FuelUsePerLap"] = self.fuel_per_lap
+        rec["Lap"] = self.lap[self.player]
+        rec["LapCompleted"] = self.lap[self.player] - 1
+        rec["LapDistPct"] = self.pct[self.player]
+        rec["LapCurrentLapTime"] = self.session_time - self.lap_start[self.player]
+        rec["LapLastLapTime"] = self.last[self.player]
+        rec["LapBestLapTime"] = self.best[self.player]
+        fill("CarIdxPosition", position[:n])
+        fill("CarIdxClassPosition", position[:n])
+        fill("CarIdxQualPosition", 0)
+        fill("CarIdxLap", self.lap, -1)
+        fill("CarIdxLapCompleted", self.lap - 1, -1)
+        fill("CarIdxLapDistPct", self.pct, -1.0)
+        fill("CarIdxLastLapTime", self.last, -1.0)
+        fill("CarIdxBestLapTime", self.best, -1.0)
+        fill("CarIdxEstTime", self.pct * self.lap_time, 0.0)
+        fill("CarIdxF2Time", (dist[leader] - dist) * self.lap_time, 0.0)
+        fill("CarIdxOnPitRoad", self.on_pit_road, False)
+        fill("CarIdxTrackSurface", np.where(self.on_pit_road, 2, 3), -1)
+        fill("CarIdxIncidentCount", self.incidents)
+
+        struct.pack_into("<i", self.mem, slot, self.tick)
+
+    def close(self):
+        self.mem.close()
+        self._file.close()
+        os.unlink(self.path)
@@ -0,0 +1,86 @@
+"""Processo auxiliar do chat da Twitch
+
+O QtWebEngine (Chromium) roda aqui, fora do processo dos overlays: GC, layout e
+JavaScript do chat não travam o paint do standings, e se este processo cair o overlay
+continua. Iniciado pelo RemoteTwitchChatLayer, que manda posição, show/hide e canal
+pelo QLocalSocket (core.chat_protocol).
+
+Uso: python src/chat_helper.py <nome do QLocalServer>
+"""
+import sys
+
+from PySide6 import QtCore, QtNetwork, QtWidgets
+
+from core.chat_protocol import LineReader, encode
+from layers.twitch_chat_layer import TwitchChatLayer
+
+
+class ChatHelper(QtCore.QObject):
+    def __init__(self, server_name):
+        super().__init__()
+        self.locked = False
+        self._reader = LineReader()
+
+        self.layer = TwitchChatLayer(app=self)
+        self.layer.hide()  # o overlay decide quando mostrar
+        self.layer.installEventFilter(self)
+
+        self.socket = QtNetwork.QLocalSocket(self)
+        self.socket.readyRead.connect(self._on_ready_read)
+        # overlay fechou (ou caiu): o chat vai junto
+        self.socket.disconnected.connect(QtWidgets.QApplication.quit)
+        self.socket.errorOccurred.connect(self._on_error)
+        self.socket.connectToServer(server_name)
+        self.connected = self.socket.waitForConnected(5000)
+        if self.connected:
+            self._send({"event": "ready"})
+
+    def _send(self, message):
+        if self.socket.state() == QtNetwork.QLocalSocket.ConnectedState:
+            self.socket.write(encode(message))
+            self.socket.flush()
+
+    def _on_error(self, error):
+        print(f"[ChatHelper] Erro no socket: {self.socket.errorString()}")
+        QtWidgets.QApplication.quit()
+
+    def _on_ready_read(self):
+        for message in self._reader.feed(self.socket.readAll()):
+            self._handle(message)
+
+    def _handle(self, message):
+        cmd = message.get("cmd")
+        layer = self.layer
+        if cmd == "show":
+            layer.show()
+            layer.raise_()
+        elif cmd == "hide":
+            layer.hide()
+        elif cmd == "geometry":
+            layer.setGeometry(message["x"], message["y"], message["w"], message["h"])
+        elif cmd == "channel":
+            layer.set_channel(message.get("channel"))
+        elif cmd == "edit":
+            layer.set_edit_mode(bool(message.get("editing")))
+        elif cmd == "locked":
+            layer.set_locked(bool(message.get("locked")))
+        elif cmd == "quit":
+            QtWidgets.QApplication.quit()
+
+    def eventFilter(self, obj, event):
+        # no modo edição o usuário move/redimensiona aqui; o overlay guarda no layout
+        moved = event.type() in (QtCore.QEvent.Move, QtCore.QEvent.Resize)
+        if obj is self.layer and moved and self.layer._editing:
+            rect = self.layer.geometry()
+            self._send({"event": "geometry", "x": rect.x(), "y": rect.y(), "w": rect.width(), "h": rect.height()})
+        return False
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication(sys.argv)
+    app.setQuitOnLastWindowClosed(False)
+    helper = ChatHelper(sys.argv[1])
+    if not helper.connected:
+        print("[ChatHelper] Overlay não encontrado, encerrando")
+        sys.exit(1)
+    sys.exit(app.exec())
@@ -1,25 +1,24 @@
 import sys
+import time
 from PySide6 import QtWidgets, QtCore
 from core.layout_store import LayoutStore
+from core.config_store import load_json
+from core.layer_registry import LayerRegistry
 from ui.control_panel import ControlPanel
-from layers.standings_layer import StandingsLayer
-from layers.fuel_layer import FuelLayer
-from layers.car_lr_layer import CarLRLayer
 from core.iracing_client import IRacingClient
-from layers.twitch_chat_layer import TwitchChatLayer
-
-
-LAYER_CLASSES = {
-    "standings": StandingsLayer,
-    "fuel": FuelLayer,
-    "car_lr": CarLRLayer,
-    "twitchchat": TwitchChatLayer,
-}
+from core.telemetry_worker import ProcessIRacingClient
+from core.topic_bus import TopicBus
+from core.frame_scheduler import FrameScheduler
+from core.standings_delta import StandingsLatest, merge_diffs
 
 
 class OverlayApp(QtWidgets.QApplication):
-    def __init__(self, argv):
+    def __init__(self, argv, started=None):
         super().__init__(argv)
+        # início do processo (main.py) até o primeiro frame de um layer
+        self.started = time.perf_counter() if started is None else started
+        self.startup_ms = None
+        self.exit_after_first_frame = "--exit-after-first-frame" in argv
 
         self.cfg = {
             "initial_layers": [
@@ -27,11 +26,33 @@ class OverlayApp(QtWidgets.QApplication):
                 {"id": "fuel", "title": "Fuel Calc", "visible": True},
                 {"id": "car_lr", "title": "Car Left/Right", "visible": True},
                 {"id": "twitchchat", "title": "Twitch Chat", "visible": True},
+                {"id": "chat", "title": "Twitch Chat (nativo)", "visible": False},
+                {"id": "delta", "title": "Delta", "visible": False},
             ]
         }
 
         self.layers = {}
         self.locked = False
+        self.power_state = "disconnected"
+        # layers são importados e criados só quando ativados (ex.: QtWebEngine do chat)
+        self.registry = LayerRegistry()
+        self._layer_meta = {meta["id"]: meta for meta in self.cfg["initial_layers"]}
+
+        # layers visíveis assinam tópicos aqui; o cliente só calcula o que tem assinante
+        self.bus = TopicBus(self)
+        self.bus.set_merge("standings", merge_diffs)
+        self.bus.set_latest("standings", StandingsLatest)
+        # entrega no ritmo da tela ("max_fps": 0 = taxa do monitor)
+        app_cfg = load_json("config.json")
+        if app_cfg.get("twitch_chat_process", False):
+            # QtWebEngine do chat num processo auxiliar (chat_helper.py)
+            self.registry.register("twitchchat", "layers.remote_chat_layer:RemoteTwitchChatLayer")
+        self.frame_scheduler = FrameScheduler(
+            self.bus,
+            max_fps=app_cfg.get("max_fps", 0),
+            stats_interval=app_cfg.get("frame_stats_interval", 0),
+            parent=self,
+        )
 
         # Gerenciador de layouts
         self.store = LayoutStore(QtWidgets.QWidget())
@@ -39,21 +60,11 @@ class OverlayApp(QtWidgets.QApplication):
         # Carregar estados de camadas previamente salvos
         saved_states = self.store.load_layer_states()
 
-        # Cria layers iniciais
+        # Cria só os layers visíveis; os outros ficam para quando forem marcados no painel
         for meta in self.cfg["initial_layers"]:
-            cls = LAYER_CLASSES.get(meta["id"])
-            if cls:
-                saved = self.store.load_layer(meta["id"])
-                layer = cls(
-                    app=self,
-                    layer_id=meta["id"],
-                    title=meta["title"],
-                    initial_rect=saved,
-                )
-                self.layers[meta["id"]] = layer
-                # Se já temos estado salvo, respeita ele
-                visible = saved_states.get(meta["id"], meta.get("visible", True))
-                layer.setVisible(visible)
+            # Se já temos estado salvo, respeita ele
+            if saved_states.get(meta["id"], meta.get("visible", True)):
+                self._create_layer(meta["id"])
 
         # Painel de controle
         self.panel = ControlPanel(self.cfg["initial_layers"], self)
@@ -70,10 +81,22 @@ class OverlayApp(QtWidgets.QApplication):
 
         self.panel.show()
 
-        # Cliente iRacing (thread + sinal Qt)
-        self.iracing_client = IRacingClient()
-        self.iracing_client.data_ready.connect(self._dispatch_iracing_data)
+        # Cliente iRacing; frequências por produto em config.json
+        # "telemetry_process": true roda o polling num processo separado (sem disputar o GIL com o Qt)
+        client_cls = ProcessIRacingClient if app_cfg.get("telemetry_process", False) else IRacingClient
+        self.iracing_client = client_cls(
+            rates=app_cfg.get("telemetry_rates"),
+            stats_interval=app_cfg.get("telemetry_stats_interval", 0),
+            reconnect_max_interval=app_cfg.get("reconnect_max_interval", 30),
+            idle_rate=app_cfg.get("idle_rate", 1),
+        )
+        self.iracing_client.data_ready.connect(self.bus.publish)
+        self.iracing_client.power_state_changed.connect(self._on_power_state_changed)
+        self.iracing_client.set_demand(self.bus.topics())
+        self.bus.demand_changed.connect(self.iracing_client.set_demand)
         self.iracing_client.start()
+        # QApplication não recebe closeEvent: o encerramento do cliente fica no aboutToQuit
+        self.aboutToQuit.connect(self._stop_iracing_client)
 
         # 🎨 Aplica tema moderno
         dark_stylesheet = """
@@ -147,14 +170,53 @@ class OverlayApp(QtWidgets.QApplication):
         """
         self.setStyleSheet(dark_stylesheet)
 
-    def _dispatch_iracing_data(self, packet):
-        """Distribui dados do iRacing para todos os layers"""
+    def _create_layer(self, layer_id):
+        """Importa e cria o layer na primeira ativação; None se o id não tem classe"""
+        layer = self.layers.get(layer_id)
+        if layer is not None:
+            return layer
+        cls = self.registry.get(layer_id)
+        if cls is None:
+            return None
+
+        meta = self._layer_meta.get(layer_id, {"title": layer_id})
+        start = time.perf_counter()
+        layer = cls(
+            app=self,
+            layer_id=layer_id,
+            title=meta["title"],
+            initial_rect=self.store.load_layer(layer_id),
+        )
+        print(f"[OverlayApp] Layer {layer_id} criado em {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # entra no mesmo estado dos layers que já existiam
+        layer.set_power_mode(self.power_state)
+        if self.locked:
+            layer.set_locked(True)
+        panel = getattr(self, "panel", None)
+        if panel is not None and panel.edit_checkbox.isChecked():
+            layer.set_edit_mode(True)
+        self.layers[layer_id] = layer
+        return layer
+
+    def layer_first_frame(self, layer):
+        """Chamado pelo BaseLayer no primeiro paint de cada layer"""
+        if self.startup_ms is not None:
+            return
+        self.startup_ms = (time.perf_counter() - self.started) * 1000
+        webengine = "PySide6.QtWebEngineWidgets" in sys.modules
+        print(
+            f"[Startup] primeiro frame em {self.startup_ms:.0f} ms "
+            f"(layer: {layer.layer_id}, QtWebEngine carregado: {'sim' if webengine else 'não'})"
+        )
+        if self.exit_after_first_frame:
+            QtCore.QTimer.singleShot(0, self.quit)
+
+    def _on_power_state_changed(self, state):
+        """Pausa timers dos layers com o iRacing fechado e reduz na garagem"""
+        self.power_state = state
         for layer in self.layers.values():
-            if hasattr(layer, "update_from_iracing"):
-                try:
-                    layer.update_from_iracing(packet)
-                except Exception as e:
-                    print(f"[OverlayApp] Erro update layer {layer.layer_id}: {e}")
+            layer.set_power_mode(state)
 
     def save_layouts(self):
         for layer_id, layer in self.layers.items():
@@ -171,25 +233,28 @@ class OverlayApp(QtWidgets.QApplication):
 
     def toggle_layer_visibility(self, layer_id: str, visible: bool):
         layer = self.layers.get(layer_id)
+        if not layer and visible:
+            layer = self._create_layer(layer_id)
         if not layer:
             return
         if visible:
             layer.show()
             layer.raise_()
             layer.activateWindow()
-            if getattr(layer, "_locked", False):
-                layer.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
         else:
             layer.hide()
 
+    def _stop_iracing_client(self):
+        if hasattr(self, "iracing_client"):
+            self.iracing_client.stop()
+            self.iracing_client.wait()  # garante encerrar a thread/processo sem crash
+
     def closeEvent(self, event):
         #print("Encerrando OverlayApp...")
         # Salva antes de sair
         self.save_layouts()
 
-        if hasattr(self, "iracing_client"):
-            self.iracing_client.stop()
-            self.iracing_client.wait()  # garante encerrar a thread sem crash
+        self._stop_iracing_client()
 
         super().closeAllWindows()
         event.accept()
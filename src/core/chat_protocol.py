@@ -0,0 +1,43 @@
+import json
+
+from core.config_store import load_config
+
+# Mensagens entre o overlay e o processo do chat (chat_helper.py): um objeto JSON por
+# linha no QLocalSocket.
+#   overlay -> helper: {"cmd": "show"|"hide"|"geometry"|"channel"|"edit"|"locked"|"quit", ...}
+#   helper -> overlay: {"event": "ready"|"geometry", ...}
+
+
+def chat_url(channel):
+    return f"https://www.twitch.tv/embed/{channel}/chat?parent=localhost&darkpopout"
+
+
+def configured_channel(layer_id="twitchchat"):
+    """Canal salvo pelo painel (layer_configs) ou o "twitch_channel" do config.json"""
+    cfg = load_config()
+    channel = cfg.get("layer_configs", {}).get(layer_id, {}).get("channel")
+    return channel or cfg.get("twitch_channel", "twitch")  # valor padrão
+
+
+def encode(message):
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+class LineReader:
+    """Junta os bytes recebidos e devolve as mensagens completas"""
+
+    def __init__(self):
+        self._buffer = b""
+
+    def feed(self, data):
+        self._buffer += bytes(data)
+        *lines, self._buffer = self._buffer.split(b"\n")
+        messages = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                messages.append(json.loads(line))
+            except ValueError as e:
+                print(f"[ChatProtocol] Mensagem inválida ignorada: {e}")
+        return messages
@@ -2,6 +2,8 @@ import json
 import os
 
 CONFIG_FILE = "overlay_config.json"
+# config geral do app (canal da Twitch, layers ativos, configs do painel)
+APP_CONFIG_FILE = "config.json"
 
 
 def load_json(path):
@@ -14,6 +16,24 @@ def load_json(path):
     return {}
 
 
+def load_config():
+    if os.path.exists(APP_CONFIG_FILE):
+        try:
+            with open(APP_CONFIG_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print("[Config] Erro ao ler config.json:", e)
+    return {}
+
+
+def save_config(data):
+    try:
+        with open(APP_CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    except Exception as e:
+        print("[Config] Erro ao salvar config.json:", e)
+
+
 class ConfigStore:
     def __init__(self):
         self.data = load_json(CONFIG_FILE)
@@ -0,0 +1,158 @@
+import numpy as np
+
+from core.sector_engine import DEFAULT_SECTORS
+
+# pontos da volta em que o tempo do player é gravado (volta de 90 s: um ponto a cada 90 ms)
+DELTA_BINS = 1000
+# avanço maior que isso entre duas amostras é teleporte (reset, reboque para o box)
+MAX_JUMP_LAPS = 0.5
+
+
+class DeltaEngine:
+    """Delta ao vivo do player contra a melhor volta e contra a volta ótima (melhores setores)
+
+    A volta atual é gravada como o tempo desde a linha em DELTA_BINS + 1 pontos fixos de
+    LapDistPct (interpolado entre as amostras), em arrays alocados uma vez. Por amostra o
+    trabalho é constante: grava os pontos cruzados desde a anterior (0 ou 1 a 60 Hz) e
+    interpola a referência na posição atual. Comparar setores e copiar a volta para a
+    referência acontece uma vez por volta, com operações de array.
+    """
+
+    def __init__(self, bins=DELTA_BINS, sectors=DEFAULT_SECTORS):
+        self.bins = bins
+        # tempo desde a linha em cada ponto: volta atual, melhor volta e volta ótima
+        self._lap = np.full(bins + 1, np.nan)
+        self._best = np.full(bins + 1, np.nan)
+        self._optimal = np.full(bins + 1, np.nan)
+        # por setor: tempo desde o início do setor na volta que fez o melhor setor
+        self._sector_curve = np.full(bins + 1, np.nan)
+        self.set_sectors(sectors)
+
+    def set_sectors(self, starts):
+        """Início de cada setor em LapDistPct (arredondado para os pontos); zera as referências"""
+        points = sorted({int(round((float(s) % 1.0) * self.bins)) for s in starts} | {0})
+        self._sector_bins = [(a, b) for a, b in zip(points, points[1:] + [self.bins]) if b > a]
+        self.reset()
+
+    def reset(self):
+        self._lap[:] = np.nan
+        self._best[:] = np.nan
+        self._optimal[:] = np.nan
+        self._sector_curve[:] = np.nan
+        self.best_sectors = np.full(len(self._sector_bins), np.nan)
+        self.best_lap = np.nan
+        self.optimal_lap = np.nan
+        self.last_lap = np.nan
+        self.laps = 0  # voltas completadas válidas
+        self.delta = np.nan
+        self.delta_optimal = np.nan
+        self.predicted = np.nan
+        # volta em andamento: SessionTime da linha (None = não vale, espera a próxima linha)
+        self._lap_start = None
+        self._pitted = False
+        self._next_bin = 0
+        self._pct = None
+        self._time = None
+
+    def update(self, session_time, lap_dist_pct, on_pit_road=False):
+        """Uma amostra do player; atualiza delta e volta prevista"""
+        pct, prev_pct, prev_time = lap_dist_pct, self._pct, self._time
+        self._pct, self._time = pct, session_time
+        if prev_time is not None and session_time < prev_time:
+            self.reset()  # sessão nova (ou replay voltou)
+            self._pct, self._time = pct, session_time
+            return
+        if pct is None or pct < 0 or prev_pct is None or prev_pct < 0:
+            self._lap_start = None  # fora do carro / fora do mundo
+            self._clear_live()
+            return
+        dt = session_time - prev_time
+        if dt <= 0:
+            return
+
+        step = pct - prev_pct
+        wrapped = step < -MAX_JUMP_LAPS
+        if wrapped:
+            step += 1.0
+        if not 0 <= step <= MAX_JUMP_LAPS:
+            self._lap_start = None  # teleporte ou ré
+            self._clear_live()
+            return
+
+        self._pitted = self._pitted or bool(on_pit_road)
+        if step == 0:
+            return  # parado: a posição não muda, o delta só cresce no próximo avanço
+        speed = step / dt  # voltas por segundo entre as duas amostras
+        if wrapped:
+            # SessionTime exato da linha; fecha a volta anterior e abre a nova
+            crossing = prev_time + (1.0 - prev_pct) / speed
+            if self._lap_start is not None:
+                self._fill(1.0, prev_time, prev_pct, speed)
+                self._finish_lap(crossing)
+            self._lap_start = crossing
+            self._pitted = bool(on_pit_road)
+            self._next_bin = 0
+            prev_pct -= 1.0  # posição anterior medida a partir da linha nova
+        if self._lap_start is None:
+            self._clear_live()
+            return
+
+        self._fill(pct, prev_time, prev_pct, speed)
+        elapsed = session_time - self._lap_start
+        self.delta = elapsed - self._reference(self._best, pct)
+        self.delta_optimal = elapsed - self._reference(self._optimal, pct)
+        self.predicted = self.best_lap + self.delta
+
+    def _fill(self, upto, t0, x0, speed):
+        """Grava os pontos ainda não cruzados até a posição `upto` da volta atual"""
+        bins = self.bins
+        lap = self._lap
+        b = self._next_bin
+        limit = min(upto * bins, bins)
+        start = self._lap_start
+        while b <= limit:
+            lap[b] = t0 + (b / bins - x0) / speed - start
+            b += 1
+        self._next_bin = b
+
+    def _reference(self, curve, pct):
+        """Tempo da referência `curve` na posição `pct` (interpolado entre dois pontos)"""
+        x = pct * self.bins
+        k = min(int(x), self.bins - 1)
+        t0 = curve[k]
+        return t0 + (x - k) * (curve[k + 1] - t0)
+
+    def _clear_live(self):
+        self.delta = np.nan
+        self.delta_optimal = np.nan
+        self.predicted = np.nan
+
+    def _finish_lap(self, crossing):
+        """Volta completada na linha em `crossing`; atualiza melhor volta e melhores setores"""
+        lap_time = crossing - self._lap_start
+        self._lap[self.bins] = lap_time
+        self.last_lap = lap_time
+        # volta com box ou com pontos sem gravar (começou no meio) não vira referência
+        if self._pitted or self._next_bin <= self.bins or np.isnan(self._lap).any():
+            self._lap[:] = np.nan
+            return
+        self.laps += 1
+        if not lap_time >= self.best_lap:
+            self.best_lap = lap_time
+            np.copyto(self._best, self._lap)
+
+        improved = False
+        for s, (a, b) in enumerate(self._sector_bins):
+            duration = self._lap[b] - self._lap[a]
+            if not duration >= self.best_sectors[s]:
+                self.best_sectors[s] = duration
+                np.subtract(self._lap[a : b + 1], self._lap[a], out=self._sector_curve[a : b + 1])
+                improved = True
+        if improved:
+            # volta ótima: melhores setores emendados, cada um com o traçado da sua volta
+            offset = 0.0
+            for s, (a, b) in enumerate(self._sector_bins):
+                np.add(self._sector_curve[a : b + 1], offset, out=self._optimal[a : b + 1])
+                offset += self.best_sectors[s]
+            self.optimal_lap = offset
+        self._lap[:] = np.nan
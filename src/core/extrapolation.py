@@ -0,0 +1,79 @@
+import time
+
+
+class SessionClock:
+    """SessionTime estimado para o instante do frame, a partir da última amostra recebida"""
+
+    def __init__(self, max_ahead=0.5):
+        # quanto o relógio pode andar sem amostra nova (sim pausado, replay parado)
+        self.max_ahead = max_ahead
+        self._session_time = None
+        self._received = 0.0
+
+    def sync(self, session_time, now=None):
+        self._session_time = session_time
+        self._received = time.perf_counter() if now is None else now
+
+    def now(self, now=None):
+        if self._session_time is None:
+            return None
+        elapsed = (time.perf_counter() if now is None else now) - self._received
+        return self._session_time + min(max(elapsed, 0.0), self.max_ahead)
+
+    def expired(self, now=None):
+        """True quando o relógio já andou `max_ahead` sem amostra nova (o valor parou)"""
+        if self._session_time is None:
+            return True
+        return (time.perf_counter() if now is None else now) - self._received >= self.max_ahead
+
+
+class Extrapolator:
+    """Valores por chave (ex.: gap por CarIdx) estimados como `valor + taxa * dt`
+
+    `dt` é o tempo desde a amostra, limitado a `max_ahead`. Quando chega uma amostra
+    nova, a diferença para o valor que estava sendo exibido some em `blend` segundos;
+    se for maior que `snap`, a amostra nova é usada direto (pit stop, acidente, troca
+    de líder).
+    """
+
+    def __init__(self, max_ahead=0.5, snap=1.0, blend=0.15):
+        self.max_ahead = max_ahead
+        self.snap = snap
+        self.blend = blend
+        self._tracks = {}  # chave -> [valor, taxa, SessionTime da amostra, correção]
+        self.snaps = 0
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def update(self, key, value, rate, session_time):
+        """Nova amostra; `value` None remove a chave (valor não interpolável)"""
+        if value is None:
+            self._tracks.pop(key, None)
+            return
+        correction = 0.0
+        if key in self._tracks:
+            shown = self.value(key, session_time)
+            correction = shown - value
+            if abs(correction) > self.snap:
+                correction = 0.0
+                self.snaps += 1
+        self._tracks[key] = [value, rate, session_time, correction]
+
+    def value(self, key, session_time):
+        track = self._tracks.get(key)
+        if track is None:
+            return None
+        value, rate, sampled, correction = track
+        dt = session_time - sampled
+        if dt <= 0:
+            return value + correction
+        estimate = value + rate * min(dt, self.max_ahead)
+        if correction and dt < self.blend:
+            estimate += correction * (1.0 - dt / self.blend)
+        return estimate
+
+    def retain(self, keys):
+        """Esquece as chaves fora de `keys` (carros que saíram da janela)"""
+        for key in [k for k in self._tracks if k not in keys]:
+            del self._tracks[key]
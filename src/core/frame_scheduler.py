@@ -0,0 +1,135 @@
+import time
+
+from PySide6 import QtCore, QtGui
+
+
+class FrameScheduler(QtCore.QObject):
+    """Entrega os tópicos do TopicBus no ritmo da tela, no máximo uma vez por frame
+
+    O bus guarda só o último valor de cada tópico; a cada frame (taxa do monitor ou
+    `max_fps`) o que estiver pendente vai para os layers de uma vez, e o Qt junta os
+    repaints desses layers num único paint. Pacotes que chegam mais rápido que a tela
+    são descartados (contados em `dropped`), nunca enfileirados. Layers que animam
+    entre pacotes (interpolação) registram um callback chamado a cada frame. Sem
+    pacotes pendentes nem animações o timer para.
+    """
+
+    def __init__(self, bus, max_fps=0, stats_interval=0, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        self.fps = self._display_fps(max_fps)
+        self.interval = 1.0 / self.fps
+        self.stats_interval = stats_interval
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.setInterval(max(1, round(self.interval * 1000)))
+        self._timer.timeout.connect(self._on_frame)
+        self._next_frame = 0.0
+        self._animations = []
+        self._next_frame_calls = []
+
+        self.reset_stats()
+        self._next_stats = time.perf_counter() + stats_interval
+        bus.set_frame_scheduler(self)
+        print(f"[FrameScheduler] {self.fps:.0f} fps")
+
+    @staticmethod
+    def _display_fps(max_fps):
+        screen = QtGui.QGuiApplication.primaryScreen()
+        fps = screen.refreshRate() if screen is not None else 0
+        if not fps or fps <= 0:
+            fps = 60.0
+        if max_fps and max_fps > 0:
+            fps = min(fps, max_fps)
+        return fps
+
+    def reset_stats(self):
+        self.frames = 0
+        self.dropped = 0  # pacotes substituídos por um mais novo antes de aparecer na tela
+        self.late = 0  # frames perdidos porque o event loop atrasou
+        self.age_total = 0.0
+        self.age_max = 0.0
+        self.last_age = 0.0
+
+    def request_frame(self):
+        """Chamado pelo bus quando chega um pacote; liga o timer se estava parado"""
+        if self._timer.isActive():
+            return
+        now = time.perf_counter()
+        # alinha ao próximo frame da grade, sem entregar antes de um intervalo
+        self._next_frame = max(self._next_frame, now)
+        self._timer.start(max(0, round((self._next_frame - now) * 1000)))
+
+    def add_animation(self, callback):
+        """`callback(now)` a cada frame, depois da entrega dos tópicos"""
+        if callback not in self._animations:
+            self._animations.append(callback)
+            self.request_frame()
+
+    def call_next_frame(self, callback):
+        """`callback(now)` uma vez, no próximo frame (junta várias chegadas num só update)"""
+        if callback not in self._next_frame_calls:
+            self._next_frame_calls.append(callback)
+            self.request_frame()
+
+    def remove_animation(self, callback):
+        if callback in self._animations:
+            self._animations.remove(callback)
+
+    def stop(self):
+        self._timer.stop()
+
+    def _on_frame(self):
+        now = time.perf_counter()
+        behind = now - self._next_frame
+        if behind > self.interval:
+            # não tenta recuperar frames perdidos: conta e segue a partir de agora
+            self.late += int(behind / self.interval)
+            self._next_frame = now
+        self._next_frame += self.interval
+
+        stamp = self.bus.pending_stamp()
+        if stamp is None and not self._animations and not self._next_frame_calls:
+            self._timer.stop()  # nada chegou desde o último frame
+            return
+        if stamp is not None:
+            self.dropped += self.bus.flush()
+        calls, self._next_frame_calls = self._next_frame_calls, []
+        for callback in calls + self._animations:
+            try:
+                callback(now)
+            except Exception as e:
+                print(f"[FrameScheduler] Erro no callback do frame: {e}")
+        # próximo tick na grade de frames (o tempo do flush não empurra a grade)
+        self._timer.setInterval(max(1, round((self._next_frame - time.perf_counter()) * 1000)))
+        if stamp is None:
+            return
+
+        # idade do dado que vai aparecer neste frame (desde que chegou ao bus)
+        age = now - stamp
+        self.frames += 1
+        self.last_age = age
+        self.age_total += age
+        self.age_max = max(self.age_max, age)
+
+        if self.stats_interval and now >= self._next_stats:
+            self._next_stats = now + self.stats_interval
+            print(f"[FrameScheduler] {self.format_stats()}")
+
+    def stats(self):
+        return {
+            "fps": self.fps,
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "late": self.late,
+            "avg_age_ms": self.age_total / self.frames * 1000 if self.frames else 0.0,
+            "max_age_ms": self.age_max * 1000,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        return (
+            f"{s['frames']} frames | {s['dropped']} pacotes descartados | {s['late']} frames atrasados | "
+            f"idade média {s['avg_age_ms']:.1f} ms | máx {s['max_age_ms']:.1f} ms"
+        )
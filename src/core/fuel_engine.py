@@ -0,0 +1,164 @@
+import math
+
+import numpy as np
+
+# voltas guardadas para as médias (a maior janela usa só as últimas)
+FUEL_HISTORY = 16
+WINDOW_SHORT = 3
+WINDOW_LONG = 5
+# avanço maior que isso entre duas amostras é teleporte (reset, reboque para o box)
+MAX_JUMP_LAPS = 0.5
+# subida de combustível maior que isso é reabastecimento
+REFUEL_THRESHOLD = 0.1
+# bits de SessionFlags (irsdk.Flags) que tiram a volta da média de bandeira verde
+CAUTION_FLAGS = 0x8 | 0x100 | 0x4000 | 0x8000  # yellow, yellow_waving, caution, caution_waving
+
+
+def _mean(values, valid):
+    count = int(valid.sum())
+    return float(values[valid].sum() / count) if count else math.nan
+
+
+class FuelEngine:
+    """Consumo real por volta e estratégia de combustível do player
+
+    Na linha de chegada (LapDistPct volta para 0) o FuelLevel é interpolado entre as
+    duas amostras e o consumo da volta vai para um ring buffer com a flag de bandeira
+    verde. As médias (3 voltas, 5 voltas, só bandeira verde) são recalculadas só aí,
+    uma vez por volta; por amostra só a posição e o combustível atuais entram nas contas.
+    """
+
+    def __init__(self, history=FUEL_HISTORY):
+        self._usage = np.full(history, np.nan)
+        self._lap_time = np.full(history, np.nan)
+        self._green = np.zeros(history, dtype=bool)
+        self.reset()
+
+    def reset(self):
+        self._usage[:] = np.nan
+        self._lap_time[:] = np.nan
+        self._green[:] = False
+        self.count = 0  # voltas medidas
+        self.last = math.nan
+        self.avg_short = math.nan
+        self.avg_long = math.nan
+        self.avg_green = math.nan
+        self.lap_time = math.nan  # média das voltas verdes (para corrida por tempo)
+        # volta em andamento: combustível e SessionTime na linha (None = não vale)
+        self._start_fuel = None
+        self._start_time = None
+        self._lap_green = True
+        self._pct = None
+        self._time = None
+        self._fuel = None
+
+    def update(self, session_time, lap_dist_pct, fuel_level, on_pit_road=False, flags=0):
+        """Uma amostra do player; fecha a volta na linha de chegada"""
+        prev_pct, prev_time, prev_fuel = self._pct, self._time, self._fuel
+        self._pct, self._time, self._fuel = lap_dist_pct, session_time, fuel_level
+        if prev_time is not None and session_time < prev_time:
+            self.reset()  # sessão nova (ou replay voltou)
+            return
+        if lap_dist_pct is None or lap_dist_pct < 0 or fuel_level is None or prev_pct is None or prev_pct < 0:
+            self._start_fuel = None
+            return
+        if prev_fuel is None or session_time <= prev_time:
+            return
+
+        if fuel_level > prev_fuel + REFUEL_THRESHOLD or on_pit_road:
+            self._start_fuel = None  # reabasteceu ou está no box: a volta não mede consumo
+        if flags & CAUTION_FLAGS:
+            self._lap_green = False
+
+        step = lap_dist_pct - prev_pct
+        wrapped = step < -MAX_JUMP_LAPS
+        if wrapped:
+            step += 1.0
+        if not 0 <= step <= MAX_JUMP_LAPS:
+            self._start_fuel = None  # teleporte ou ré
+            return
+        if not wrapped:
+            return
+
+        # combustível e SessionTime exatos na linha
+        frac = (1.0 - prev_pct) / step
+        line_fuel = prev_fuel + frac * (fuel_level - prev_fuel)
+        line_time = prev_time + frac * (session_time - prev_time)
+        if self._start_fuel is not None and self._start_fuel >= line_fuel:
+            self._finish_lap(self._start_fuel - line_fuel, line_time - self._start_time, self._lap_green)
+        self._start_fuel = None if on_pit_road else line_fuel
+        self._start_time = line_time
+        self._lap_green = not flags & CAUTION_FLAGS
+
+    def _finish_lap(self, used, lap_time, green):
+        slot = self.count % len(self._usage)
+        self._usage[slot] = used
+        self._lap_time[slot] = lap_time
+        self._green[slot] = green
+        self.count += 1
+        self.last = used
+
+        # da mais nova para a mais velha
+        order = (slot - np.arange(min(self.count, len(self._usage)))) % len(self._usage)
+        usage = self._usage[order]
+        valid = np.ones(len(order), dtype=bool)
+        self.avg_short = _mean(usage[:WINDOW_SHORT], valid[:WINDOW_SHORT])
+        self.avg_long = _mean(usage[:WINDOW_LONG], valid[:WINDOW_LONG])
+        green = self._green[order]
+        self.avg_green = _mean(usage, green & (np.cumsum(green) <= WINDOW_LONG))
+        times = self._lap_time[order]
+        self.lap_time = _mean(times, green & (np.cumsum(green) <= WINDOW_SHORT))
+        if math.isnan(self.lap_time):
+            self.lap_time = _mean(times[:WINDOW_SHORT], valid[:WINDOW_SHORT])
+
+    def per_lap(self, fallback=0.0):
+        """Consumo usado na estratégia: bandeira verde > 5 voltas > 3 voltas > `fallback` (FuelUsePerLap)"""
+        for value in (self.avg_green, self.avg_long, self.avg_short):
+            if not math.isnan(value):
+                return value
+        return fallback
+
+    def laps_to_go(self, laps_remaining=None, time_remaining=None):
+        """Voltas que faltam para o player (inclui o resto da volta atual); nan sem dado
+
+        Corrida por voltas: `laps_remaining` inteiras. Por tempo: as voltas que cabem no
+        SessionTimeRemain no ritmo de bandeira verde, mais a volta em que o tempo acaba.
+        """
+        pct = self._pct if self._pct is not None and self._pct >= 0 else 0.0
+        if laps_remaining is not None and laps_remaining > 0:
+            return max(0.0, laps_remaining - pct)
+        if time_remaining is not None and time_remaining >= 0 and self.lap_time > 0:
+            rest = 1.0 - pct
+            after = max(0.0, time_remaining - rest * self.lap_time)
+            return rest + math.ceil(after / self.lap_time)
+        return math.nan
+
+    def strategy(self, fuel_level, capacity, laps_to_go, per_lap):
+        """(combustível até o fim, quanto pôr na próxima parada, paradas, primeira e última volta dela)
+
+        Voltas da janela contadas a partir da atual (0 = nesta volta); None sem parada
+        necessária ou sem dado. Com `capacity` conhecida as paradas são as que o tanque
+        exige (mais de uma quando nem um tanque cheio chega ao fim) e a janela é só a da
+        próxima: a partir da primeira volta em que as paradas restantes bastam. Sem
+        `capacity` as paradas ficam None e a janela começa na volta atual.
+        """
+        if not per_lap > 0 or math.isnan(laps_to_go):
+            return math.nan, math.nan, None, None, None
+        needed = laps_to_go * per_lap
+        refuel = needed - fuel_level
+        if refuel <= 0:
+            return needed, 0.0, 0, None, None
+        latest = int(fuel_level / per_lap)
+        if not (capacity and capacity > 0):
+            return needed, refuel, None, 0, latest
+
+        # parando na última volta possível sobra isso no tanque; o resto da capacidade é o máximo por parada
+        space = capacity - max(0.0, fuel_level - latest * per_lap)
+        stops = math.ceil(refuel / capacity)
+        while True:
+            # cada parada depois da próxima enche o tanque: a próxima não pode ser cedo demais
+            earliest = max(0, math.ceil(laps_to_go - stops * capacity / per_lap))
+            if earliest <= latest:
+                break
+            stops += 1  # com voltas inteiras a janela fechou: precisa de mais uma parada
+        return needed, min(refuel, space), stops, earliest, latest
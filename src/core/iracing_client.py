@@ -2,327 +2,465 @@ from PySide6 import QtCore
 import irsdk
 import threading
 import time
+from core.standings_engine import StandingsEngine
+from core.sector_engine import SectorEngine
+from core.delta_engine import DeltaEngine
+from core.fuel_engine import FuelEngine
+from core.session_cache import SessionCache
+from core.scheduler import TelemetryScheduler
+from core.sdk_access import SdkAccess
+from core.snapshots import SessionSnapshot, FuelSnapshot, CarLRSnapshot, DeltaSnapshot, SectorsSnapshot
+from core.standings_delta import StandingsEncoder
 
 
-def _argb_to_hex(val):
-    """Converte valor ARGB do iRacing em #RRGGBB"""
-    if isinstance(val, int):
-        r = (val >> 16) & 0xFF
-        g = (val >> 8) & 0xFF
-        b = val & 0xFF
-        return f"#{r:02x}{g:02x}{b:02x}"
-    return "#333333"
+def _rounded(value, digits):
+    """Valor arredondado para o snapshot (None se nan)"""
+    return None if value != value else round(float(value), digits)
 
 
-def _format_lap_time(seconds):
-    """Formata tempo de volta em mm:ss.mmm"""
-    if not isinstance(seconds, (int, float)) or seconds <= 0:
-        return "--"
-    minutes = int(seconds // 60)
-    sec = int(seconds % 60)
-    millis = int((seconds * 1000) % 1000)
-    return f"{minutes}:{sec:02d}.{millis:03d}"
+def _rounded_rows(values, digits):
+    """Matriz (carros x setores) como tuplas de tuplas arredondadas (None onde é nan)"""
+    return tuple(tuple(None if v != v else v for v in row) for row in values.round(digits).tolist())
 
 
 class IRacingClient(QtCore.QObject):
     # sinais para o Qt
+    # {produto: snapshot imutável (core.snapshots)}, só com os produtos que mudaram
     data_ready = QtCore.Signal(dict)
-    car_lr_changed = QtCore.Signal(dict)
-
-    def __init__(self, poll_interval=0.5):
+    car_lr_changed = QtCore.Signal(object)
+    # "disconnected" | "idle" (garagem/espectador) | "active" (no carro, na pista)
+    power_state_changed = QtCore.Signal(str)
+
+    def __init__(
+        self,
+        poll_interval=0.5,
+        rates=None,
+        stats_interval=0,
+        reconnect_max_interval=30.0,
+        idle_rate=1,
+        test_file=None,
+    ):
         super().__init__()
+        # o pyirsdk cuida da conexão; os dados são lidos pelo TelemetryReader
         self.ir = irsdk.IRSDK()
+        self.telemetry = None
+        # dump .bin da memória compartilhada (irsdk --dump) para rodar sem o simulador
+        self.test_file = test_file
+        # memória compartilhada e evento data-valid (atributos privados do pyirsdk)
+        self.sdk = SdkAccess(self.ir, test_file)
         self.running = False
+        self._stop_event = threading.Event()
+        # intervalo inicial entre tentativas de conexão; dobra a cada falha até o teto
         self.poll_interval = poll_interval
-        self._last_car_lr = None
-
-        # guarda posição inicial caso não haja qualificação
-        self._starting_positions = {}
+        self.reconnect_max_interval = reconnect_max_interval
+        self._connect_delay = poll_interval
+        self._next_connect = 0.0
+        self.power_state = "disconnected"
+        # log periódico do custo por produto (segundos, 0 = desligado)
+        self.stats_interval = stats_interval
+
+        # standings vetorizado; standings_window = "eu + X players" (0 = todos)
+        self._standings_engine = StandingsEngine()
+        self.standings_window = 0
+        # o tópico "standings" sai como StandingsDiff: snapshot completo e depois só diferenças
+        self._standings_encoder = StandingsEncoder()
+        self._resync_requested = False
+        # tempos de setor de todos os carros; fronteiras do SplitTimeInfo da sessão
+        self._sector_engine = SectorEngine()
+        self._sector_starts = None
+        # último snapshot publicado e os cruzamentos que ele já inclui
+        self._sectors_snapshot = None
+        self._sectors_crossings = None
+        # delta do player para a melhor volta / volta ótima (mesmos setores)
+        self._delta_engine = DeltaEngine()
+        self._delta_sectors = None
+        # consumo medido por volta e estratégia de combustível do player
+        self._fuel_engine = FuelEngine()
+
+        # campos derivados do YAML; o parse roda em background quando SessionInfoUpdate muda
+        self._session_cache = SessionCache()
+
+        # cada produto roda na sua frequência (config.json -> "telemetry_rates")
+        self.scheduler = TelemetryScheduler(rates, idle_rate=idle_rate)
+        self.scheduler.add("car_lr", self._get_car_lr)
+        # antes do standings: no tick em que os dois vencem, o standings já vê a passagem
+        self.scheduler.add("timing", self._update_timing)
+        self.scheduler.add("standings", self._get_standings)
+        self.scheduler.add("fuel", self._get_fuel)
+        self.scheduler.add("session", self._get_session_info)
+        self.scheduler.add("delta", self._get_delta)
+        self.scheduler.add("sectors", self._get_sectors)
+        # tópicos assinados no TopicBus (None = calcula tudo); aplicado na thread de polling
+        self._demand = None
+        self._applied_demand = None
+
+        # controle de ticks: só recalcula quando o iRacing publicou dado novo
+        self._last_tick = None
+        self._last_data_key = None
+        self.ticks_processed = 0
+        self.ticks_skipped = 0
 
     def start(self):
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self.loop, daemon=True)
         self.thread.start()
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
+        self._session_cache.stop()
+
+    def wait(self, timeout=2.0):
+        """Espera a thread de polling terminar (chamar depois de `stop`)"""
+        thread = getattr(self, "thread", None)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        return thread is None or not thread.is_alive()
 
     def loop(self):
+        next_stats = time.perf_counter() + self.stats_interval
+        idle = False
         while self.running:
-            if not self.ir.is_initialized:
-                self.ir.startup()
-
-            if self.ir.is_initialized and self.ir.is_connected:
-                self.ir.freeze_var_buffer_latest()
-
-                packet = {
-                    "standings": self._get_standings(),
-                    "session": self._get_session_info(),
-                    "fuel": self._get_fuel(),
-                    "car_lr": self._get_car_lr(),
-                }
-
-                try:
-                    self.data_ready.emit(packet)
-                except RuntimeError:
-                    self.running = False
-                    break
-
-                if packet["car_lr"] != self._last_car_lr:
-                    self._last_car_lr = packet["car_lr"]
-                    try:
-                        self.car_lr_changed.emit(packet["car_lr"])
-                    except RuntimeError:
+            if not self.ir.is_initialized and not self._try_connect():
+                continue
+
+            if not self.ir.is_connected:
+                self._on_disconnect()
+                continue
+
+            self._wait_for_data(idle)
+            idle = False
+
+            self._apply_requests()
+            now = time.perf_counter()
+            if now >= self.scheduler.next_due():
+                # um único freeze por tick, compartilhado por todos os produtos vencidos
+                if self._has_new_data():
+                    self.ticks_processed += 1
+                    self._update_power_state()
+                    packet = self.scheduler.run_due(now)
+                    if "standings" in packet:
+                        packet["standings"] = self._standings_encoder.encode(
+                            packet["standings"], float(self.telemetry["SessionTime"] or 0.0)
+                        )
+
+                    if packet and not self._publish(packet):
                         self.running = False
                         break
+                else:
+                    # pausado, garagem, replay parado: nada mudou, nada a recalcular
+                    self.ticks_skipped += 1
+                    idle = True
+
+            if self.stats_interval and now >= next_stats:
+                next_stats = now + self.stats_interval
+                print(
+                    f"[IRacingClient] Ticks processados: {self.ticks_processed} | "
+                    f"ignorados: {self.ticks_skipped}\n" + self.scheduler.format_stats()
+                )
+
+    def set_demand(self, topics):
+        """Tópicos com pelo menos um assinante (chamado pela thread do Qt)"""
+        self._demand = None if topics is None else frozenset(topics)
+
+    def request_resync(self):
+        """Um consumidor perdeu a sequência de diffs: o próximo standings sai completo"""
+        self._resync_requested = True
+
+    def _apply_requests(self):
+        """Aplica, na thread de polling, pedidos feitos pela thread do Qt"""
+        demand = self._demand
+        if demand != self._applied_demand:
+            self._applied_demand = demand
+            if demand is not None and "standings" in demand:
+                demand = demand | {"timing"}  # o standings lê os tempos de passagem gravados
+            self.scheduler.set_demand(demand)
+
+        if self._resync_requested:
+            self._resync_requested = False
+            self._standings_encoder.resync()
+            # garante que o produto emita mesmo sem mudança nas linhas
+            self.scheduler.products["standings"].last_value = None
+
+    def _try_connect(self):
+        """Tenta conectar respeitando o backoff exponencial; True se conectou"""
+        now = time.perf_counter()
+        if now < self._next_connect:
+            self._stop_event.wait(self._next_connect - now)
+            return False
+
+        if self.ir.startup(test_file=self.test_file):
+            # headers das variáveis resolvidos uma vez por conexão
+            self.telemetry = self.sdk.open_reader()
+            # conectou: próxima queda volta a tentar no intervalo inicial
+            self._connect_delay = self.poll_interval
+            return True
+
+        self._set_power_state("disconnected")
+        self._next_connect = now + self._connect_delay
+        self._connect_delay = min(self._connect_delay * 2, self.reconnect_max_interval)
+        return False
+
+    def _on_disconnect(self):
+        """iRacing fechou ou saiu da sessão: libera a memória e entra em modo desconectado"""
+        self.telemetry = None
+        self.ir.shutdown()
+        self.sdk.close()
+        # nova conexão pode reiniciar o contador SessionInfoUpdate
+        self._session_cache.invalidate()
+        # passagens, histórico de voltas, grid memorizado e taxas da sessão anterior
+        self._standings_engine.reset()
+        self._sector_engine.reset()
+        self._sectors_snapshot = None
+        self._delta_engine.reset()
+        self._fuel_engine.reset()
+        self.scheduler.reset()
+        self._last_tick = None
+        self._last_data_key = None
+        self._set_power_state("disconnected")
+        self._next_connect = time.perf_counter() + self._connect_delay
+
+    def _update_power_state(self):
+        """Garagem ou espectador (IsOnTrack/IsOnTrackCar falsos) derrubam a frequência"""
+        on_track = bool(self.telemetry["IsOnTrack"]) and bool(self.telemetry["IsOnTrackCar"])
+        self._set_power_state("active" if on_track else "idle")
+
+    def _set_power_state(self, state):
+        if state == self.power_state:
+            return
+        self.power_state = state
+        self.scheduler.set_idle(state != "active")
+        try:
+            self.power_state_changed.emit(state)
+        except RuntimeError:
+            self.running = False
 
-            time.sleep(self.poll_interval)
+    def _publish(self, packet):
+        """Entrega os produtos que mudaram; False se o lado Qt já foi destruído"""
+        try:
+            self.data_ready.emit(packet)
+            if "car_lr" in packet:
+                self.car_lr_changed.emit(packet["car_lr"])
+        except RuntimeError:
+            return False
+        return True
+
+    def _wait_for_data(self, idle=False):
+        """Espera o iRacing publicar dado novo em vez de dormir um intervalo fixo"""
+        if idle:
+            # último tick não trouxe nada novo: não gira em falso até o próximo
+            time.sleep(self.scheduler.min_interval())
+        elif not self.scheduler.idle and self.scheduler.has_demand() and self.sdk.can_wait():
+            # evento data-valid do SDK: acorda assim que o sim escreve (timeout de 32 ms)
+            self.sdk.wait_for_data()
+        else:
+            # arquivo de teste / sem evento: dorme até o próximo produto vencer
+            time.sleep(max(0.0, self.scheduler.next_due() - time.perf_counter()))
+
+    def _has_new_data(self):
+        """Congela o tick novo do SDK; True se SessionTick (ou o YAML da sessão) mudou"""
+        tick = self.telemetry.latest_tick()
+        if tick == self._last_tick:
+            return False
+        self._last_tick = tick
+        self.telemetry.freeze()
+
+        # o buffer continua sendo reescrito com o sim pausado; SessionTick não anda
+        data_key = (self.telemetry["SessionTick"], self.telemetry.session_info_update)
+        if data_key == self._last_data_key:
+            return False
+        self._last_data_key = data_key
+        return True
 
     # -------------------
     # Standings
     # -------------------
     def _get_standings(self):
-        data = []
         try:
-            drivers_info = self.ir["DriverInfo"]
-            if not drivers_info or "Drivers" not in drivers_info:
-                return []
-
-            drivers = drivers_info["Drivers"] or []
-            positions = self.ir["CarIdxPosition"] or []
-            qual_pos = self.ir["CarIdxQualPosition"] or []
-            last_laps = self.ir["CarIdxLastLapTime"] or []
-            incidents = self.ir["CarIdxIncidentCount"] or []
-            lap_dist_pct = self.ir["CarIdxLapDistPct"] or []
-            session_time = self.ir["SessionTime"] or 0.0
-
-            # identifica índice do líder
-            leader_idx = None
-            if positions:
-                try:
-                    leader_idx = positions.index(1)
-                except ValueError:
-                    leader_idx = None
-
-            for drv in drivers:
-                name = drv.get("UserName")
-                car_idx = drv.get("CarIdx")
-                if name is None or car_idx is None:
-                    continue
-
-                # posição atual
-                pos = positions[car_idx] if car_idx < len(positions) else 0
-                if pos <= 0:
-                    pos = car_idx + 1  # fallback
-
-                # grid inicial
-                grid = None
-                if "StartingGridPosition" in drv and drv["StartingGridPosition"] > 0:
-                    grid = drv["StartingGridPosition"]
-                elif car_idx < len(qual_pos) and qual_pos[car_idx] > 0:
-                    grid = qual_pos[car_idx]
-                elif "QualPosition" in drv and drv["QualPosition"] > 0:
-                    grid = drv["QualPosition"]
-                elif car_idx in self._starting_positions:
-                    grid = self._starting_positions[car_idx]
-                else:
-                    self._starting_positions[car_idx] = pos
-                    grid = pos
+            static = self._session_cache.get(self.telemetry)
+            if not len(static.drivers):
+                return ()
+
+            ir = self.telemetry
+            frame = self._standings_engine.compute(
+                static.drivers,
+                positions=ir["CarIdxPosition"],
+                qual_pos=ir["CarIdxQualPosition"],
+                last_laps=ir["CarIdxLastLapTime"],
+                incidents=ir["CarIdxIncidentCount"],
+                lap_dist_pct=ir["CarIdxLapDistPct"],
+                session_time=ir["SessionTime"] or 0.0,
+                laps=ir["CarIdxLap"],
+                est_time=ir["CarIdxEstTime"],
+                f2_time=ir["CarIdxF2Time"],
+                laps_completed=ir["CarIdxLapCompleted"],
+                on_pit_road=ir["CarIdxOnPitRoad"],
+            )
+
+            # só formata as linhas que o layer vai exibir
+            return frame.format_window(ir["PlayerCarIdx"], self.standings_window)
+        except Exception as e:
+            print("[IRacingClient] Erro standings:", e)
+            return ()
 
-                # calcula delta
-                if grid and grid > 0 and pos > 0:
-                    pos_gain = grid - pos
-                else:
-                    pos_gain = 0
-
-                # gap em tempo real
-                gap = "---"
-                if (
-                    leader_idx is not None
-                    and car_idx < len(lap_dist_pct)
-                    and leader_idx < len(lap_dist_pct)
-                ):
-                    leader_pct = lap_dist_pct[leader_idx]
-                    my_pct = lap_dist_pct[car_idx]
-
-                    leader_pos = positions[leader_idx] if leader_idx < len(positions) else 0
-                    my_pos = positions[car_idx] if car_idx < len(positions) else 0
-                    lap_diff = leader_pos - my_pos
-
-                    if pos == 1:
-                        gap = "Líder"
-                    elif lap_diff > 0:
-                        gap = f"+{lap_diff} volta{'s' if lap_diff > 1 else ''}"
-                    else:
-                        leader_time = session_time - (1 - leader_pct) * (last_laps[leader_idx] or 0)
-                        my_time = session_time - (1 - my_pct) * (last_laps[car_idx] or 0)
-                        if leader_time and my_time:
-                            diff = my_time - leader_time
-                            gap = f"+{diff:.1f}s"
-
-                # última volta
-                last_val = last_laps[car_idx] if car_idx < len(last_laps) else -1
-                last = _format_lap_time(last_val)
-
-                # incidentes
-                inc_val = incidents[car_idx] if car_idx < len(incidents) else 0
-
-                # licença
-                lic_str = drv.get("LicString", "--")
-                lic_color = _argb_to_hex(drv.get("LicColor"))
-
-                # classe
-                class_id = drv.get("CarClassID")
-                class_color = _argb_to_hex(drv.get("CarClassColor"))
-
-                # carro
-                car_num = drv.get("CarNumberRaw", "--")
-                car_logo = None
-                if "CarPath" in drv:
-                    car_logo = f"assets/cars/{drv['CarPath']}.png"
-
-                # país
-                country = drv.get("Country") or drv.get("ClubName", "") or ""
-
-                data.append(
-                    {
-                        "id": car_idx,
-                        "pos": pos,
-                        "pos_gain": pos_gain,
-                        "driver": name,
-                        "car_number": car_num,
-                        "car_logo": car_logo,
-                        "license": lic_str,
-                        "license_color": lic_color,
-                        "class_id": class_id,
-                        "class_color": class_color,
-                        "irating": drv.get("IRating", 0),
-                        "ir_delta": "",
-                        "last_lap": last,
-                        "gap": gap,
-                        "incidents": inc_val,
-                        "country": country,
-                    }
-                )
+    def _update_timing(self):
+        """Grava as passagens de todos os carros a cada tick (entre um standings e outro)"""
+        try:
+            ir = self.telemetry
+            self._standings_engine.timing.update(ir["SessionTime"] or 0.0, ir["CarIdxLap"], ir["CarIdxLapDistPct"])
+        except Exception as e:
+            print("[IRacingClient] Erro timing:", e)
+        return None
 
-            data.sort(key=lambda d: d["pos"])
+    # -------------------
+    # Setores
+    # -------------------
+    def _get_sectors(self):
+        try:
+            ir = self.telemetry
+            engine = self._sector_engine
+            sectors = self._session_cache.get(ir).sectors
+            if sectors and sectors != self._sector_starts:
+                self._sector_starts = sectors
+                engine.set_boundaries(sectors)
+                self._sectors_snapshot = None
+            engine.update(ir["SessionTime"] or 0.0, ir["CarIdxLap"], ir["CarIdxLapDistPct"], ir["CarIdxOnPitRoad"])
+
+            # os tempos só mudam quando algum carro cruza uma fronteira: sem cruzamento, mesmo snapshot
+            if self._sectors_snapshot is None or engine.crossings != self._sectors_crossings:
+                self._sectors_crossings = engine.crossings
+                self._sectors_snapshot = SectorsSnapshot(
+                    starts=tuple(engine.starts.tolist()),
+                    last=_rounded_rows(engine.last, 3),
+                    best=_rounded_rows(engine.best, 3),
+                    last_done=tuple(engine.last_done.tolist()),
+                )
+            return self._sectors_snapshot
         except Exception as e:
-            print("[IRacingClient] Erro standings:", e)
+            print("[IRacingClient] Erro setores:", e)
+            return None
 
-        return data
+    # -------------------
+    # Delta
+    # -------------------
+    def _get_delta(self):
+        try:
+            ir = self.telemetry
+            sectors = self._session_cache.get(ir).sectors
+            if sectors and sectors != self._delta_sectors:
+                self._delta_sectors = sectors
+                self._delta_engine.set_sectors(sectors)
+
+            pct = ir["LapDistPct"]
+            engine = self._delta_engine
+            engine.update(
+                ir["SessionTime"] or 0.0,
+                float(pct) if isinstance(pct, (int, float)) else None,
+                bool(ir["OnPitRoad"]),
+            )
+            return DeltaSnapshot(
+                delta=_rounded(engine.delta, 2),
+                delta_optimal=_rounded(engine.delta_optimal, 2),
+                predicted=_rounded(engine.predicted, 3),
+                best=_rounded(engine.best_lap, 3),
+                optimal=_rounded(engine.optimal_lap, 3),
+            )
+        except Exception as e:
+            print("[IRacingClient] Erro delta:", e)
+            return None
 
     # -------------------
     # Session Info
     # -------------------
     def _get_session_info(self):
         try:
-            session_info = self.ir["SessionInfo"] or {}
-            weekend_info = self.ir["WeekendInfo"] or {}
-
-            sof_general = 0
-            class_sof = {}
-            laps_total = 0
-            laps_completed = 0
-            session_length_str = "--"
-            remain_str = None
+            static = self._session_cache.get(self.telemetry)
 
-            if session_info and "Sessions" in session_info:
-                sessions = session_info["Sessions"]
-                if sessions and isinstance(sessions, list):
-                    first_session = sessions[0]
-
-                    sof_general = first_session.get("StrengthOfField", 0)
-                    laps_total = first_session.get("SessionLaps", 0)
-                    laps_completed = first_session.get("ResultsLapsComplete", 0)
-
-                    results = first_session.get("ResultsPositions", [])
-                    if results and isinstance(results, list):
-                        for pos in results:
-                            class_id = pos.get("CarClassID")
-                            sof_val = pos.get("StrengthOfField")
-                            if class_id and sof_val:
-                                class_sof[class_id] = sof_val
-
-                    if laps_total and laps_total > 0:
-                        session_length_str = f"{laps_completed}/{laps_total} voltas"
+            remain_str = None
+            if static.laps_total <= 0:
+                time_remain = self.telemetry["SessionTimeRemain"] or 0
+                if isinstance(time_remain, (int, float)) and time_remain > 0:
+                    h = int(time_remain // 3600)
+                    m = int((time_remain % 3600) // 60)
+                    s = int(time_remain % 60)
+                    if h > 0:
+                        remain_str = f"{h}:{m:02d}:{s:02d}"
                     else:
-                        session_time_total = first_session.get("SessionTime", 0)
-                        if isinstance(session_time_total, (int, float)) and session_time_total > 0:
-                            h = int(session_time_total // 3600)
-                            m = int((session_time_total % 3600) // 60)
-                            if h > 0:
-                                session_length_str = f"{h}h{m:02d}m"
-                            else:
-                                session_length_str = f"{m}m"
-
-                        time_remain = self.ir["SessionTimeRemain"] or 0
-                        if isinstance(time_remain, (int, float)) and time_remain > 0:
-                            h = int(time_remain // 3600)
-                            m = int((time_remain % 3600) // 60)
-                            s = int(time_remain % 60)
-                            if h > 0:
-                                remain_str = f"{h}:{m:02d}:{s:02d}"
-                            else:
-                                remain_str = f"{m:02d}:{s:02d}"
-
-            track_temp = 0
-            if weekend_info and "TrackSurfaceTemp" in weekend_info:
-                raw_temp = weekend_info["TrackSurfaceTemp"]
-                if isinstance(raw_temp, str):
-                    try:
-                        track_temp = float(raw_temp.split()[0])
-                    except Exception:
-                        track_temp = 0
-                elif isinstance(raw_temp, (int, float)):
-                    track_temp = raw_temp
-
-            my_id = self.ir["PlayerCarIdx"]
-
-            return {
-                "sof": sof_general,
-                "class_sof": class_sof,
-                "session_length": session_length_str,
-                "time_remain": remain_str,
-                "track_temp": f"{track_temp:.1f} °C" if isinstance(track_temp, (int, float)) else "--",
-                "my_driver_id": my_id,
-            }
+                        remain_str = f"{m:02d}:{s:02d}"
+
+            return SessionSnapshot(
+                sof=static.sof,
+                class_sof=static.class_sof,
+                session_length=static.session_length,
+                time_remain=remain_str,
+                track_temp=static.track_temp,
+                my_driver_id=self.telemetry["PlayerCarIdx"],
+            )
         except Exception as e:
             print("[IRacingClient] Erro sessão:", e)
-            return {}
+            return None
 
     # -------------------
     # Fuel Info
     # -------------------
     def _get_fuel(self):
         try:
-            level = self.ir["FuelLevel"]
-            cap = self.ir["FuelCapacity"]
-            use_per_lap = self.ir["FuelUsePerLap"]
-            laps_rem = 0
-
-            if (
-                isinstance(level, (int, float))
-                and isinstance(use_per_lap, (int, float))
-                and use_per_lap > 0
-            ):
-                laps_rem = int(level / use_per_lap)
-
-            return {
-                "level": float(level) if isinstance(level, (int, float)) else 0,
-                "capacity": float(cap) if isinstance(cap, (int, float)) else 0,
-                "use_per_lap": float(use_per_lap) if isinstance(use_per_lap, (int, float)) else 0,
-                "laps": laps_rem,
-            }
+            ir = self.telemetry
+            static = self._session_cache.get(ir)
+            level = ir["FuelLevel"]
+            level = float(level) if isinstance(level, (int, float)) else None
+            cap = ir["FuelCapacity"]
+            cap = float(cap) if isinstance(cap, (int, float)) and cap > 0 else static.fuel_capacity
+            use_per_lap = ir["FuelUsePerLap"]
+            pct = ir["LapDistPct"]
+
+            engine = self._fuel_engine
+            engine.update(
+                ir["SessionTime"] or 0.0,
+                float(pct) if isinstance(pct, (int, float)) else None,
+                level,
+                bool(ir["OnPitRoad"]),
+                ir["SessionFlags"] or 0,
+            )
+            # medido nas voltas; FuelUsePerLap do iRacing até a primeira volta completa
+            per_lap = engine.per_lap(float(use_per_lap) if isinstance(use_per_lap, (int, float)) else 0.0)
+            level = level or 0.0
+            laps_rem = int(level / per_lap) if per_lap > 0 else 0
+
+            completed = ir["LapCompleted"] or 0
+            laps_remaining = static.laps_total - completed if static.laps_total > 0 else None
+            laps_to_go = engine.laps_to_go(laps_remaining, ir["SessionTimeRemain"])
+            to_finish, refuel, stops, pit_first, pit_last = engine.strategy(level, cap, laps_to_go, per_lap)
+            # janela em número de volta: a atual é completed + 1
+            lap_now = max(completed, 0) + 1
+
+            return FuelSnapshot(
+                level=level,
+                capacity=cap,
+                use_per_lap=round(per_lap, 3),
+                laps=laps_rem,
+                last=_rounded(engine.last, 3),
+                avg_3=_rounded(engine.avg_short, 3),
+                avg_5=_rounded(engine.avg_long, 3),
+                avg_green=_rounded(engine.avg_green, 3),
+                laps_to_go=_rounded(laps_to_go, 1),
+                to_finish=_rounded(to_finish, 1),
+                refuel=_rounded(refuel, 1),
+                stops=stops,
+                pit_first=None if pit_first is None else lap_now + pit_first,
+                pit_last=None if pit_last is None else lap_now + pit_last,
+            )
         except Exception as e:
             print("[IRacingClient] Erro fuel:", e)
-            return {}
+            return None
 
     # -------------------
     # Car Left/Right
     # -------------------
     def _get_car_lr(self):
         try:
-            val = self.ir["CarLeftRight"]
+            val = self.telemetry["CarLeftRight"]
 
             status_map = {
                 0: "none",
@@ -333,7 +471,7 @@ class IRacingClient(QtCore.QObject):
             }
 
             status = status_map.get(val, "none")
-            return {"val": val, "status": status}
+            return CarLRSnapshot(val, status)
         except Exception as e:
             print(f"[ERROR CarLR] {e}")
-            return {"val": 0, "status": "none"}
+            return CarLRSnapshot()
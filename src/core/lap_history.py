@@ -0,0 +1,147 @@
+import numpy as np
+
+# iRacing sempre publica os arrays CarIdx* com 64 posições
+MAX_CARS = 64
+# voltas guardadas por carro: 24 h de voltas de 42 s (86400 / 42 ≈ 2057); memória fixa (~2 MB com 64 carros)
+LAP_CAPACITY = 2100
+# voltas na média móvel padrão
+PACE_LAPS = 5
+# CarIdxLastLapTime chega alguns ticks depois do CarIdxLapCompleted; espera no máximo isso
+PENDING_S = 3.0
+
+
+def _by_car(values, size, fill, dtype):
+    """Array do iRacing (ou None) com exatamente `size` posições, completando com `fill`"""
+    out = np.full(size, fill, dtype=dtype)
+    if values is not None:
+        arr = np.asarray(values, dtype=dtype)[:size]
+        out[: len(arr)] = arr
+    return out
+
+
+class LapHistory:
+    """Histórico de voltas de todos os carros em ring buffers de tamanho fixo
+
+    Cada volta completada (CarIdxLapCompleted avançou uma volta e CarIdxLastLapTime
+    trouxe o tempo) grava tempo, se passou pelo box e os incidentes da volta na
+    posição `count % capacity` do carro. Melhor volta e ritmo do stint são mantidos
+    incrementalmente na gravação; a média das últimas N voltas lê só N colunas.
+    """
+
+    def __init__(self, capacity=LAP_CAPACITY, max_cars=MAX_CARS):
+        self.capacity = capacity
+        self.max_cars = max_cars
+        self.times = np.full((max_cars, capacity), np.nan)
+        self.lap = np.full((max_cars, capacity), -1, dtype=np.int32)
+        self.pit = np.zeros((max_cars, capacity), dtype=bool)
+        self.incidents = np.zeros((max_cars, capacity), dtype=np.int16)
+        self.count = np.zeros(max_cars, dtype=np.int64)  # voltas gravadas (não limitado à capacidade)
+        self.best = np.full(max_cars, np.nan)
+        self.best_lap = np.full(max_cars, -1, dtype=np.int32)
+        # stint atual: voltas limpas desde a última passagem pelo box
+        self.stint_sum = np.zeros(max_cars)
+        self.stint_laps = np.zeros(max_cars, dtype=np.int64)
+        # início de cada carro nos arrays achatados (consultas com um único take)
+        self._row_base = np.arange(max_cars)[:, None] * capacity
+
+        # volta em andamento
+        self._completed = np.full(max_cars, -1, dtype=np.int64)
+        self._lap_pit = np.zeros(max_cars, dtype=bool)
+        self._lap_start_inc = np.full(max_cars, -1, dtype=np.int64)
+        # volta fechada esperando o CarIdxLastLapTime novo
+        self._pending = np.zeros(max_cars, dtype=bool)
+        self._pending_since = np.zeros(max_cars)
+        self._pending_lap = np.zeros(max_cars, dtype=np.int64)
+        self._pending_pit = np.zeros(max_cars, dtype=bool)
+        self._pending_inc = np.zeros(max_cars, dtype=np.int64)
+        self._last_time = np.full(max_cars, np.nan)
+        self._session_time = None
+
+    def reset(self):
+        self.__init__(self.capacity, self.max_cars)
+
+    def update(self, session_time, laps_completed, last_lap_times, on_pit_road=None, incidents=None):
+        """Detecta voltas completadas desde a amostra anterior e grava as que já têm tempo"""
+        if self._session_time is not None and session_time < self._session_time:
+            self.reset()  # sessão nova (ou replay voltou)
+        self._session_time = session_time
+
+        size = self.max_cars
+        completed = _by_car(laps_completed, size, -1, np.int64)
+        last_time = _by_car(last_lap_times, size, -1.0, np.float64)
+        pit = _by_car(on_pit_road, size, False, bool)
+        inc = _by_car(incidents, size, -1, np.int64)
+
+        step = completed - self._completed
+        closed = (step == 1) & (self._completed >= 0)
+        if closed.any():
+            cars = np.flatnonzero(closed)
+            # uma volta nova antes do tempo da anterior chegar: a anterior fica sem tempo
+            self._store(cars[self._pending[cars]], np.full(self._pending[cars].sum(), np.nan))
+            self._pending[cars] = True
+            self._pending_since[cars] = session_time
+            self._pending_lap[cars] = completed[cars]
+            self._pending_pit[cars] = self._lap_pit[cars]
+            started = self._lap_start_inc[cars]
+            self._pending_inc[cars] = np.where((started >= 0) & (inc[cars] >= started), inc[cars] - started, 0)
+            self._lap_pit[cars] = pit[cars]
+            self._lap_start_inc[cars] = inc[cars]
+        # saiu do mundo, reconectou ou pulou voltas: recomeça a contagem sem gravar
+        lost = (step != 0) & ~closed
+        self._lap_pit[lost] = pit[lost]
+        self._lap_start_inc[lost] = inc[lost]
+        self._completed = completed
+        # a amostra do cruzamento já é da volta nova
+        self._lap_pit |= pit
+
+        if self._pending.any():
+            arrived = self._pending & (last_time != self._last_time) & (last_time > 0)
+            late = self._pending & ~arrived & (session_time - self._pending_since >= PENDING_S)
+            # tempo igual ao da volta anterior: só dá para saber esperando
+            ready = np.flatnonzero(arrived | late)
+            if len(ready):
+                self._store(ready, np.where(last_time[ready] > 0, last_time[ready], np.nan))
+        self._last_time = last_time
+
+    def _store(self, cars, times):
+        """Grava a volta pendente de `cars` com `times` (nan = sem tempo válido)"""
+        if not len(cars):
+            return
+        slot = self.count[cars] % self.capacity
+        pit = self._pending_pit[cars]
+        self.times[cars, slot] = times
+        self.lap[cars, slot] = self._pending_lap[cars]
+        self.pit[cars, slot] = pit
+        self.incidents[cars, slot] = np.minimum(self._pending_inc[cars], np.iinfo(np.int16).max)
+        self.count[cars] += 1
+        self._pending[cars] = False
+
+        clean = ~pit & ~np.isnan(times)
+        better = clean & ~(times >= self.best[cars])
+        self.best[cars[better]] = times[better]
+        self.best_lap[cars[better]] = self._pending_lap[cars[better]]
+        # volta de box fecha o stint; as voltas limpas seguintes abrem o próximo
+        self.stint_sum[cars[pit]] = 0.0
+        self.stint_laps[cars[pit]] = 0
+        self.stint_sum[cars[clean]] += times[clean]
+        self.stint_laps[cars[clean]] += 1
+
+    def recent(self, n):
+        """(tempos, válidas) das últimas `n` voltas de cada carro, da mais nova para a mais velha"""
+        back = np.arange(min(n, self.capacity))
+        flat = self._row_base + (self.count[:, None] - 1 - back) % self.capacity
+        times = self.times.take(flat)
+        # slots ainda não gravados já são nan
+        valid = ~self.pit.take(flat) & (times == times)
+        return times, valid
+
+    def average(self, n=PACE_LAPS):
+        """Média das voltas limpas entre as últimas `n` de cada carro (nan sem nenhuma)"""
+        times, valid = self.recent(n)
+        laps = valid.sum(axis=1)
+        total = np.where(valid, times, 0.0).sum(axis=1)
+        return total / np.where(laps > 0, laps, np.nan)
+
+    def stint_pace(self):
+        """Média das voltas limpas do stint atual de cada carro (nan sem nenhuma)"""
+        return np.where(self.stint_laps > 0, self.stint_sum / np.maximum(self.stint_laps, 1), np.nan)
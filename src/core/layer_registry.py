@@ -0,0 +1,77 @@
+import importlib
+from importlib.metadata import entry_points
+
+# grupo de entry points para layers de terceiros: "meu_layer = pacote.modulo:Classe"
+ENTRY_POINT_GROUP = "m_overlay.layers"
+
+# layers embutidos: id -> "módulo:Classe" (o módulo só é importado quando o layer é ativado)
+BUILTIN_LAYERS = {
+    "standings": "layers.standings_layer:StandingsLayer",
+    "fuel": "layers.fuel_layer:FuelLayer",
+    "car_lr": "layers.car_lr_layer:CarLRLayer",
+    "twitchchat": "layers.twitch_chat_layer:TwitchChatLayer",
+    "chat": "layers.chat_layer:ChatLayer",
+    "delta": "layers.delta_layer:DeltaLayer",
+}
+
+
+class LayerRegistry:
+    """Mapa id do layer -> classe, importada só no primeiro uso
+
+    Assim o QtWebEngine (chat da Twitch) e layers desmarcados não são importados na
+    inicialização. Pacotes instalados podem registrar layers pelo grupo de entry
+    points ENTRY_POINT_GROUP.
+    """
+
+    def __init__(self, builtin=None):
+        self._targets = dict(BUILTIN_LAYERS if builtin is None else builtin)
+        self._classes = {}
+        self._plugins_loaded = False
+
+    def register(self, layer_id, target):
+        """`target` é "módulo:Classe" ou a própria classe"""
+        self._targets[layer_id] = target
+        self._classes.pop(layer_id, None)
+
+    def ids(self):
+        self._load_plugins()
+        return list(self._targets)
+
+    def get(self, layer_id):
+        """Classe do layer (importa na primeira chamada); None se não existe ou falhou"""
+        cls = self._classes.get(layer_id)
+        if cls is not None:
+            return cls
+        self._load_plugins()
+        target = self._targets.get(layer_id)
+        if target is None:
+            return None
+        try:
+            cls = self._import(target)
+        except Exception as e:
+            print(f"[LayerRegistry] Erro importando layer {layer_id} ({target}): {e}")
+            return None
+        self._classes[layer_id] = cls
+        return cls
+
+    @staticmethod
+    def _import(target):
+        if not isinstance(target, str):
+            return target.load() if hasattr(target, "load") else target
+        module_name, _, attr = target.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+    def _load_plugins(self):
+        # só lê os metadados dos pacotes; o módulo do plugin é importado no get()
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        try:
+            eps = entry_points()
+            group = eps.select(group=ENTRY_POINT_GROUP) if hasattr(eps, "select") else eps.get(ENTRY_POINT_GROUP, ())
+        except Exception as e:
+            print(f"[LayerRegistry] Erro lendo entry points: {e}")
+            return
+        for ep in group:
+            # layers embutidos têm prioridade
+            self._targets.setdefault(ep.name, ep)
@@ -0,0 +1,155 @@
+import time
+
+# frequência de cada produto em Hz; 0 = "só quando muda" (avaliado a cada tick, emitido se diferente)
+DEFAULT_RATES = {
+    "car_lr": 60,
+    "standings": 4,
+    "fuel": 1,
+    "session": 0,
+    # tempos de passagem do standings (core.timing_engine); não publica nada
+    "timing": 60,
+    # delta do player para a melhor volta (core.delta_engine)
+    "delta": 60,
+    # tempos de setor de todos os carros (core.sector_engine); só roda com assinante
+    "sectors": 60,
+}
+
+
+class Product:
+    """Um dado derivado da telemetria, com frequência própria e custo medido"""
+
+    __slots__ = (
+        "name", "fn", "base_interval", "interval", "next_due", "last_value", "active", "runs", "emits", "total",
+        "max",
+    )
+
+    def __init__(self, name, fn, rate):
+        self.name = name
+        self.fn = fn
+        self.base_interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.interval = self.base_interval
+        self.next_due = 0.0
+        self.last_value = None
+        # só calculado enquanto algum layer assina o tópico
+        self.active = True
+        self.runs = 0
+        self.emits = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class TelemetryScheduler:
+    """Roda cada produto na sua frequência, todos a partir do mesmo freeze do var buffer"""
+
+    def __init__(self, rates=None, idle_rate=1):
+        self.rates = dict(DEFAULT_RATES)
+        self.rates.update(rates or {})
+        # frequência máxima de qualquer produto no modo ocioso (garagem/espectador)
+        self.idle_rate = idle_rate
+        self.idle = False
+        self.products = {}
+        # próximo tick quando nenhum produto está ativo
+        self._unsubscribed_due = 0.0
+        self._started = time.perf_counter()
+
+    def add(self, name, fn):
+        self.products[name] = Product(name, fn, self.rates.get(name, 0))
+
+    def reset(self):
+        """Força todos os produtos a rodar (e emitir) no próximo tick"""
+        self._unsubscribed_due = 0.0
+        for product in self.products.values():
+            product.next_due = 0.0
+            product.last_value = None
+
+    def set_demand(self, names):
+        """Ativa só os produtos em `names` (None = todos); quem volta roda e emite no próximo tick"""
+        for name, product in self.products.items():
+            active = names is None or name in names
+            if active and not product.active:
+                product.next_due = 0.0
+                product.last_value = None
+            product.active = active
+
+    def set_idle(self, idle):
+        """Modo ocioso limita todos os produtos a `idle_rate`; ao sair, volta na hora"""
+        if idle == self.idle:
+            return
+        self.idle = idle
+        for product in self.products.values():
+            if product.base_interval and idle:
+                product.interval = max(product.base_interval, 1.0 / self.idle_rate)
+            else:
+                product.interval = product.base_interval
+            product.next_due = 0.0
+
+    def next_due(self):
+        """Instante (perf_counter) do próximo tick"""
+        active = [p for p in self.products.values() if p.active]
+        if not active:
+            return self._unsubscribed_due
+        timed = [p.next_due for p in active if p.interval]
+        return min(timed) if timed else time.perf_counter()
+
+    def has_demand(self):
+        return any(p.active for p in self.products.values())
+
+    def min_interval(self):
+        """Intervalo do produto mais rápido (usado como espera quando nada mudou)"""
+        timed = [p.interval for p in self.products.values() if p.active and p.interval]
+        return min(timed) if timed else 1.0 / 60
+
+    def run_due(self, now):
+        """Roda os produtos vencidos; retorna {nome: valor} só dos que mudaram"""
+        packet = {}
+        if not self.has_demand():
+            # ninguém assina nada: só acompanha o estado do iRacing, na frequência ociosa
+            self._unsubscribed_due = now + 1.0 / self.idle_rate
+            return packet
+        for product in self.products.values():
+            if not product.active:
+                continue
+            if product.interval:
+                if now < product.next_due:
+                    continue
+                # não acumula atraso: se perdeu vários ciclos, agenda a partir de agora
+                product.next_due = max(product.next_due + product.interval, now)
+
+            start = time.perf_counter()
+            value = product.fn()
+            elapsed = time.perf_counter() - start
+
+            product.runs += 1
+            product.total += elapsed
+            product.max = max(product.max, elapsed)
+
+            if value != product.last_value:
+                product.last_value = value
+                product.emits += 1
+                packet[product.name] = value
+        return packet
+
+    def stats(self):
+        """Custo medido por produto desde o início"""
+        uptime = max(time.perf_counter() - self._started, 1e-9)
+        return {
+            name: {
+                "rate": self.rates.get(name, 0),
+                "runs": p.runs,
+                "emits": p.emits,
+                "hz": p.runs / uptime,
+                "avg_ms": p.total / p.runs * 1000 if p.runs else 0.0,
+                "max_ms": p.max * 1000,
+                "load_pct": p.total / uptime * 100,
+            }
+            for name, p in self.products.items()
+        }
+
+    def format_stats(self):
+        lines = []
+        for name, s in self.stats().items():
+            lines.append(
+                f"{name:>10}: {s['hz']:5.1f} Hz | média {s['avg_ms']:.3f} ms | "
+                f"máx {s['max_ms']:.3f} ms | {s['load_pct']:.2f}% CPU | {s['emits']} emitidos"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,57 @@
+import mmap
+
+import irsdk
+
+from core.telemetry_reader import TelemetryReader
+
+
+class SdkAccess:
+    """Memória compartilhada e evento data-valid do pyirsdk, num lugar só
+
+    O pyirsdk não expõe os dois publicamente: aqui são lidos dos atributos privados
+    (`_shared_mem`, `_data_valid_event`, `_wait_valid_data_event`, conferidos no
+    pyirsdk 1.3.7 do requirements.txt). Se uma versão mudar esses nomes, o mapeamento
+    é aberto aqui com as constantes públicas do irsdk (ou o dump de teste) e o polling
+    volta a dormir até o próximo produto, em vez de quebrar em silêncio.
+    """
+
+    def __init__(self, ir, test_file=None):
+        self.ir = ir
+        self.test_file = test_file
+        self._own_mem = None
+        self._warned = set()
+
+    def _fallback(self, what):
+        if what not in self._warned:
+            self._warned.add(what)
+            print(f"[SdkAccess] pyirsdk sem {what}; usando o caminho público")
+
+    def open_reader(self):
+        """TelemetryReader sobre a memória do pyirsdk (chamar depois de `ir.startup`)"""
+        mem = getattr(self.ir, "_shared_mem", None)
+        if mem is not None:
+            return TelemetryReader(mem)
+        self._fallback("_shared_mem")
+        self.close()
+        if self.test_file:
+            with open(self.test_file, "rb") as f:
+                self._own_mem = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._own_mem = mmap.mmap(0, irsdk.MEMMAPFILESIZE, irsdk.MEMMAPFILE, access=mmap.ACCESS_READ)
+        return TelemetryReader(self._own_mem)
+
+    def can_wait(self):
+        """True se dá para esperar o evento data-valid do sim (só com o iRacing aberto)"""
+        if not hasattr(self.ir, "_data_valid_event") or not callable(getattr(self.ir, "_wait_valid_data_event", None)):
+            self._fallback("_wait_valid_data_event")
+            return False
+        return bool(self.ir._data_valid_event)
+
+    def wait_for_data(self):
+        """Bloqueia até o sim escrever um tick novo (timeout de 32 ms do SDK)"""
+        self.ir._wait_valid_data_event()
+
+    def close(self):
+        if self._own_mem is not None:
+            self._own_mem.close()
+            self._own_mem = None
@@ -0,0 +1,120 @@
+import numpy as np
+
+# iRacing sempre publica os arrays CarIdx* com 64 posições
+MAX_CARS = 64
+# setores quando a sessão não tem SplitTimeInfo: três terços da volta
+DEFAULT_SECTORS = (0.0, 1 / 3, 2 / 3)
+# avanço maior que isso entre duas amostras é teleporte (reset, reboque para o box)
+MAX_JUMP_LAPS = 0.5
+
+
+def _distance(laps, lap_dist_pct, size):
+    """Volta + LapDistPct por CarIdx (nan fora da pista), sempre com `size` posições"""
+    dist = np.full(size, np.nan)
+    if laps is None or lap_dist_pct is None:
+        return dist
+    lap = np.asarray(laps)[:size]
+    pct = np.asarray(lap_dist_pct, dtype=np.float64)[:size]
+    n = min(len(lap), len(pct))
+    dist[:n] = np.where((lap[:n] >= 0) & (pct[:n] >= 0), lap[:n] + pct[:n], np.nan)
+    return dist
+
+
+class SectorEngine:
+    """Tempos de setor de todos os carros, pelo cruzamento das fronteiras em LapDistPct
+
+    A cada amostra compara a distância anterior e a atual de todos os carros contra
+    todas as fronteiras de uma vez (carros x setores) e interpola o SessionTime exato
+    do cruzamento. Setor atual, último e melhor de cada carro ficam em arrays
+    pré-alocados: o custo por tick não cresce com o número de carros na pista.
+    """
+
+    def __init__(self, boundaries=DEFAULT_SECTORS, max_cars=MAX_CARS):
+        self.max_cars = max_cars
+        self.crossings = 0
+        self.set_boundaries(boundaries)
+
+    def set_boundaries(self, boundaries):
+        """Início de cada setor em LapDistPct (o 0.0 da linha de chegada é incluído); zera os tempos"""
+        starts = sorted({float(b) % 1.0 for b in boundaries} | {0.0})
+        self.starts = np.array(starts)
+        sectors = len(starts)
+        cars = self.max_cars
+        self.current = np.full(cars, -1, dtype=np.int64)  # setor em andamento (-1 = ainda não cruzou)
+        self.current_start = np.full(cars, np.nan)  # SessionTime do início do setor em andamento
+        self.last = np.full((cars, sectors), np.nan)
+        self.best = np.full((cars, sectors), np.nan)
+        self.last_done = np.full(cars, -1, dtype=np.int64)  # último setor completado
+        # setor em andamento passou pelo box: não vale como melhor
+        self._pitted = np.zeros(cars, dtype=bool)
+        self._dist = np.full(cars, np.nan)
+        self._time = None
+
+    @property
+    def sectors(self):
+        return len(self.starts)
+
+    def reset(self):
+        self.set_boundaries(self.starts)
+
+    def update(self, session_time, laps, lap_dist_pct, on_pit_road=None):
+        """Detecta os cruzamentos desde a amostra anterior e fecha os setores completados"""
+        if self._time is not None and session_time < self._time:
+            self.reset()  # sessão nova (ou replay voltou)
+
+        dist = _distance(laps, lap_dist_pct, self.max_cars)
+        if on_pit_road is not None:
+            pit = np.zeros(self.max_cars, dtype=bool)
+            pit_arr = np.asarray(on_pit_road, dtype=bool)[: self.max_cars]
+            pit[: len(pit_arr)] = pit_arr
+            self._pitted |= pit
+
+        dt = session_time - self._time if self._time is not None else 0.0
+        if dt > 0:
+            prev = self._dist
+            step = dist - prev
+            moving = (step > 0) & (step <= MAX_JUMP_LAPS)
+            # teleporte / saiu do mundo: o setor em andamento não vale mais
+            lost = ~moving & ~(step == 0)
+            self.current[lost] = -1
+            self.current_start[lost] = np.nan
+
+            # fronteira b cruzada quando floor(dist - b) muda (carros x setores)
+            before = np.floor(np.where(moving, prev, 0.0)[:, None] - self.starts)
+            after = np.floor(np.where(moving, dist, 0.0)[:, None] - self.starts)
+            crossed = after > before
+            if crossed.any():
+                # posição absoluta de cada cruzamento e o instante interpolado
+                at = self.starts + after
+                frac = (at - prev[:, None]) / np.where(moving, step, 1.0)[:, None]
+                times = np.where(crossed, self._time + frac * dt, np.inf)
+                # em amostras espaçadas um carro pode cruzar mais de uma fronteira: na ordem da pista
+                for _ in range(int(crossed.sum(axis=1).max())):
+                    sector = np.argmin(times, axis=1)
+                    cars = np.flatnonzero(np.isfinite(times[np.arange(self.max_cars), sector]))
+                    self._cross(cars, sector[cars], times[cars, sector[cars]])
+                    times[cars, sector[cars]] = np.inf
+
+        self._dist = dist
+        self._time = session_time
+
+    def _cross(self, cars, boundary, at):
+        """`cars` cruzaram o início do setor `boundary` no instante `at`"""
+        self.crossings += len(cars)
+        ended = (boundary - 1) % self.sectors
+        valid = self.current[cars] == ended
+        done, done_sector = cars[valid], ended[valid]
+        duration = at[valid] - self.current_start[done]
+        self.last[done, done_sector] = duration
+        clean = ~self._pitted[done]
+        best = self.best[done[clean], done_sector[clean]]
+        self.best[done[clean], done_sector[clean]] = np.fmin(best, duration[clean])
+        self.last_done[done] = done_sector
+
+        self.current[cars] = boundary
+        self.current_start[cars] = at
+        self._pitted[cars] = False
+
+    def optimal_lap(self):
+        """Soma dos melhores setores de cada carro (nan enquanto falta algum setor)"""
+        return self.best.sum(axis=1)
@@ -0,0 +1,169 @@
+import time
+
+from core.standings_engine import DriverTable
+from core.session_parser import SessionParser
+
+# YAML incompleto (lido pela metade, sem pilotos ainda) é relido depois desse tempo (s)
+# se o SessionInfoUpdate não mudar antes
+RETRY_INTERVAL = 1.0
+
+
+def _parse_number(raw, default=0):
+    """Lê números do YAML do iRacing, que às vezes vêm como texto ("31.20 C", "3600.0000 sec")"""
+    if isinstance(raw, bool):
+        return default
+    if isinstance(raw, (int, float)):
+        return raw
+    if isinstance(raw, str):
+        try:
+            return float(raw.split()[0])
+        except Exception:
+            return default
+    return default
+
+
+def _format_duration(seconds):
+    h = int(seconds // 3600)
+    m = int((seconds % 3600) // 60)
+    if h > 0:
+        return f"{h}h{m:02d}m"
+    return f"{m}m"
+
+
+class SessionStatic:
+    """Campos derivados do YAML da sessão; só mudam quando o SessionInfoUpdate muda
+
+    Instâncias são publicadas prontas pela thread do parser e nunca alteradas depois.
+    """
+
+    __slots__ = (
+        "update", "drivers", "sof", "class_sof", "laps_total", "session_length", "track_temp", "sectors",
+        "fuel_capacity",
+    )
+
+    def __init__(
+        self, update, drivers, sof, class_sof, laps_total, session_length, track_temp, sectors=(), fuel_capacity=0.0
+    ):
+        self.update = update
+        self.drivers = drivers
+        self.sof = sof
+        self.class_sof = class_sof
+        self.laps_total = laps_total
+        self.session_length = session_length
+        self.track_temp = track_temp
+        # início de cada setor em LapDistPct (SplitTimeInfo); vazio = pista sem setores no YAML
+        self.sectors = sectors
+        # litros que cabem no tanque (DriverCarFuelMaxLtr x DriverCarMaxFuelPct da série)
+        self.fuel_capacity = fuel_capacity
+
+    @classmethod
+    def empty(cls):
+        return cls.from_sections(None, None, None, None)
+
+    @classmethod
+    def from_sections(cls, update, driver_info, session_info, weekend_info, split_info=None):
+        drivers = DriverTable.from_drivers((driver_info or {}).get("Drivers"))
+
+        sof_general = 0
+        class_sof = {}
+        laps_total = 0
+        session_length_str = "--"
+
+        sessions = (session_info or {}).get("Sessions")
+        if sessions and isinstance(sessions, list):
+            first_session = sessions[0]
+
+            sof_general = first_session.get("StrengthOfField", 0)
+            # "unlimited" em corridas por tempo
+            laps_total = int(_parse_number(first_session.get("SessionLaps", 0)))
+            laps_completed = first_session.get("ResultsLapsComplete", 0)
+
+            results = first_session.get("ResultsPositions", [])
+            if results and isinstance(results, list):
+                for pos in results:
+                    class_id = pos.get("CarClassID")
+                    sof_val = pos.get("StrengthOfField")
+                    if class_id and sof_val:
+                        class_sof[class_id] = sof_val
+
+            if laps_total > 0:
+                session_length_str = f"{laps_completed}/{laps_total} voltas"
+            else:
+                session_time_total = _parse_number(first_session.get("SessionTime", 0))
+                if session_time_total > 0:
+                    session_length_str = _format_duration(session_time_total)
+
+        track_temp = _parse_number((weekend_info or {}).get("TrackSurfaceTemp", 0))
+
+        driver_info = driver_info or {}
+        fuel_max = _parse_number(driver_info.get("DriverCarFuelMaxLtr", 0))
+        fuel_pct = _parse_number(driver_info.get("DriverCarMaxFuelPct", 1), 1)
+
+        sectors = []
+        for sector in (split_info or {}).get("Sectors") or []:
+            start = _parse_number(sector.get("SectorStartPct"), -1)
+            if 0 <= start < 1:
+                sectors.append(float(start))
+
+        return cls(
+            update=update,
+            drivers=drivers,
+            sof=sof_general,
+            class_sof=tuple(class_sof.items()),
+            laps_total=laps_total,
+            session_length=session_length_str,
+            track_temp=f"{track_temp:.1f} °C",
+            sectors=tuple(sorted(sectors)),
+            fuel_capacity=float(fuel_max * fuel_pct),
+        )
+
+
+class SessionCache:
+    """Último SessionStatic publicado; o parse roda em background quando SessionInfoUpdate muda
+
+    `get` nunca bloqueia: enquanto o parse não termina, devolve o snapshot anterior.
+    """
+
+    def __init__(self):
+        self.static = SessionStatic.empty()
+        self._requested = None
+        self._retry_at = None  # perf_counter da próxima tentativa com o mesmo SessionInfoUpdate
+        self._parser = SessionParser(self._on_parsed)
+
+    def invalidate(self):
+        self.static = SessionStatic.empty()
+        self._requested = None
+        self._retry_at = None
+
+    def stop(self):
+        self._parser.stop()
+
+    def get(self, source):
+        """`source` expõe `session_info_update` e `session_yaml()` (ex.: TelemetryReader)"""
+        update = source.session_info_update
+        retry = self._retry_at is not None and time.perf_counter() >= self._retry_at
+        if update != self._requested or retry:
+            self._requested = update
+            self._retry_at = None
+            # só a cópia dos bytes acontece aqui; o parse vai para a thread do parser
+            self._parser.submit(update, source.session_yaml())
+        return self.static
+
+    def _on_parsed(self, update, sections):
+        # roda na thread do parser
+        if update != self._requested:
+            return  # já existe um pedido mais novo
+        if sections is None:
+            # YAML lido pela metade: tenta de novo quando mudar ou depois de RETRY_INTERVAL
+            self._retry_at = time.perf_counter() + RETRY_INTERVAL
+            return
+        static = SessionStatic.from_sections(
+            update,
+            sections["DriverInfo"],
+            sections["SessionInfo"],
+            sections["WeekendInfo"],
+            sections["SplitTimeInfo"],
+        )
+        if not len(static.drivers):
+            self._retry_at = time.perf_counter() + RETRY_INTERVAL
+        self.static = static
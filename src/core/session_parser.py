@@ -0,0 +1,154 @@
+import re
+import threading
+
+import yaml
+from yaml.reader import Reader as YamlReader
+from irsdk import CustomYamlSafeLoader, YAML_TRANSLATER
+
+UTF8_SIGN = b"---\nWeekendInfo:\n Encoding: UTF8"
+
+# seções do YAML e chaves que o overlay realmente usa (o resto nem chega ao parser)
+SECTION_KEYS = {
+    "DriverInfo": {
+        "DriverInfo", "Drivers", "CarIdx", "UserName", "CarNumberRaw", "CarPath",
+        "LicString", "LicColor", "CarClassID", "CarClassColor", "IRating",
+        "Country", "ClubName", "StartingGridPosition", "QualPosition",
+        "DriverCarFuelMaxLtr", "DriverCarMaxFuelPct",
+    },
+    "SessionInfo": {
+        "SessionInfo", "Sessions", "SessionNum", "SessionLaps", "SessionTime",
+        "SessionType", "StrengthOfField", "ResultsLapsComplete", "ResultsPositions",
+        "Position", "CarIdx", "CarClassID",
+    },
+    "WeekendInfo": {
+        "WeekendInfo", "TrackSurfaceTemp",
+    },
+    "SplitTimeInfo": {
+        "SplitTimeInfo", "Sectors", "SectorNum", "SectorStartPct",
+    },
+}
+
+# valores de texto livre que podem quebrar o YAML (":", aspas, vírgula no início...)
+STRING_KEYS = {"UserName", "TeamName", "AbbrevName", "Initials", "ClubName", "LicString"}
+
+_LINE_KEY = re.compile(r"^(?P<indent> *)(?P<dash>- )?(?P<key>\w+):(?P<value>.*)$")
+
+
+def _section(raw, key):
+    """Recorta uma seção de primeiro nível ("\\nKey:\\n" até a próxima linha em branco)"""
+    start = raw.find(f"\n{key}:\n".encode())
+    if start < 0:
+        return None
+    end = raw.find(b"\n\n", start + 1)
+    return raw[start + 1 : end if end >= 0 else len(raw)]
+
+
+def _decode(block, is_utf8):
+    if is_utf8:
+        try:
+            text = block.rstrip(b"\x00").decode("utf-8")
+        except UnicodeDecodeError:
+            is_utf8 = False
+    if not is_utf8:
+        text = block.translate(YAML_TRANSLATER).rstrip(b"\x00").decode("cp1252")
+    return YamlReader.NON_PRINTABLE.sub("", text)
+
+
+def _quote(value):
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        value = value[1:-1]
+    return '"%s"' % re.sub(r'(["\\])', r"\\\1", value)
+
+
+def select_keys(text, keep):
+    """Mantém só as chaves em `keep` (e seus filhos), preservando a estrutura do YAML"""
+    out = []
+    skip_indent = None
+    for line in text.splitlines():
+        m = _LINE_KEY.match(line)
+        if not m:
+            if skip_indent is None and line.strip():
+                out.append(line)
+            continue
+
+        indent = len(m.group("indent"))
+        dash = m.group("dash")
+        if skip_indent is not None:
+            # filhos do nó descartado: mais indentados, ou itens "- " no mesmo nível
+            if indent > skip_indent or (indent == skip_indent and dash):
+                continue
+            skip_indent = None
+
+        key = m.group("key")
+        # o início de um item de lista sempre fica, senão a lista perde a estrutura
+        if not dash and key not in keep:
+            skip_indent = indent
+            continue
+
+        if key in STRING_KEYS and m.group("value").strip():
+            line = f"{m.group('indent')}{dash or ''}{key}: {_quote(m.group('value'))}"
+        out.append(line)
+    return "\n".join(out)
+
+
+def parse_session_yaml(raw):
+    """Extrai só as seções/chaves usadas; retorna {seção: dados}"""
+    is_utf8 = raw.startswith(UTF8_SIGN)
+    sections = {}
+    for key, keep in SECTION_KEYS.items():
+        block = _section(raw, key)
+        if block is None:
+            sections[key] = None
+            continue
+        text = select_keys(_decode(block, is_utf8), keep)
+        data = yaml.load(text, Loader=CustomYamlSafeLoader) or {}
+        sections[key] = data.get(key)
+    return sections
+
+
+class SessionParser:
+    """Faz o parse do YAML da sessão fora da thread de polling
+
+    Só o pedido mais recente é mantido; o resultado é entregue ao callback
+    `on_parsed(update, sections)` na própria thread do parser (None em erro).
+    """
+
+    def __init__(self, on_parsed):
+        self.on_parsed = on_parsed
+        self._cond = threading.Condition()
+        self._pending = None
+        self._running = False
+        self._thread = None
+
+    def submit(self, update, raw):
+        with self._cond:
+            self._pending = (update, raw)
+            if self._thread is None:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    self._thread = None
+                    return
+                update, raw = self._pending
+                self._pending = None
+
+            try:
+                sections = parse_session_yaml(raw)
+            except Exception as e:
+                print("[SessionParser] Erro parse YAML:", e)
+                sections = None
+            self.on_parsed(update, sections)
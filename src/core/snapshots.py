@@ -0,0 +1,95 @@
+from typing import NamedTuple, Optional, Tuple
+
+
+# Snapshots imutáveis publicados pelo IRacingClient. São tuplas (sem __dict__ por
+# instância), comparáveis por valor (o scheduler só emite o que mudou) e podem ser
+# compartilhados entre layers e threads sem cópia.
+
+
+class StandingsRow(NamedTuple):
+    # campos do tick
+    id: int
+    pos: int
+    pos_gain: int
+    last_lap: str
+    gap: str
+    interval: str
+    best_lap: str
+    pace: str
+    incidents: int
+    ir_delta: str
+    # amostras numéricas para interpolar entre ticks (core.extrapolation):
+    # gap em s (None fora de GAP_TIME) e sua taxa por segundo de SessionTime
+    gap_s: Optional[float]
+    gap_rate: float
+    # campos estáticos (DriverInfo), os mesmos objetos de DriverTable.rows
+    driver: str
+    car_number: object
+    car_logo: Optional[str]
+    license: str
+    license_color: str
+    class_id: Optional[int]
+    class_color: str
+    irating: int
+    country: str
+
+
+# ordem dos campos estáticos em DriverTable.rows
+STATIC_FIELDS = StandingsRow._fields[StandingsRow._fields.index("driver") :]
+
+
+class SessionSnapshot(NamedTuple):
+    sof: object = "--"
+    # ((CarClassID, SOF), ...) em vez de dict, para continuar imutável
+    class_sof: Tuple[Tuple[int, int], ...] = ()
+    session_length: str = "--"
+    time_remain: Optional[str] = None
+    track_temp: str = "--"
+    my_driver_id: Optional[int] = None
+
+
+class FuelSnapshot(NamedTuple):
+    level: float = 0.0
+    capacity: float = 0.0
+    # consumo usado na estratégia (core.fuel_engine: bandeira verde > 5 voltas > 3 voltas > iRacing)
+    use_per_lap: float = 0.0
+    laps: int = 0
+    # consumo medido (litros); None sem voltas medidas
+    last: Optional[float] = None
+    avg_3: Optional[float] = None
+    avg_5: Optional[float] = None
+    avg_green: Optional[float] = None
+    # até o fim da corrida; None sem dado
+    laps_to_go: Optional[float] = None
+    to_finish: Optional[float] = None
+    # na próxima parada (no máximo o que cabe no tanque) e paradas até o fim; stops None sem capacidade
+    refuel: Optional[float] = None
+    stops: Optional[int] = None
+    # janela da próxima parada (número da volta); None sem parada necessária
+    pit_first: Optional[int] = None
+    pit_last: Optional[int] = None
+
+
+class DeltaSnapshot(NamedTuple):
+    # segundos; None sem referência ainda ou fora de uma volta válida
+    delta: Optional[float] = None
+    delta_optimal: Optional[float] = None
+    predicted: Optional[float] = None
+    best: Optional[float] = None
+    optimal: Optional[float] = None
+
+
+class SectorsSnapshot(NamedTuple):
+    # início de cada setor em LapDistPct
+    starts: Tuple[float, ...] = ()
+    # por CarIdx, um tempo por setor (segundos; None sem tempo)
+    last: Tuple[Tuple[Optional[float], ...], ...] = ()
+    best: Tuple[Tuple[Optional[float], ...], ...] = ()
+    # por CarIdx, setor completado por último (-1 = nenhum)
+    last_done: Tuple[int, ...] = ()
+
+
+class CarLRSnapshot(NamedTuple):
+    # CarLeftRight cru; None quando o SDK não trouxe a variável
+    val: Optional[int] = 0
+    status: str = "none"
@@ -0,0 +1,247 @@
+from typing import NamedTuple, Optional, Tuple
+
+from core.snapshots import StandingsRow
+
+
+class StandingsDiff(NamedTuple):
+    """Atualização de standings: snapshot completo (`full`) ou diferenças por carro
+
+    `base_seq` é o seq que o consumidor precisa ter aplicado antes deste; se não
+    bater, o consumidor pede um resync. Só tipos simples (tuplas, str, int, float),
+    então o mesmo fluxo serve para outro processo ou para a rede (`to_wire`).
+    """
+
+    seq: int
+    base_seq: int
+    full: bool
+    # CarIdx na ordem exibida; None = ordem e composição iguais ao anterior
+    order: Optional[Tuple[int, ...]]
+    # linhas completas: todas (full) ou só de quem entrou na janela
+    rows: Tuple[StandingsRow, ...]
+    # ((CarIdx, ((campo, valor), ...)), ...) só com os campos que mudaram
+    changes: Tuple[Tuple[int, Tuple[Tuple[str, object], ...]], ...]
+    # SessionTime da amostra (base para interpolar gap_s até o frame exibido)
+    session_time: float = 0.0
+
+    def to_wire(self):
+        """Versão JSON-serializável"""
+        return {
+            "seq": self.seq,
+            "base_seq": self.base_seq,
+            "full": self.full,
+            "order": list(self.order) if self.order is not None else None,
+            "rows": [list(row) for row in self.rows],
+            "changes": [[car_idx, [list(f) for f in fields]] for car_idx, fields in self.changes],
+            "session_time": self.session_time,
+        }
+
+    @classmethod
+    def from_wire(cls, data):
+        order = data["order"]
+        return cls(
+            data["seq"],
+            data["base_seq"],
+            data["full"],
+            tuple(order) if order is not None else None,
+            tuple(StandingsRow._make(row) for row in data["rows"]),
+            tuple((car_idx, tuple(tuple(f) for f in fields)) for car_idx, fields in data["changes"]),
+            data.get("session_time", 0.0),
+        )
+
+
+class StandingsEncoder:
+    """Lado do IRacingClient: transforma as linhas de cada tick em StandingsDiff"""
+
+    def __init__(self):
+        self.seq = 0
+        self._rows = {}
+        self._order = ()
+        self._force_full = True
+
+    def resync(self):
+        """O próximo encode sai como snapshot completo"""
+        self._force_full = True
+
+    def encode(self, rows, session_time=0.0):
+        order = tuple(row.id for row in rows)
+        base_seq = self.seq
+        self.seq += 1
+
+        if self._force_full:
+            self._force_full = False
+            diff = StandingsDiff(self.seq, base_seq, True, order, tuple(rows), (), session_time)
+        else:
+            previous = self._rows
+            added = []
+            changes = []
+            for row in rows:
+                old = previous.get(row.id)
+                if old is None:
+                    added.append(row)
+                elif old != row:
+                    fields = tuple(
+                        (name, new) for name, new, prev in zip(StandingsRow._fields, row, old) if new != prev
+                    )
+                    changes.append((row.id, fields))
+            diff = StandingsDiff(
+                self.seq,
+                base_seq,
+                False,
+                order if order != self._order else None,
+                tuple(added),
+                tuple(changes),
+                session_time,
+            )
+
+        self._rows = {row.id: row for row in rows}
+        self._order = order
+        return diff
+
+
+class StandingsDecoder:
+    """Lado do consumidor: reconstrói as linhas aplicando os diffs em sequência"""
+
+    def __init__(self):
+        self.seq = None
+        self.session_time = 0.0
+        self.rows = []  # StandingsRow na ordem exibida (não alterar fora daqui)
+        self._by_id = {}
+        self._index = {}
+
+    def apply(self, diff):
+        """Retorna (reordenou, CarIdx alterados); None se faltou um diff e é preciso resync"""
+        if diff.full:
+            if self.seq is not None and diff.seq < self.seq:
+                return False, ()  # snapshot atrasado (ex.: o da assinatura chegou depois de um resync)
+            self._by_id = {row.id: row for row in diff.rows}
+            self._set_order(diff.order)
+            self.seq = diff.seq
+            self.session_time = diff.session_time
+            return True, tuple(diff.order)
+
+        if self.seq is not None and diff.seq <= self.seq:
+            return False, ()  # já aplicado (ex.: snapshot completo entregue na assinatura)
+        if self.seq is None or diff.base_seq != self.seq:
+            return None
+        self.seq = diff.seq
+        self.session_time = diff.session_time
+
+        by_id = self._by_id
+        for row in diff.rows:
+            by_id[row.id] = row
+        changed = []
+        for car_idx, fields in diff.changes:
+            row = by_id.get(car_idx)
+            if row is not None:
+                by_id[car_idx] = row._replace(**dict(fields))
+                changed.append(car_idx)
+
+        if diff.order is not None or diff.rows:
+            self._set_order(diff.order if diff.order is not None else tuple(r.id for r in self.rows))
+            return True, tuple(changed)
+
+        # só valores mudaram: atualiza as linhas no lugar
+        for car_idx in changed:
+            self.rows[self._index[car_idx]] = by_id[car_idx]
+        return False, tuple(changed)
+
+    def _set_order(self, order):
+        by_id = self._by_id
+        self._by_id = {car_idx: by_id[car_idx] for car_idx in order}
+        self.rows = [self._by_id[car_idx] for car_idx in order]
+        self._index = {car_idx: i for i, car_idx in enumerate(order)}
+
+
+class StandingsLatest:
+    """Último estado de standings para quem assina depois (TopicBus.set_latest)
+
+    Guarda o último snapshot completo e junta os diffs seguintes num dict por carro
+    (só os campos que mudaram, o mais novo vale); nenhuma linha é refeita por pacote.
+    O snapshot completo só é montado quando um assinante novo pede (`value`).
+    """
+
+    def __init__(self):
+        self._full = None
+        self._order = ()
+        self._added = {}  # CarIdx -> linha completa de quem entrou depois do snapshot
+        self._changes = {}  # CarIdx -> {campo: valor}
+        self._seq = None
+        self._session_time = 0.0
+
+    def push(self, diff):
+        if diff.full:
+            self._full = diff
+            self._order = diff.order
+            self._added.clear()
+            self._changes.clear()
+        elif self._full is None or diff.base_seq != self._seq:
+            return  # sem base (ou faltou um diff): espera o próximo snapshot completo
+        else:
+            for row in diff.rows:
+                self._added[row.id] = row
+                self._changes.pop(row.id, None)
+            changes = self._changes
+            for car_idx, fields in diff.changes:
+                if car_idx in changes:
+                    changes[car_idx].update(fields)
+                else:
+                    changes[car_idx] = dict(fields)
+            if diff.order is not None:
+                self._order = diff.order
+        self._seq = diff.seq
+        self._session_time = diff.session_time
+
+    def value(self):
+        """StandingsDiff completo com o estado atual (None antes do primeiro snapshot completo)"""
+        full = self._full
+        if full is None:
+            return None
+        if self._seq == full.seq:
+            return full
+        rows_by_id = {row.id: row for row in full.rows}
+        rows_by_id.update(self._added)
+        rows = []
+        for car_idx in self._order:
+            row = rows_by_id[car_idx]
+            fields = self._changes.get(car_idx)
+            rows.append(row._replace(**fields) if fields else row)
+        rows = tuple(rows)
+        # o valor montado vira a nova base
+        self.push(StandingsDiff(self._seq, full.base_seq, True, self._order, rows, (), self._session_time))
+        return self._full
+
+
+def merge_diffs(older, newer):
+    """Junta dois diffs consecutivos num só (usado pelo TopicBus para não perder diffs)"""
+    if newer.full or newer.base_seq != older.seq:
+        return newer
+
+    if older.full:
+        decoder = StandingsDecoder()
+        decoder.apply(older)
+        decoder.apply(newer)
+        rows = tuple(decoder.rows)
+        return StandingsDiff(
+            newer.seq, older.base_seq, True, tuple(r.id for r in rows), rows, (), newer.session_time
+        )
+
+    added = {row.id: row for row in older.rows}
+    changes = {car_idx: dict(fields) for car_idx, fields in older.changes}
+    for row in newer.rows:
+        added[row.id] = row
+        changes.pop(row.id, None)
+    for car_idx, fields in newer.changes:
+        if car_idx in added:
+            added[car_idx] = added[car_idx]._replace(**dict(fields))
+        else:
+            changes.setdefault(car_idx, {}).update(fields)
+
+    return StandingsDiff(
+        newer.seq,
+        older.base_seq,
+        False,
+        newer.order if newer.order is not None else older.order,
+        tuple(added.values()),
+        tuple((car_idx, tuple(fields.items())) for car_idx, fields in changes.items()),
+        newer.session_time,
+    )
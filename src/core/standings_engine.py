@@ -0,0 +1,469 @@
+import numpy as np
+
+from core.lap_history import PACE_LAPS, LapHistory
+from core.snapshots import StandingsRow
+from core.timing_engine import TimingEngine
+
+# iRacing sempre publica os arrays CarIdx* com 64 posições
+MAX_CARS = 64
+
+# códigos de gap calculados de forma vetorizada (formatados só na saída)
+GAP_NONE = 0
+GAP_LEADER = 1
+GAP_LAPPED = 2
+GAP_TIME = 3
+
+# amostras mais distantes que isso (em SessionTime) não geram taxa de variação
+MAX_RATE_DT = 2.0
+
+
+def argb_to_hex(val):
+    """Converte valor ARGB do iRacing em #RRGGBB"""
+    if isinstance(val, int):
+        r = (val >> 16) & 0xFF
+        g = (val >> 8) & 0xFF
+        b = val & 0xFF
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return "#333333"
+
+
+def format_lap_time(seconds):
+    """Formata tempo de volta em mm:ss.mmm"""
+    if not isinstance(seconds, (int, float)) or seconds <= 0:
+        return "--"
+    minutes = int(seconds // 60)
+    sec = int(seconds % 60)
+    millis = int((seconds * 1000) % 1000)
+    return f"{minutes}:{sec:02d}.{millis:03d}"
+
+
+def window_bounds(total, center, max_rows):
+    """Retorna (start, end) da janela "eu + X players" centrada em `center`"""
+    if not max_rows or center is None:
+        return 0, total
+    half = max_rows // 2
+    start = max(0, center - half)
+    end = min(total, start + max_rows)
+    if end - start < max_rows:
+        start = max(0, end - max_rows)
+    return start, end
+
+
+def _as_array(values, dtype):
+    """Lista do pyirsdk, view NumPy do TelemetryReader ou None -> ndarray"""
+    if values is None:
+        return np.zeros(0, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+def _laps_text(laps):
+    return f"+{laps} volta{'s' if laps > 1 else ''}"
+
+
+def _fill_nan(values, fallback):
+    """`values` com os nan trocados por `fallback` (que também pode ser nan)"""
+    return np.where(np.isnan(values), fallback, values)
+
+
+def _by_car(values, size, fill):
+    """Array do iRacing (ou None) com exatamente `size` posições, completando com `fill`"""
+    arr = _as_array(values, np.float64 if isinstance(fill, float) else np.int64)[:size]
+    if len(arr) == size:
+        return arr
+    out = np.full(size, fill, dtype=arr.dtype)
+    out[: len(arr)] = arr
+    return out
+
+
+def _take(arr, idx, fill, top):
+    """Lê arr[idx]; índices fora do array recebem `fill` (`top` = maior índice + 1)"""
+    if top <= len(arr):
+        return arr[idx]  # caso normal: arrays CarIdx* com 64 posições
+    out = np.full(len(idx), fill, dtype=arr.dtype)
+    mask = idx < len(arr)
+    out[mask] = arr[idx[mask]]
+    return out
+
+
+class DriverTable:
+    """Colunas estáticas dos pilotos, derivadas do DriverInfo
+
+    `rows` guarda os campos estáticos de cada piloto como tupla, na ordem de
+    snapshots.STATIC_FIELDS, para serem anexados às StandingsRow sem recriar nada.
+    """
+
+    def __init__(self, car_idx, start_grid, qual_grid, rows):
+        self.car_idx = car_idx
+        self.start_grid = start_grid
+        self.qual_grid = qual_grid
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def from_drivers(cls, drivers):
+        car_idx, start_grid, qual_grid, rows = [], [], [], []
+        for drv in drivers or []:
+            name = drv.get("UserName")
+            idx = drv.get("CarIdx")
+            if name is None or idx is None:
+                continue
+
+            car_idx.append(idx)
+            start_grid.append(drv.get("StartingGridPosition", 0) or 0)
+            qual_grid.append(drv.get("QualPosition", 0) or 0)
+
+            # carro
+            car_logo = None
+            if "CarPath" in drv:
+                car_logo = f"assets/cars/{drv['CarPath']}.png"
+
+            rows.append(
+                (
+                    name,
+                    drv.get("CarNumberRaw", "--"),
+                    car_logo,
+                    drv.get("LicString", "--"),
+                    argb_to_hex(drv.get("LicColor")),
+                    drv.get("CarClassID"),
+                    argb_to_hex(drv.get("CarClassColor")),
+                    drv.get("IRating", 0),
+                    drv.get("Country") or drv.get("ClubName", "") or "",
+                )
+            )
+
+        return cls(
+            np.array(car_idx, dtype=np.int64),
+            np.array(start_grid, dtype=np.int64),
+            np.array(qual_grid, dtype=np.int64),
+            rows,
+        )
+
+
+class StandingsFrame:
+    """Resultado vetorizado de um tick; a formatação é feita só nas linhas exibidas"""
+
+    def __init__(
+        self,
+        table,
+        order,
+        pos,
+        pos_gain,
+        gap_kind,
+        lap_diff,
+        gap,
+        interval,
+        interval_laps,
+        last_lap,
+        best_lap,
+        pace,
+        incidents,
+        gap_rate,
+    ):
+        self.table = table
+        self.order = order
+        self.pos = pos
+        self.pos_gain = pos_gain
+        self.gap_kind = gap_kind
+        self.lap_diff = lap_diff
+        self.gap = gap
+        # intervalo para o carro da frente (nan sem dado); interval_laps > 0 = voltas inteiras
+        self.interval = interval
+        self.interval_laps = interval_laps
+        self.last_lap = last_lap
+        # melhor volta e média das últimas PACE_LAPS voltas limpas (LapHistory; -1 sem dado)
+        self.best_lap = best_lap
+        self.pace = pace
+        self.incidents = incidents
+        self.gap_rate = gap_rate
+
+    def __len__(self):
+        return len(self.order)
+
+    def rank_of(self, car_idx):
+        """Índice (na ordem de classificação) do carro `car_idx`, ou None"""
+        if car_idx is None:
+            return None
+        hits = np.flatnonzero(self.table.car_idx[self.order] == car_idx)
+        return int(hits[0]) if len(hits) else None
+
+    def format_window(self, center_car_idx=None, max_rows=0):
+        """Formata a janela "eu + X players" (ou todas as linhas se max_rows == 0) em StandingsRow"""
+        center = self.rank_of(center_car_idx) if max_rows else None
+        start, end = window_bounds(len(self.order), center, max_rows)
+        sel = self.order[start:end]
+
+        # converte só as linhas exibidas para tipos Python de uma vez
+        columns = zip(
+            sel.tolist(),
+            self.table.car_idx[sel].tolist(),
+            self.pos[sel].tolist(),
+            self.pos_gain[sel].tolist(),
+            self.gap_kind[sel].tolist(),
+            self.lap_diff[sel].tolist(),
+            self.gap[sel].tolist(),
+            self.interval[sel].tolist(),
+            self.interval_laps[sel].tolist(),
+            self.last_lap[sel].tolist(),
+            self.best_lap[sel].tolist(),
+            self.pace[sel].tolist(),
+            self.incidents[sel].tolist(),
+            self.gap_rate[sel].tolist(),
+        )
+        rows = self.table.rows
+        new_row = tuple.__new__
+        data = []
+        for (
+            i, car_idx, pos, pos_gain, kind, lap_diff, gap, interval, interval_laps, last_lap, best_lap, pace, incidents,
+            gap_rate,
+        ) in columns:
+            gap_s = None
+            if kind == GAP_LEADER:
+                gap = "Líder"
+            elif kind == GAP_LAPPED:
+                gap = _laps_text(lap_diff)
+            elif kind == GAP_TIME:
+                gap_s = gap
+                gap = f"+{gap:.1f}s"
+            else:
+                gap = "---"
+
+            if kind == GAP_LEADER:
+                interval = ""
+            elif interval_laps > 0:
+                interval = _laps_text(interval_laps)
+            elif interval == interval:  # não é nan
+                interval = f"+{interval:.1f}s"
+            else:
+                interval = "---"
+
+            live = (
+                car_idx,
+                pos,
+                pos_gain,
+                format_lap_time(last_lap),
+                gap,
+                interval,
+                format_lap_time(best_lap),
+                format_lap_time(pace),
+                incidents,
+                "",
+                gap_s,
+                gap_rate,
+            )
+            data.append(new_row(StandingsRow, live + rows[i]))
+        return tuple(data)
+
+
+class StandingsEngine:
+    """Calcula posição, delta de grid, voltas de diferença, gap e ordem com NumPy
+
+    Com CarIdxLap (`laps`), gap e intervalo vêm do TimingEngine (passagens gravadas
+    no mesmo ponto da pista), completados por CarIdxF2Time/CarIdxEstTime onde ainda
+    não há passagem gravada. Sem ele (dumps antigos), fica a estimativa pelo tempo
+    da última volta.
+    """
+
+    def __init__(self):
+        # tempos de passagem; alimentado também a cada tick pelo produto "timing"
+        self.timing = TimingEngine()
+        # voltas completadas de todos os carros (melhor volta, ritmo)
+        self.history = LapHistory()
+        # guarda posição inicial caso não haja qualificação (indexado por CarIdx)
+        self._starting_positions = np.zeros(MAX_CARS, dtype=np.int64)
+        # amostra anterior (indexada por CarIdx) para as taxas de variação
+        self._prev_time = None
+        self._prev_gap = np.full(MAX_CARS, np.nan)
+
+    def reset(self):
+        self.timing.reset()
+        self.history.reset()
+        self._starting_positions[:] = 0
+        self._prev_time = None
+        self._prev_gap[:] = np.nan
+
+    def compute(
+        self,
+        table,
+        positions,
+        qual_pos,
+        last_laps,
+        incidents,
+        lap_dist_pct,
+        session_time,
+        laps=None,
+        est_time=None,
+        f2_time=None,
+        laps_completed=None,
+        on_pit_road=None,
+    ):
+        idx = table.car_idx
+        top = int(idx.max()) + 1 if len(idx) else 0
+        if top > len(self._starting_positions):
+            grown = np.zeros(top, dtype=np.int64)
+            grown[: len(self._starting_positions)] = self._starting_positions
+            self._starting_positions = grown
+            prev = np.full(len(grown), np.nan)
+            prev[: len(self._prev_gap)] = self._prev_gap
+            self._prev_gap = prev
+
+        positions_arr = _as_array(positions, np.int64)
+        last_arr = _as_array(last_laps, np.float64)
+        pct_arr = _as_array(lap_dist_pct, np.float64)
+
+        my_pos = _take(positions_arr, idx, 0, top)
+        qual = _take(_as_array(qual_pos, np.int64), idx, 0, top)
+        last = _take(last_arr, idx, 0.0, top)
+        last_display = _take(last_arr, idx, -1.0, top)
+        inc = _take(_as_array(incidents, np.int64), idx, 0, top)
+        pct = _take(pct_arr, idx, 0.0, top)
+        pct_valid = idx < len(pct_arr)
+
+        # posição atual (fallback para CarIdx + 1)
+        pos = np.where(my_pos > 0, my_pos, idx + 1)
+
+        # grid inicial: StartingGridPosition > CarIdxQualPosition > QualPosition > memorizado
+        remembered = self._starting_positions[idx]
+        start_ok = table.start_grid > 0
+        qual_ok = qual > 0
+        qual_yaml_ok = table.qual_grid > 0
+        remembered_ok = remembered > 0
+        # np.where encadeado: np.select tem custo fixo alto para os grids pequenos
+        grid = np.where(
+            start_ok,
+            table.start_grid,
+            np.where(qual_ok, qual, np.where(qual_yaml_ok, table.qual_grid, np.where(remembered_ok, remembered, pos))),
+        )
+        unknown = ~(start_ok | qual_ok | qual_yaml_ok | remembered_ok)
+        self._starting_positions[idx[unknown]] = pos[unknown]
+
+        pos_gain = np.where((grid > 0) & (pos > 0), grid - pos, 0)
+
+        # gap em tempo real (relativo ao líder)
+        n = len(idx)
+        gap_kind = np.full(n, GAP_NONE, dtype=np.int8)
+        lap_diff = np.zeros(n, dtype=np.int64)
+        gap = np.full(n, np.nan)
+        interval = np.full(n, np.nan)
+        interval_laps = np.zeros(n, dtype=np.int64)
+
+        leaders = np.flatnonzero(positions_arr == 1)
+        if laps is not None:
+            if self.timing.session_time != session_time:
+                # o produto "timing" (60 Hz) já gravou este tick; só sem ele o standings grava
+                self.timing.update(session_time, laps, lap_dist_pct)
+            if len(leaders):
+                gap, lap_diff, interval, interval_laps = self._timed_gaps(
+                    idx, pos, int(leaders[0]), _as_array(est_time, np.float64), _as_array(f2_time, np.float64),
+                    _as_array(laps, np.int64),
+                )
+                is_leader = pct_valid & (pos == 1)
+                lapped = pct_valid & ~is_leader & (lap_diff > 0)
+                timed = pct_valid & ~is_leader & ~lapped & ~np.isnan(gap)
+                gap_kind[is_leader] = GAP_LEADER
+                gap_kind[lapped] = GAP_LAPPED
+                gap_kind[timed] = GAP_TIME
+                gap = np.where(timed, gap, np.nan)
+        elif len(leaders) and leaders[0] < len(pct_arr):
+            leader_idx = leaders[0]
+            leader_pct = pct_arr[leader_idx]
+            leader_last = last_arr[leader_idx] if leader_idx < len(last_arr) else 0.0
+
+            lap_diff = positions_arr[leader_idx] - my_pos
+            leader_time = session_time - (1 - leader_pct) * leader_last
+            my_time = session_time - (1 - pct) * last
+
+            is_leader = pct_valid & (pos == 1)
+            lapped = pct_valid & ~is_leader & (lap_diff > 0)
+            timed = pct_valid & ~is_leader & ~lapped & (leader_time != 0) & (my_time != 0)
+
+            gap_kind[is_leader] = GAP_LEADER
+            gap_kind[lapped] = GAP_LAPPED
+            gap_kind[timed] = GAP_TIME
+            gap = np.where(timed, my_time - leader_time, np.nan)
+
+        gap_rate = self._gap_rate(idx, session_time, gap)
+
+        best_lap = np.full(n, -1.0)
+        pace = np.full(n, -1.0)
+        if laps_completed is not None:
+            history = self.history
+            history.update(session_time, laps_completed, last_laps, on_pit_road, incidents)
+            known = idx < history.max_cars
+            cars = idx[known]
+            best_lap[known] = np.nan_to_num(history.best[cars], nan=-1.0)
+            pace[known] = np.nan_to_num(history.average(PACE_LAPS)[cars], nan=-1.0)
+
+        order = np.argsort(pos, kind="stable")
+        return StandingsFrame(
+            table,
+            order,
+            pos,
+            pos_gain,
+            gap_kind,
+            lap_diff,
+            gap,
+            interval,
+            interval_laps,
+            last_display,
+            best_lap,
+            pace,
+            inc,
+            gap_rate,
+        )
+
+    def _timed_gaps(self, idx, pos, leader, est, f2, laps):
+        """(gap, voltas atrás do líder, intervalo, voltas atrás do carro da frente) por carro da tabela"""
+        timing = self.timing
+        slots = len(timing.dist)
+        known = idx < slots
+        cars = np.where(known, idx, 0)
+        # arrays do iRacing no tamanho do TimingEngine, indexáveis direto por CarIdx
+        est = _by_car(est, slots, np.nan)
+        f2 = _by_car(f2, slots, np.nan)
+        laps = _by_car(laps, slots, -1)
+
+        # carro da frente pela posição (o líder aponta para si mesmo)
+        order = np.argsort(pos, kind="stable")
+        ahead = np.empty(len(idx), dtype=np.int64)
+        ahead[order] = cars[np.concatenate((order[:1], order[:-1]))]
+        leader = np.full(len(idx), leader if leader < slots else 0)
+
+        f2_car = f2[cars]
+        if len(idx) and f2[leader[0]] > 0:
+            # fora de corrida o F2Time é a melhor volta: gap e intervalo entre melhores voltas
+            f2_ahead = f2[ahead]
+            gap = np.where((f2_car > 0) & known, f2_car - f2[leader], np.nan)
+            interval = np.where((f2_car > 0) & (f2_ahead > 0) & known, f2_car - f2_ahead, np.nan)
+            zeros = np.zeros(len(idx), dtype=np.int64)
+            return gap, zeros, interval, zeros
+
+        est_car = est[cars]
+        lap_car = laps[cars]
+        results = []
+        for targets in (leader, ahead):
+            seconds = timing.time_behind(cars, targets)
+            # onde ainda não há passagem gravada: F2Time (corrida) e EstTime na mesma volta
+            f2_target = f2[targets]
+            by_f2 = np.where((f2_car > f2_target) & (f2_target >= 0), f2_car - f2_target, np.nan)
+            est_target = est[targets]
+            same_lap = (lap_car >= 0) & (lap_car == laps[targets]) & (est_car > 0) & (est_target > est_car)
+            seconds = _fill_nan(seconds, by_f2)
+            seconds = _fill_nan(seconds, np.where(same_lap, est_target - est_car, np.nan))
+            results += [np.where(known, seconds, np.nan), np.where(known, timing.laps_behind(cars, targets), 0)]
+        return tuple(results)
+
+    def _gap_rate(self, idx, session_time, gap):
+        """Variação do gap por segundo de SessionTime desde o tick anterior (0 sem amostra válida)"""
+        dt = session_time - self._prev_time if self._prev_time is not None else 0.0
+        if 0 < dt <= MAX_RATE_DT:
+            gap_rate = np.nan_to_num((gap - self._prev_gap[idx]) / dt, nan=0.0, posinf=0.0, neginf=0.0)
+        else:
+            # primeiro tick, sessão reiniciada ou pausa longa: sem taxa confiável
+            gap_rate = np.zeros(len(idx))
+
+        self._prev_time = session_time
+        self._prev_gap[:] = np.nan
+        self._prev_gap[idx] = gap
+        return gap_rate
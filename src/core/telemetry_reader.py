@@ -0,0 +1,158 @@
+import mmap
+import struct
+
+import numpy as np
+
+# layout da memória compartilhada do iRacing (irsdk_defines.h)
+HEADER = struct.Struct("<10i")  # ver, status, tickRate, sessionInfoUpdate, sessionInfoLen,
+# sessionInfoOffset, numVars, varHeaderOffset, numBuf, bufLen
+VAR_BUF_OFFSET = 48
+VAR_BUF = struct.Struct("<3i")  # tickCount, bufOffset, tickCountBegin (0 em SDKs antigos)
+VAR_BUF_SIZE = 16
+VAR_HEADER = struct.Struct("<3i?3x32s64s32s")  # type, offset, count, countAsTime, name, desc, unit
+VAR_HEADER_SIZE = 144
+
+SESSION_INFO = struct.Struct("<3i")  # sessionInfoUpdate, sessionInfoLen, sessionInfoOffset
+SESSION_INFO_OFFSET = 12
+
+# irsdk_VarType -> dtype
+VAR_DTYPES = {
+    0: np.dtype("S1"),  # char
+    1: np.dtype(np.bool_),  # bool
+    2: np.dtype("<i4"),  # int
+    3: np.dtype("<u4"),  # bitField
+    4: np.dtype("<f4"),  # float
+    5: np.dtype("<f8"),  # double
+}
+
+
+class VarLayout:
+    """Posição de uma variável dentro de uma linha do var buffer"""
+
+    __slots__ = ("name", "dtype", "offset", "count", "unit", "desc")
+
+    def __init__(self, name, dtype, offset, count, unit, desc):
+        self.name = name
+        self.dtype = dtype
+        self.offset = offset
+        self.count = count
+        self.unit = unit
+        self.desc = desc
+
+
+class TelemetryReader:
+    """Lê a telemetria direto da memória compartilhada, sem passar pelo lookup do pyirsdk
+
+    Os headers das variáveis são lidos uma vez (no connect) e compilados num dtype
+    estruturado. Cada `freeze()` copia a linha mais recente do var buffer; as
+    variáveis CarIdx* são então views NumPy sobre essa cópia (sem copiar de novo).
+
+    `mem` pode ser o mmap do iRacing (o mesmo do pyirsdk) ou um dump .bin gravado
+    com `irsdk --dump`, o que permite testar fora do Windows.
+    """
+
+    def __init__(self, mem):
+        self._mem = mem
+        (
+            self.version,
+            self.status,
+            self.tick_rate,
+            _session_info_update,
+            _session_info_len,
+            _session_info_offset,
+            num_vars,
+            var_header_offset,
+            self._num_buf,
+            self._buf_len,
+        ) = HEADER.unpack_from(mem, 0)
+
+        self.layouts = {}
+        for i in range(num_vars):
+            var_type, offset, count, _count_as_time, name, desc, unit = VAR_HEADER.unpack_from(
+                mem, var_header_offset + i * VAR_HEADER_SIZE
+            )
+            name = name.rstrip(b"\x00").decode("latin-1")
+            self.layouts[name] = VarLayout(
+                name,
+                VAR_DTYPES[var_type],
+                offset,
+                count,
+                unit.rstrip(b"\x00").decode("latin-1"),
+                desc.rstrip(b"\x00").decode("latin-1"),
+            )
+
+        # uma linha inteira do var buffer como um único registro estruturado
+        self._record_dtype = np.dtype(
+            {
+                "names": list(self.layouts),
+                "formats": [v.dtype if v.count == 1 else (v.dtype, (v.count,)) for v in self.layouts.values()],
+                "offsets": [v.offset for v in self.layouts.values()],
+                "itemsize": self._buf_len,
+            }
+        )
+        self._scalars = {name for name, v in self.layouts.items() if v.count == 1}
+        self._record = None
+        self.tick_count = None
+
+    @classmethod
+    def open_file(cls, path):
+        """Abre um dump .bin da memória compartilhada (gravado com `irsdk --dump`)"""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __contains__(self, name):
+        return name in self.layouts
+
+    # -------------------
+    # Header (sempre lido ao vivo)
+    # -------------------
+    def _var_bufs(self):
+        for i in range(self._num_buf):
+            yield VAR_BUF.unpack_from(self._mem, VAR_BUF_OFFSET + i * VAR_BUF_SIZE)
+
+    def latest_tick(self):
+        """tickCount do buffer mais recente, sem copiar nada"""
+        return max(tick for tick, _, _ in self._var_bufs())
+
+    @property
+    def session_info_update(self):
+        return SESSION_INFO.unpack_from(self._mem, SESSION_INFO_OFFSET)[0]
+
+    def session_yaml(self):
+        """Copia o YAML bruto da sessão (o parse fica com o SessionParser)"""
+        _update, length, start = SESSION_INFO.unpack_from(self._mem, SESSION_INFO_OFFSET)
+        return self._mem[start : start + length]
+
+    # -------------------
+    # Var buffer
+    # -------------------
+    def freeze(self, retries=3):
+        """Copia a linha mais recente; descarta cópias que o sim sobrescreveu no meio"""
+        for _ in range(retries):
+            tick, offset, _ = max(self._var_bufs())
+            frozen = self._mem[offset : offset + self._buf_len]
+            if self._is_intact(offset, tick):
+                break
+        self._record = np.frombuffer(frozen, dtype=self._record_dtype, count=1)[0]
+        self.tick_count = tick
+        return tick
+
+    def _is_intact(self, offset, tick):
+        """O buffer copiado não começou a ser reescrito durante a cópia?"""
+        for buf_tick, buf_offset, begin in self._var_bufs():
+            if buf_offset == offset:
+                return buf_tick == tick and begin in (0, tick)
+        return False
+
+    def __getitem__(self, name):
+        """Escalares viram tipos Python; arrays são views NumPy (somente leitura) do freeze"""
+        if self._record is None or name not in self.layouts:
+            return None
+        value = self._record[name]
+        if name in self._scalars:
+            return value.item()
+        return value
+
+    def get(self, name, default=None):
+        value = self[name]
+        return default if value is None else value
@@ -0,0 +1,402 @@
+import multiprocessing
+import pickle
+import struct
+import typing
+from multiprocessing import shared_memory
+
+from PySide6 import QtCore
+
+from core.scheduler import DEFAULT_RATES
+from core.snapshots import CarLRSnapshot, DeltaSnapshot, FuelSnapshot
+
+# layout da memória compartilhada entre o processo de telemetria e o processo Qt
+# seq do último snapshot completo, máscara de demanda, standings_window, num_slots, slot_size,
+# contador de pedidos de resync
+RING_HEADER = struct.Struct("<QQiIII")
+DEMAND_OFFSET = 8
+WINDOW_OFFSET = 16
+RESYNC_OFFSET = 28
+SLOT_HEADER = struct.Struct("<QQI4x")  # seq_begin, seq_end, tamanho do payload
+RING_SLOTS = 4
+RING_SLOT_SIZE = 256 * 1024
+
+# tópicos do TopicBus viram bits na ordem de DEFAULT_RATES; todos os bits = sem filtro
+DEMAND_TOPICS = list(DEFAULT_RATES)
+DEMAND_ALL = (1 << 64) - 1
+
+# payload de um snapshot: estado de energia + (versão, offset, tamanho) de cada produto na
+# ordem de DEMAND_TOPICS, seguidos dos valores; o leitor só decodifica o que mudou
+POWER_STATES = ("disconnected", "idle", "active")
+SNAPSHOT_HEADER = struct.Struct("<B" + "QII" * len(DEMAND_TOPICS))
+
+
+class FixedCodec:
+    """Snapshot NamedTuple só de números (e strings curtas) <-> bytes de layout fixo
+
+    Campos Optional viajam como nan (float) ou -1 (int) e voltam como None.
+    """
+
+    def __init__(self, cls, fmt):
+        self.cls = cls
+        self.struct = struct.Struct(fmt)
+        self._kinds = tuple(c for c in fmt.lstrip("<") if not c.isdigit())
+        assert len(self._kinds) == len(cls._fields), cls.__name__
+        self._optional = tuple(type(None) in typing.get_args(cls.__annotations__[name]) for name in cls._fields)
+
+    def encode(self, value):
+        fields = []
+        for v, kind in zip(value, self._kinds):
+            if kind == "s":
+                v = v.encode()
+            elif v is None:
+                v = float("nan") if kind == "d" else -1
+            fields.append(v)
+        return self.struct.pack(*fields)
+
+    def decode(self, buf, offset=0):
+        fields = []
+        for v, kind, optional in zip(self.struct.unpack_from(buf, offset), self._kinds, self._optional):
+            if kind == "s":
+                v = v.rstrip(b"\0").decode()
+            elif optional and (v != v if kind == "d" else v == -1):
+                v = None
+            fields.append(v)
+        return self.cls._make(fields)
+
+
+# produtos numéricos de alta frequência com layout fixo; standings, sessão e setores
+# (strings de tamanho variável, diffs por carro) continuam em pickle
+FIXED_CODECS = {
+    "car_lr": FixedCodec(CarLRSnapshot, "<i8s"),
+    "fuel": FixedCodec(FuelSnapshot, "<dddidddddddiii"),
+    "delta": FixedCodec(DeltaSnapshot, "<ddddd"),
+}
+
+
+def encode_product(name, value):
+    codec = FIXED_CODECS.get(name)
+    if codec is None or value is None:
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    return codec.encode(value)
+
+
+def decode_product(name, buf, offset, length):
+    codec = FIXED_CODECS.get(name)
+    if codec is None or length != codec.struct.size:
+        return pickle.loads(buf[offset : offset + length])
+    return codec.decode(buf, offset)
+
+
+def encode_snapshot(power_state, versions, blobs):
+    """Junta o estado de energia e os produtos já codificados num payload para o ring"""
+    header = [POWER_STATES.index(power_state)]
+    offset = SNAPSHOT_HEADER.size
+    parts = []
+    for name in DEMAND_TOPICS:
+        blob = blobs.get(name, b"")
+        header += (versions.get(name, 0), offset, len(blob))
+        offset += len(blob)
+        parts.append(blob)
+    return SNAPSHOT_HEADER.pack(*header) + b"".join(parts)
+
+
+def decode_snapshot_header(payload):
+    """(estado de energia, {produto: (versão, offset, tamanho)}) sem copiar os valores"""
+    fields = SNAPSHOT_HEADER.unpack_from(payload, 0)
+    entries = {name: fields[1 + 3 * i : 4 + 3 * i] for i, name in enumerate(DEMAND_TOPICS)}
+    return POWER_STATES[fields[0]], entries
+
+
+def encode_demand(topics):
+    if topics is None:
+        return DEMAND_ALL
+    return sum(1 << i for i, name in enumerate(DEMAND_TOPICS) if name in topics)
+
+
+def decode_demand(mask):
+    if mask == DEMAND_ALL:
+        return None
+    return frozenset(name for i, name in enumerate(DEMAND_TOPICS) if mask & (1 << i))
+
+
+class SnapshotRing:
+    """Ring buffer de snapshots em memória compartilhada, um escritor e um leitor
+
+    Cada slot tem layout fixo: cabeçalho (seq_begin, seq_end, tamanho) + payload.
+    O escritor grava seq_begin, o payload e por último seq_end, e só então avança o
+    seq do cabeçalho. O leitor copia o slot do seq mais recente e confere seq_begin
+    no fim: se mudou, o slot foi reescrito durante a cópia e a leitura é refeita.
+    """
+
+    def __init__(self, name=None, slots=RING_SLOTS, slot_size=RING_SLOT_SIZE):
+        if name is None:
+            size = RING_HEADER.size + slots * (SLOT_HEADER.size + slot_size)
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+            RING_HEADER.pack_into(self._shm.buf, 0, 0, DEMAND_ALL, 0, slots, slot_size, 0)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+            _seq, _demand, _window, slots, slot_size, _resync = RING_HEADER.unpack_from(self._shm.buf, 0)
+        self.name = self._shm.name
+        self.slots = slots
+        self.slot_size = slot_size
+        self._seq = 0
+
+    def _slot_offset(self, seq):
+        return RING_HEADER.size + (seq % self.slots) * (SLOT_HEADER.size + self.slot_size)
+
+    @property
+    def seq(self):
+        return RING_HEADER.unpack_from(self._shm.buf, 0)[0]
+
+    # controle Qt -> worker: tópicos assinados, quantas linhas o StandingsLayer exibe e resync
+    @property
+    def demand(self):
+        return struct.unpack_from("<Q", self._shm.buf, DEMAND_OFFSET)[0]
+
+    @demand.setter
+    def demand(self, mask):
+        struct.pack_into("<Q", self._shm.buf, DEMAND_OFFSET, mask)
+
+    @property
+    def standings_window(self):
+        return struct.unpack_from("<i", self._shm.buf, WINDOW_OFFSET)[0]
+
+    @standings_window.setter
+    def standings_window(self, value):
+        struct.pack_into("<i", self._shm.buf, WINDOW_OFFSET, int(value))
+
+    @property
+    def resync_count(self):
+        return struct.unpack_from("<I", self._shm.buf, RESYNC_OFFSET)[0]
+
+    def request_resync(self):
+        struct.pack_into("<I", self._shm.buf, RESYNC_OFFSET, (self.resync_count + 1) & 0xFFFFFFFF)
+
+    def write(self, payload):
+        """Publica um snapshot (bytes); False se não couber no slot"""
+        if len(payload) > self.slot_size:
+            return False
+        seq = self._seq + 1
+        offset = self._slot_offset(seq)
+        buf = self._shm.buf
+        struct.pack_into("<Q", buf, offset, seq)
+        start = offset + SLOT_HEADER.size
+        buf[start : start + len(payload)] = payload
+        SLOT_HEADER.pack_into(buf, offset, seq, seq, len(payload))
+        struct.pack_into("<Q", buf, 0, seq)
+        self._seq = seq
+        return True
+
+    def read_latest(self, after=0, retries=4):
+        """(seq, payload) do snapshot completo mais recente; None se não há nada depois de `after`"""
+        buf = self._shm.buf
+        for _ in range(retries):
+            seq = self.seq
+            if seq <= after:
+                return None
+            offset = self._slot_offset(seq)
+            _begin, end, length = SLOT_HEADER.unpack_from(buf, offset)
+            if end != seq:
+                continue
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buf[start : start + length])
+            begin = struct.unpack_from("<Q", buf, offset)[0]
+            if begin == seq:
+                return seq, payload
+        return None
+
+    def close(self):
+        self._shm.close()
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _snapshot_client_class():
+    # importado só no processo do worker: o processo Qt não carrega irsdk/NumPy por causa dele
+    from core.iracing_client import IRacingClient
+
+    class SnapshotClient(IRacingClient):
+        """IRacingClient que publica no SnapshotRing em vez de emitir sinais Qt"""
+
+        def __init__(self, ring, **kwargs):
+            super().__init__(**kwargs)
+            self._ring = ring
+            # cada produto é codificado uma vez, quando muda; o snapshot só junta os blobs
+            self._blobs = {}
+            self._versions = {}
+            self._resync_count = ring.resync_count
+
+        def _publish(self, packet):
+            for name, value in packet.items():
+                self._blobs[name] = encode_product(name, value)
+                self._versions[name] = self._versions.get(name, 0) + 1
+            self._write_snapshot()
+            return True
+
+        def _set_power_state(self, state):
+            changed = state != self.power_state
+            super()._set_power_state(state)
+            if changed:
+                self._write_snapshot()
+
+        def _apply_requests(self):
+            self._demand = decode_demand(self._ring.demand)
+            count = self._ring.resync_count
+            if count != self._resync_count:
+                self._resync_count = count
+                self._resync_requested = True
+            super()._apply_requests()
+
+        def _get_standings(self):
+            self.standings_window = self._ring.standings_window
+            return super()._get_standings()
+
+        def _write_snapshot(self):
+            snapshot = encode_snapshot(self.power_state, self._versions, self._blobs)
+            if not self._ring.write(snapshot):
+                print("[TelemetryWorker] Snapshot maior que o slot do ring buffer; descartado")
+
+    return SnapshotClient
+
+
+def _worker_main(ring_name, client_kwargs, stop_event):
+    """Entrada do processo de telemetria: polling + produtos derivados, fora do GIL do Qt"""
+    ring = SnapshotRing(name=ring_name)
+    client = _snapshot_client_class()(ring, **client_kwargs)
+    client.start()
+    try:
+        parent = multiprocessing.parent_process()
+        # se o processo Qt morrer sem avisar, o worker não fica órfão
+        while not stop_event.wait(1.0):
+            if parent is not None and not parent.is_alive():
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.stop()
+        client.wait()
+        ring.close()
+
+
+class ProcessIRacingClient(QtCore.QObject):
+    """Mesma interface do IRacingClient, com o polling rodando em outro processo
+
+    O lado Qt só confere o seq do ring buffer num QTimer e, se andou, lê o snapshot
+    mais recente; snapshots intermediários são pulados. Para os produtos com o último
+    valor isso não perde nada; no standings, um diff pulado quebra a sequência e força
+    um resync (o próximo sai completo).
+    """
+
+    data_ready = QtCore.Signal(dict)
+    car_lr_changed = QtCore.Signal(object)
+    power_state_changed = QtCore.Signal(str)
+
+    def __init__(self, read_interval_ms=8, idle_read_interval_ms=250, **client_kwargs):
+        super().__init__()
+        self.client_kwargs = client_kwargs
+        self.read_interval_ms = read_interval_ms
+        self.idle_read_interval_ms = idle_read_interval_ms
+        self.power_state = "disconnected"
+        self._standings_window = 0
+        self._demand = None
+        self._ring = None
+        self._process = None
+        self._stop_event = None
+        self._last_seq = 0
+        self._versions = {}
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self._read_snapshot)
+
+    @property
+    def standings_window(self):
+        return self._standings_window
+
+    @standings_window.setter
+    def standings_window(self, value):
+        self._standings_window = value
+        if self._ring is not None:
+            self._ring.standings_window = value
+
+    def set_demand(self, topics):
+        """Tópicos com pelo menos um assinante; o worker só calcula esses produtos"""
+        self._demand = None if topics is None else frozenset(topics)
+        if self._ring is not None:
+            self._ring.demand = encode_demand(self._demand)
+
+    def request_resync(self):
+        """Pede ao worker um standings completo (o Qt pulou snapshots e perdeu diffs)"""
+        if self._ring is not None:
+            self._ring.request_resync()
+
+    def start(self):
+        self._ring = SnapshotRing()
+        self._ring.standings_window = self._standings_window
+        self._ring.demand = encode_demand(self._demand)
+        self._last_seq = 0
+        self._versions = {}
+
+        # spawn em todas as plataformas: nunca faz fork de um processo com Qt
+        ctx = multiprocessing.get_context("spawn")
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(self._ring.name, self.client_kwargs, self._stop_event),
+            name="iracing-telemetry",
+            daemon=True,
+        )
+        self._process.start()
+        self._timer.start(self.idle_read_interval_ms)
+
+    def stop(self):
+        self._timer.stop()
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def wait(self, timeout=3.0):
+        """Espera o worker sair; força o encerramento se passar do timeout"""
+        process = self._process
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                print("[ProcessIRacingClient] Worker não encerrou; terminando processo")
+                process.terminate()
+                process.join(1.0)
+            self._process = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        return process is None or not process.is_alive()
+
+    def _read_snapshot(self):
+        latest = self._ring.read_latest(self._last_seq)
+        if latest is None:
+            return
+        self._last_seq, payload = latest
+        power_state, entries = decode_snapshot_header(payload)
+
+        if power_state != self.power_state:
+            self.power_state = power_state
+            # desconectado: confere o ring com menos frequência
+            self._timer.setInterval(
+                self.idle_read_interval_ms if power_state == "disconnected" else self.read_interval_ms
+            )
+            self.power_state_changed.emit(power_state)
+
+        # só decodifica os produtos que mudaram desde a última leitura (versão 0 = nunca publicado)
+        packet = {}
+        for name, (version, offset, length) in entries.items():
+            if version and version != self._versions.get(name):
+                self._versions[name] = version
+                packet[name] = decode_product(name, payload, offset, length)
+
+        if packet:
+            self.data_ready.emit(packet)
+            if "car_lr" in packet:
+                self.car_lr_changed.emit(packet["car_lr"])
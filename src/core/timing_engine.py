@@ -0,0 +1,105 @@
+import numpy as np
+
+# iRacing sempre publica os arrays CarIdx* com 64 posições
+MAX_CARS = 64
+# pontos fixos por volta em que a passagem de cada carro é gravada
+TIMING_BINS = 200
+# avanço maior que isso entre duas amostras é teleporte (reset, reboque para o box)
+MAX_JUMP_LAPS = 0.5
+
+
+def _as_array(values, dtype):
+    if values is None:
+        return np.zeros(0, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+
+class TimingEngine:
+    """Gap e intervalo medidos pela passagem dos carros em pontos fixos da pista
+
+    Para cada carro guarda o SessionTime da última passagem por TIMING_BINS pontos de
+    LapDistPct (interpolado entre as amostras) e a volta dessa passagem. O tempo de um
+    carro para outro à frente é `agora - quando o da frente passou onde ele está agora`:
+    mesma posição na pista, sem depender do tempo de volta. Tudo em arrays
+    (carros x pontos), o custo não depende de quantos carros estão na pista.
+    """
+
+    def __init__(self, bins=TIMING_BINS, max_cars=MAX_CARS):
+        self.bins = bins
+        self._time = np.full((max_cars, bins), np.nan)
+        self._lap = np.full((max_cars, bins), -1, dtype=np.int64)
+        # distância total (volta + LapDistPct) da última amostra; nan = fora da pista
+        self.dist = np.full(max_cars, np.nan)
+        self.session_time = None
+        self.crossings = 0
+
+    def reset(self):
+        self._time[:] = np.nan
+        self._lap[:] = -1
+        self.dist[:] = np.nan
+        self.session_time = None
+
+    def update(self, session_time, laps, lap_dist_pct):
+        """Grava as passagens por pontos fixos desde a amostra anterior (todos os carros)"""
+        if self.session_time is not None and session_time < self.session_time:
+            self.reset()  # sessão nova (ou replay voltou)
+
+        lap = _as_array(laps, np.int64)[: len(self.dist)]
+        pct = _as_array(lap_dist_pct, np.float64)[: len(self.dist)]
+        n = min(len(lap), len(pct))
+        dist = np.full(len(self.dist), np.nan)
+        dist[:n] = np.where((lap[:n] >= 0) & (pct[:n] >= 0), lap[:n] + pct[:n], np.nan)
+
+        dt = session_time - self.session_time if self.session_time is not None else 0.0
+        if dt > 0:
+            prev = self.dist
+            step = dist - prev
+            # fora do mundo (nan), parado, de ré ou teleportado: não grava nada
+            moving = (step > 0) & (step <= MAX_JUMP_LAPS)
+            bins = self.bins
+            first = np.floor(np.where(moving, prev, 0.0) * bins).astype(np.int64) + 1
+            last = np.floor(np.where(moving, dist, 0.0) * bins).astype(np.int64)
+            count = np.where(moving, np.maximum(last - first + 1, 0), 0)
+            total = int(count.sum())
+            if total:
+                # uma entrada por passagem (um carro pode cruzar vários pontos por amostra)
+                cars = np.repeat(np.arange(len(count)), count)
+                k = np.repeat(first - np.cumsum(count) + count, count) + np.arange(total)
+                frac = (k / bins - prev[cars]) / step[cars]
+                self._time[cars, k % bins] = self.session_time + frac * dt
+                self._lap[cars, k % bins] = k // bins
+                self.crossings += total
+
+        self.dist = dist
+        self.session_time = session_time
+
+    def _passage(self, cars, k):
+        """SessionTime em que `cars` passaram pelo ponto absoluto `k` (nan sem registro)"""
+        slot = k % self.bins
+        t = self._time[cars, slot]
+        return np.where(self._lap[cars, slot] == k // self.bins, t, np.nan)
+
+    def time_behind(self, cars, targets):
+        """Segundos que `cars` estão atrás de `targets` (arrays de CarIdx), na mesma posição da pista
+
+        nan quando o alvo não está à frente, está uma volta ou mais à frente (o ponto foi
+        regravado) ou ainda não passou por ali desde que o engine começou a gravar.
+        """
+        d = self.dist[cars]
+        d_target = self.dist[targets]
+        ahead = (d_target > d) & (d_target - d < 1.0)
+        bins = self.bins
+        k = np.floor(np.where(ahead, d, 0.0) * bins).astype(np.int64)
+        t0 = self._passage(targets, k)
+        # ponto seguinte: o próximo bin, ou a posição atual se o alvo ainda não chegou nele
+        passed = ahead & (d_target >= (k + 1) / bins)
+        t1 = np.where(passed, self._passage(targets, k + 1), self.session_time)
+        d1 = np.where(passed, (k + 1) / bins, d_target)
+        span = np.where(ahead, d1 - k / bins, 1.0)
+        at = t0 + (d - k / bins) / span * (t1 - t0)
+        return np.where(ahead, self.session_time - at, np.nan)
+
+    def laps_behind(self, cars, targets):
+        """Voltas inteiras de distância até `targets` (0 no mesmo giro ou sem dado)"""
+        diff = self.dist[targets] - self.dist[cars]
+        return np.where(diff >= 1.0, np.floor(np.nan_to_num(diff)), 0).astype(np.int64)
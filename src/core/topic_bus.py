@@ -0,0 +1,141 @@
+import time
+
+from PySide6 import QtCore
+
+
+class TopicBus(QtCore.QObject):
+    """Distribui os produtos do IRacingClient por tópico ("standings", "session", "fuel"...)
+
+    Cada assinante recebe um único dict {tópico: valor} por rodada do event loop, só
+    com os tópicos que assinou. Vale o último valor: se vários pacotes chegam antes da
+    entrega, os intermediários são descartados (ou combinados, nos tópicos com função
+    de merge, como os diffs de standings). O último valor de cada tópico fica guardado
+    para quem assinar depois; tópicos em diff guardam um acumulador (`set_latest`) que
+    só monta o valor completo quando alguém assina. `demand_changed` informa ao cliente
+    quais tópicos têm assinantes, para ele calcular só esses produtos.
+
+    Com um FrameScheduler ligado, a entrega acontece no próximo frame da tela em vez
+    da próxima rodada do event loop.
+    """
+
+    demand_changed = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._subscribers = {}  # callback -> frozenset(tópicos)
+        self._latest = {}
+        self._pending = {}
+        self._merge = {}
+        self._accumulators = {}  # tópico -> objeto com push(valor) / value()
+        self._flush_scheduled = False
+        self._pending_stamp = None  # perf_counter do pacote pendente mais recente
+        self._superseded = 0  # valores pendentes substituídos antes da entrega
+        self._frame_scheduler = None
+
+    def set_merge(self, topic, merge):
+        """`merge(antigo, novo)` combina valores do tópico em vez de descartar o antigo"""
+        self._merge[topic] = merge
+
+    def set_latest(self, topic, factory):
+        """O último valor do tópico vem de `factory()` (push a cada pacote, value() ao assinar)"""
+        self._accumulators[topic] = factory()
+        self._latest.pop(topic, None)
+
+    def set_frame_scheduler(self, scheduler):
+        """Passa a entregar quando `scheduler` chamar flush() (um frame da tela)"""
+        self._frame_scheduler = scheduler
+
+    def topics(self):
+        """Tópicos com pelo menos um assinante"""
+        demand = set()
+        for topics in self._subscribers.values():
+            demand.update(topics)
+        return frozenset(demand)
+
+    def subscribe(self, callback, topics):
+        topics = frozenset(topics)
+        if not topics or self._subscribers.get(callback) == topics:
+            return
+        before = self.topics()
+        self._subscribers[callback] = topics
+
+        # quem chega recebe o último valor conhecido sem esperar o próximo tick
+        latest = {}
+        for topic in topics:
+            value = self.latest(topic)
+            if value is not None:
+                latest[topic] = value
+        if latest:
+            QtCore.QTimer.singleShot(0, lambda: self._deliver_latest(callback, latest))
+
+        if self.topics() != before:
+            self.demand_changed.emit(self.topics())
+
+    def unsubscribe(self, callback):
+        if callback not in self._subscribers:
+            return
+        before = self.topics()
+        del self._subscribers[callback]
+        if self.topics() != before:
+            self.demand_changed.emit(self.topics())
+
+    def latest(self, topic, default=None):
+        accumulator = self._accumulators.get(topic)
+        if accumulator is None:
+            return self._latest.get(topic, default)
+        value = accumulator.value()
+        return default if value is None else value
+
+    def publish(self, packet):
+        """Recebe {tópico: valor}; a entrega acontece no próximo frame (ou rodada do event loop)"""
+        self._pending_stamp = time.perf_counter()
+        for topic, value in packet.items():
+            if topic in self._pending:
+                self._superseded += 1
+            accumulator = self._accumulators.get(topic)
+            if accumulator is None:
+                self._latest[topic] = value
+            else:
+                accumulator.push(value)
+            merge = self._merge.get(topic)
+            if merge is None or topic not in self._pending:
+                self._pending[topic] = value
+            else:
+                self._pending[topic] = merge(self._pending[topic], value)
+
+        if self._frame_scheduler is not None:
+            self._frame_scheduler.request_frame()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            QtCore.QTimer.singleShot(0, self._flush)
+
+    def pending_stamp(self):
+        """Quando chegou o pacote pendente mais recente (None se não há nada pendente)"""
+        return self._pending_stamp
+
+    def flush(self):
+        """Entrega o que está pendente; retorna quantos valores foram substituídos desde a última entrega"""
+        superseded, self._superseded = self._superseded, 0
+        self._flush()
+        return superseded
+
+    def _deliver_latest(self, callback, latest):
+        # pode ter saído antes da entrega
+        if callback in self._subscribers:
+            self._call(callback, latest)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        self._pending_stamp = None
+        pending, self._pending = self._pending, {}
+        for callback, topics in list(self._subscribers.items()):
+            packet = {topic: pending[topic] for topic in topics if topic in pending}
+            if packet:
+                self._call(callback, packet)
+
+    @staticmethod
+    def _call(callback, packet):
+        try:
+            callback(packet)
+        except Exception as e:
+            print(f"[TopicBus] Erro entregando {sorted(packet)}: {e}")
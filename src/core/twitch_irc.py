@@ -0,0 +1,192 @@
+import random
+import time
+from typing import NamedTuple
+
+from PySide6 import QtCore, QtNetwork
+
+TWITCH_IRC_HOST = "irc.chat.twitch.tv"
+TWITCH_IRC_PORT = 6667
+# cor de quem não escolheu uma no Twitch
+DEFAULT_COLOR = "#9ea7b3"
+
+
+class ChatMessage(NamedTuple):
+    time: str
+    user: str
+    color: str
+    text: str
+
+
+def parse_line(line):
+    """Linha IRC -> (tags, prefixo, comando, parâmetros); o último parâmetro pode ter espaços"""
+    tags = {}
+    if line.startswith("@"):
+        raw_tags, _, line = line[1:].partition(" ")
+        for item in raw_tags.split(";"):
+            key, _, value = item.partition("=")
+            tags[key] = value
+    prefix = ""
+    if line.startswith(":"):
+        prefix, _, line = line[1:].partition(" ")
+    line, separator, trailing = line.partition(" :")
+    parts = line.split()
+    command = parts[0] if parts else ""
+    params = parts[1:]
+    if separator:
+        params.append(trailing)
+    return tags, prefix, command, params
+
+
+class MessageRing:
+    """Buffer circular de capacidade fixa: memória constante, acesso O(1) por índice"""
+
+    def __init__(self, capacity=500):
+        self.capacity = capacity
+        self._items = [None] * capacity
+        self._start = 0
+        self._count = 0
+        self.total = 0  # mensagens recebidas desde o início (inclui as descartadas)
+
+    def __len__(self):
+        return self._count
+
+    def append(self, item):
+        end = (self._start + self._count) % self.capacity
+        self._items[end] = item
+        if self._count < self.capacity:
+            self._count += 1
+        else:
+            self._start = (self._start + 1) % self.capacity  # sobrescreveu a mais antiga
+        self.total += 1
+
+    def __getitem__(self, i):
+        """0 = mais antiga; -1 = mais recente"""
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._items[(self._start + i) % self.capacity]
+
+    def clear(self):
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+
+class TwitchIrcClient(QtCore.QObject):
+    """Lê o chat de um canal pelo IRC do Twitch (login anônimo, só leitura)
+
+    Roda no event loop do Qt (QTcpSocket, sem thread). As mensagens ficam em
+    `take_pending()`; `messages_pending` é emitido só na primeira mensagem depois de
+    cada retirada, para o layer juntar as chegadas e atualizar uma vez por frame.
+    """
+
+    messages_pending = QtCore.Signal()
+    status_changed = QtCore.Signal(str)
+
+    def __init__(self, channel, host=TWITCH_IRC_HOST, port=TWITCH_IRC_PORT, max_pending=500, parent=None):
+        super().__init__(parent)
+        self.channel = channel.lower().lstrip("#")
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self._pending = []
+        self._buffer = b""
+        self._running = False
+        self._retry = 1
+
+        self.socket = QtNetwork.QTcpSocket(self)
+        self.socket.connected.connect(self._on_connected)
+        self.socket.readyRead.connect(self._on_ready_read)
+        self.socket.disconnected.connect(self._on_disconnected)
+        self.socket.errorOccurred.connect(self._on_error)
+
+        self._reconnect = QtCore.QTimer(self)
+        self._reconnect.setSingleShot(True)
+        self._reconnect.timeout.connect(self._connect)
+
+    def start(self):
+        self._running = True
+        self._connect()
+
+    def stop(self):
+        self._running = False
+        self._reconnect.stop()
+        self.socket.abort()
+
+    def set_channel(self, channel):
+        channel = channel.lower().lstrip("#")
+        if channel == self.channel:
+            return
+        if self.socket.state() == QtNetwork.QAbstractSocket.ConnectedState:
+            self._send(f"PART #{self.channel}")
+            self._send(f"JOIN #{channel}")
+        self.channel = channel
+
+    def take_pending(self):
+        pending, self._pending = self._pending, []
+        return pending
+
+    # -------------------
+    # Socket
+    # -------------------
+    def _connect(self):
+        if not self._running:
+            return
+        self.status_changed.emit(f"Conectando a {self.host}:{self.port}...")
+        self._buffer = b""
+        self.socket.abort()
+        self._reconnect.stop()  # o abort acima dispara disconnected
+        self.socket.connectToHost(self.host, self.port)
+
+    def _send(self, line):
+        self.socket.write((line + "\r\n").encode("utf-8"))
+
+    def _on_connected(self):
+        self._retry = 1
+        # justinfanNNNN = login anônimo, só leitura
+        self._send("CAP REQ :twitch.tv/tags")
+        self._send(f"NICK justinfan{random.randint(10000, 99999)}")
+        self._send(f"JOIN #{self.channel}")
+        self.status_changed.emit(f"#{self.channel}")
+
+    def _on_disconnected(self):
+        self._schedule_reconnect()
+
+    def _on_error(self, error):
+        print(f"[TwitchIrc] Erro: {self.socket.errorString()}")
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        if not self._running or self._reconnect.isActive():
+            return
+        self.status_changed.emit(f"Desconectado, tentando de novo em {self._retry}s")
+        self._reconnect.start(self._retry * 1000)
+        self._retry = min(self._retry * 2, 30)
+
+    def _on_ready_read(self):
+        self._buffer += bytes(self.socket.readAll())
+        *lines, self._buffer = self._buffer.split(b"\r\n")
+        was_empty = not self._pending
+        for raw in lines:
+            self._handle_line(raw.decode("utf-8", errors="replace"))
+        if was_empty and self._pending:
+            self.messages_pending.emit()
+
+    def _handle_line(self, line):
+        if not line:
+            return
+        tags, prefix, command, params = parse_line(line)
+        if command == "PING":
+            self._send("PONG :" + (params[-1] if params else "tmi.twitch.tv"))
+        elif command == "PRIVMSG" and len(params) >= 2:
+            user = tags.get("display-name") or prefix.partition("!")[0]
+            text = params[-1]
+            if text.startswith("\x01ACTION ") and text.endswith("\x01"):
+                text = text[8:-1]  # /me
+            self._pending.append(ChatMessage(time.strftime("%H:%M:%S"), user, tags.get("color") or DEFAULT_COLOR, text))
+            if len(self._pending) > self.max_pending:
+                # layer escondido/travado: não acumula além do que cabe no buffer
+                del self._pending[: len(self._pending) - self.max_pending]
+        elif command == "RECONNECT":
+            self.socket.disconnectFromHost()
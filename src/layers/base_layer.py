@@ -1,7 +1,12 @@
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from ui.edit_frame import EditFrame
 
 
 class BaseLayer(QtWidgets.QWidget):
+    # tópicos do TopicBus que o layer consome (entregues em update_from_iracing)
+    topics = ()
+
     def __init__(self, app, layer_id, title, initial_rect=None):
         super().__init__()
         self.app = app
@@ -9,6 +14,12 @@ class BaseLayer(QtWidgets.QWidget):
         self.title = title
         self._editing = False
         self._locked = False
+        self._edit_frame = None  # criado na primeira vez que entra no modo edição
+        self.power_state = "disconnected"
+
+        # render: quantos paint events o layer (e os widgets rastreados) já fez
+        self.frames_painted = 0
+        self._static_cache = {}  # (chave, w, h, dpr) -> QPixmap
 
         # Janela sem borda, sempre por cima
         self.setWindowFlags(
@@ -28,25 +39,132 @@ class BaseLayer(QtWidgets.QWidget):
 
     # ---------- MODO EDIÇÃO ----------
     def set_edit_mode(self, editing: bool):
-        """Ativa ou desativa o modo edição (mover/redimensionar)"""
-        self._editing = editing
+        """Ativa ou desativa o modo edição (mover/redimensionar)
 
+        As alças são um filho desenhado dentro da janela (EditFrame): entrar e sair é
+        show/hide + repaint, sem setWindowFlags (que destrói e recria a janela nativa).
+        """
+        self._editing = editing
         if editing:
-            # janela normal com borda → permite arrastar/redimensionar
-            self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.WindowStaysOnTopHint)
-        else:
-            # volta para overlay sem borda
-            self.setWindowFlags(
-                QtCore.Qt.FramelessWindowHint | QtCore.Qt.WindowStaysOnTopHint | QtCore.Qt.Tool
-            )
-
-        self.show()
+            if self._edit_frame is None:
+                self._edit_frame = EditFrame(self)
+            self._edit_frame.sync()
+            self._edit_frame.show()
+        elif self._edit_frame is not None:
+            self._edit_frame.hide()
 
     # ---------- BLOQUEIO ----------
     def set_locked(self, locked: bool):
         """Trava/destrava o layer"""
         self._locked = locked
         self.setEnabled(not locked)
+        self.set_click_through(locked)
+
+    def set_click_through(self, enabled: bool):
+        """Cliques atravessam o layer (vão para o jogo)
+
+        Com a janela nativa já criada, troca a flag direto no QWindow, sem recriá-la.
+        """
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, enabled)
+        handle = self.windowHandle()
+        if handle is not None:
+            handle.setFlag(QtCore.Qt.WindowTransparentForInput, enabled)
+        else:
+            self.setWindowFlag(QtCore.Qt.WindowTransparentForInput, enabled)
+
+    # ---------- TÓPICOS ----------
+    def showEvent(self, event):
+        super().showEvent(event)
+        # minimizar/restaurar pelo sistema não mexe nas assinaturas
+        if not event.spontaneous():
+            self._subscribe_topics()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():
+            self._unsubscribe_topics()
+
+    def _subscribe_topics(self):
+        bus = getattr(self.app, "bus", None)
+        if bus is not None and self.topics:
+            bus.subscribe(self.update_from_iracing, self.topics)
+
+    def _unsubscribe_topics(self):
+        bus = getattr(self.app, "bus", None)
+        if bus is not None and self.topics:
+            bus.unsubscribe(self.update_from_iracing)
+
+    def update_from_iracing(self, packet):
+        """Recebe {tópico: snapshot} só com os tópicos assinados que mudaram"""
+
+    # ---------- RENDER ----------
+    def mark_dirty(self, rect=None):
+        """Agenda repaint só do que mudou (o layer todo se `rect` for None)"""
+        if rect is None:
+            self.update()
+        else:
+            self.update(rect)
+
+    def static_pixmap(self, key, size, draw):
+        """Pixmap de uma parte estática (moldura, header, gradiente de um estado)
+
+        `draw(painter, rect)` só roda na primeira vez para cada chave/tamanho; depois o
+        paint é um drawPixmap. O cache é limpo quando o layer muda de tamanho.
+        """
+        dpr = self.devicePixelRatioF()
+        cache_key = (key, size.width(), size.height(), dpr)
+        pixmap = self._static_cache.get(cache_key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(size * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+            draw(painter, QtCore.QRect(QtCore.QPoint(0, 0), size))
+            painter.end()
+            self._static_cache[cache_key] = pixmap
+        return pixmap
+
+    def invalidate_static(self):
+        """Descarta as partes estáticas (ex.: mudou cor/transparência)"""
+        self._static_cache.clear()
+        self.update()
+
+    def track_paints(self, widget):
+        """Conta em `frames_painted` os paints de um filho (ex.: viewport de tabela)"""
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            self.frames_painted += 1
+        return super().eventFilter(obj, event)
+
+    def paintEvent(self, event):
+        self.frames_painted += 1
+        if self.frames_painted == 1:
+            first_frame = getattr(self.app, "layer_first_frame", None)
+            if first_frame is not None:
+                first_frame(self)
+        painter = QtGui.QPainter(self)
+        self.paint_layer(painter, event.rect())
+        painter.end()
+
+    def paint_layer(self, painter, rect):
+        """Desenho próprio do layer; `rect` é a área suja a repintar"""
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._static_cache.clear()
+        if self._editing:
+            self._edit_frame.sync()
+
+    # ---------- ENERGIA ----------
+    def set_power_mode(self, state: str):
+        """Estado do iRacing: "disconnected", "idle" ou "active".
+
+        Subclasses com timers próprios devem pausá-los fora de "active".
+        """
+        self.power_state = state
 
     # ---------- SALVAR/RESTORE ----------
     def save_layout(self):
@@ -4,6 +4,8 @@ from core.config_store import ConfigStore
 
 
 class CarLRLayer(BaseLayer):
+    topics = ("car_lr",)
+
     def __init__(self, app, layer_id="car_lr", title="Car L/R", initial_rect=None):
         super().__init__(app, layer_id, title, initial_rect)
 
@@ -15,34 +17,46 @@ class CarLRLayer(BaseLayer):
         self.left_active = False
         self.right_active = False
 
-        # Timer de redraw rápido (50ms = 20fps)
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(50)
+        # sem timer de redraw: só repinta o box cujo estado mudou
+
+    def set_power_mode(self, state: str):
+        super().set_power_mode(state)
+        if state != "active":
+            self._set_state(False, False)
 
     def update_from_iracing(self, data: dict):
         """Recebe dados do iRacing via OverlayApp"""
-        val = data.get("car_lr", {}).get("val", 0)
-
-        self.left_active = False
-        self.right_active = False
-
-        if val in (2,):      # Car Left
-            self.left_active = True
-        elif val in (3,):    # Car Right
-            self.right_active = True
-        elif val in (4,):    # Both sides
-            self.left_active = True
-            self.right_active = True
-
-        #print(f"[CarLRLayer] update_from_iracing: val={val} -> L={self.left_active} R={self.right_active}")
-        self.update()
+        if "car_lr" not in data:
+            return  # pacote só com outros produtos
+        val = data["car_lr"].val
+
+        left = val in (2, 4)    # Car Left / Both sides
+        right = val in (3, 4)   # Car Right / Both sides
+        #print(f"[CarLRLayer] update_from_iracing: val={val} -> L={left} R={right}")
+        self._set_state(left, right)
+
+    def _set_state(self, left, right):
+        # o CarLeftRight chega a cada tick; na maioria das vezes nada muda
+        if left != self.left_active:
+            self.left_active = left
+            self.mark_dirty(self._box_rect(left=True))
+        if right != self.right_active:
+            self.right_active = right
+            self.mark_dirty(self._box_rect(left=False))
 
     # -------------------
     # Desenho customizado
     # -------------------
-    def _draw_box(self, painter, x, y, size, active, color1, color2):
-        rect = QtCore.QRectF(x, y, size, size)
+    def _box_rect(self, left):
+        size = self.box_size
+        margin = 12
+        # folga para a borda de 3px do estado ativo
+        x = margin if left else self.width() - margin - size
+        return QtCore.QRect(x - 2, self.height() // 2 - size // 2 - 2, size + 4, size + 4)
+
+    def _draw_box(self, painter, rect, active, color1, color2):
+        rect = QtCore.QRectF(rect).adjusted(2, 2, -2, -2)
+        size = rect.width()
 
         # Gradiente radial (efeito glow no centro)
         gradient = QtGui.QRadialGradient(rect.center(), size / 1.5)
@@ -65,19 +79,21 @@ class CarLRLayer(BaseLayer):
         # Desenha com bordas arredondadas (pill/circle)
         painter.drawRoundedRect(rect, size/2, size/2)
 
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
-
-        w, h = self.width(), self.height()
-        size = self.box_size
-        margin = 12
-
-        # Left → Amarelo
-        self._draw_box(painter, margin, h//2 - size//2, size, self.left_active, "#fffb00", "#fbff00")
-
-        # Right → Amarelo
-        self._draw_box(painter, w - margin - size, h//2 - size//2, size, self.right_active, "#fffb00", "#fbff00")
+    def _box_pixmap(self, active):
+        # os dois estados do box são desenhados uma vez e reaproveitados
+        size = QtCore.QSize(self.box_size + 4, self.box_size + 4)
+        return self.static_pixmap(
+            ("box", active),
+            size,
+            lambda painter, rect: self._draw_box(painter, rect, active, "#fffb00", "#fbff00"),
+        )
+
+    def paint_layer(self, painter, rect):
+        # Left / Right → Amarelo
+        for left, active in ((True, self.left_active), (False, self.right_active)):
+            box = self._box_rect(left)
+            if box.intersects(rect):
+                painter.drawPixmap(box.topLeft(), self._box_pixmap(active))
 
     def save_config(self):
         self.cfg_store.save_layer_config(self.layer_id, {
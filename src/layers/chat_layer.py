@@ -1,34 +1,147 @@
+import html
+
+from PySide6 import QtCore, QtGui
+
+from core.chat_protocol import configured_channel
+from core.config_store import ConfigStore
+from core.twitch_irc import TWITCH_IRC_HOST, TWITCH_IRC_PORT, MessageRing, TwitchIrcClient
 from layers.base_layer import BaseLayer
-from PySide6 import QtCore, QtWidgets
-import random, time
+
+HEADER_H = 25
+MARGIN = 5
+LINE_SPACING = 2
+
 
 class ChatLayer(BaseLayer):
-    def __init__(self, app, layer_id='chat', title='Twitch Chat', initial_rect=None):
-        super().__init__(layer_id, title, app, initial_rect)
-
-        layout = QtWidgets.QVBoxLayout(self)
-        self.text = QtWidgets.QTextEdit()
-        self.text.setReadOnly(True)
-        self.text.setStyleSheet("background-color: rgba(0,0,0,120); color: white; font-size: 12px;")
-        layout.addWidget(self.text)
-
-        self.fake_users = ["Luiz", "Racer01", "Speedy", "ChatBot", "Fan99"]
-        self.fake_msgs = [
-            "Boa corrida!",
-            "Força no braço 💪",
-            "Vai dar P1 hoje!",
-            "Box this lap?",
-            "Bela ultrapassagem!",
-            "Cuidado na curva 3..."
-        ]
-
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.add_fake_message)
-        self.timer.start(4000)  # nova msg a cada 4s
-
-    def add_fake_message(self):
-        user = random.choice(self.fake_users)
-        msg = random.choice(self.fake_msgs)
-        timestamp = time.strftime("%H:%M:%S")
-        self.text.append(f"[{timestamp}] {user}: {msg}")
-        self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
+    """Chat da Twitch nativo: IRC direto, sem navegador
+
+    As mensagens ficam num buffer circular de `capacity` entradas (memória constante
+    em horas de live). O paint desenha só as mensagens que cabem na tela, de baixo
+    para cima; o layout (QStaticText) de cada uma é feito na primeira vez que ela
+    aparece. Chegadas são juntadas e aplicadas uma vez por frame.
+    """
+
+    def __init__(self, app, layer_id="chat", title="Twitch Chat", initial_rect=None):
+        super().__init__(app, layer_id, title, initial_rect)
+
+        self.cfg_store = ConfigStore()
+        saved_cfg = self.cfg_store.load_layer_config(layer_id)
+        self.alpha = saved_cfg.get("alpha", 120)
+        self.font_size = saved_cfg.get("font_size", 12)
+
+        # cada entrada: [ChatMessage, QStaticText ou None, largura do layout]
+        self.messages = MessageRing(saved_cfg.get("capacity", 500))
+        self._scroll = 0  # mensagens acima da mais recente (roda do mouse)
+        self._status = ""
+        self.batches = 0
+
+        self._font = QtGui.QFont()
+        self._font.setPixelSize(self.font_size)
+        self._header_font = QtGui.QFont(self._font)
+        self._header_font.setBold(True)
+
+        self.client = TwitchIrcClient(
+            configured_channel(layer_id),
+            host=saved_cfg.get("irc_host", TWITCH_IRC_HOST),
+            port=saved_cfg.get("irc_port", TWITCH_IRC_PORT),
+            max_pending=self.messages.capacity,
+            parent=self,
+        )
+        self.client.messages_pending.connect(self._schedule_drain)
+        self.client.status_changed.connect(self._set_status)
+        self.client.start()
+
+        self.show()
+
+    # -------------------
+    # Mensagens
+    # -------------------
+    def _schedule_drain(self):
+        frames = getattr(self.app, "frame_scheduler", None)
+        if frames is not None:
+            frames.call_next_frame(self._drain)
+        else:
+            QtCore.QTimer.singleShot(0, lambda: self._drain(None))
+
+    def _drain(self, now):
+        batch = self.client.take_pending()
+        if not batch:
+            return
+        for message in batch:
+            self.messages.append([message, None, 0])
+        if self._scroll:
+            # lendo mensagens antigas: a tela não anda sozinha
+            self._scroll = min(self._scroll + len(batch), len(self.messages) - 1)
+        self.batches += 1
+        self.mark_dirty(self._list_rect())
+
+    def _set_status(self, status):
+        self._status = status
+        self.mark_dirty(QtCore.QRect(0, 0, self.width(), HEADER_H))
+
+    def set_channel(self, channel):
+        if channel:
+            self.client.set_channel(channel)
+            self.messages.clear()
+            self._scroll = 0
+            self._set_status(f"#{self.client.channel}")
+            self.mark_dirty()
+
+    def apply_config(self, cfg):
+        """Configs salvas pelo ControlPanel"""
+        self.set_channel(cfg.get("channel"))
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() // 120
+        self._scroll = max(0, min(self._scroll + steps * 3, len(self.messages) - 1))
+        self.mark_dirty(self._list_rect())
+
+    # -------------------
+    # Desenho
+    # -------------------
+    def _list_rect(self):
+        return self.rect().adjusted(MARGIN, HEADER_H, -MARGIN, -MARGIN)
+
+    def _layout(self, entry, width):
+        # só mensagens que aparecem na tela passam por aqui
+        if entry[1] is None or entry[2] != width:
+            message = entry[0]
+            text = QtGui.QStaticText(
+                f'<span style="color:#888">{message.time}</span> '
+                f'<b style="color:{html.escape(message.color)}">{html.escape(message.user)}</b>: '
+                f"{html.escape(message.text)}"
+            )
+            text.setTextFormat(QtCore.Qt.RichText)
+            text.setTextWidth(width)
+            text.prepare(QtGui.QTransform(), self._font)
+            entry[1] = text
+            entry[2] = width
+        return entry[1]
+
+    def _draw_background(self, painter, rect):
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(0, 0, 0, self.alpha))
+        painter.drawRoundedRect(QtCore.QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+
+    def paint_layer(self, painter, rect):
+        painter.drawPixmap(0, 0, self.static_pixmap(("bg", self.alpha), self.size(), self._draw_background))
+
+        painter.setPen(QtGui.QColor("white"))
+        if rect.top() < HEADER_H:
+            painter.setFont(self._header_font)
+            painter.drawText(
+                QtCore.QRect(MARGIN, 0, self.width() - 2 * MARGIN, HEADER_H),
+                QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,
+                self._status,
+            )
+
+        area = self._list_rect()
+        painter.setClipRect(area)
+        painter.setFont(self._font)
+        y = area.bottom()
+        i = len(self.messages) - 1 - self._scroll
+        while i >= 0 and y > area.top():
+            text = self._layout(self.messages[i], area.width())
+            y -= text.size().height() + LINE_SPACING
+            painter.drawStaticText(area.left(), y, text)
+            i -= 1
@@ -0,0 +1,121 @@
+from PySide6 import QtCore, QtGui
+
+from core.config_store import ConfigStore
+from core.standings_engine import format_lap_time
+from layers.base_layer import BaseLayer
+
+GAIN_COLOR = QtGui.QColor("lime")
+LOSS_COLOR = QtGui.QColor("red")
+NEUTRAL_COLOR = QtGui.QColor("lightgray")
+TEXT_COLOR = QtGui.QColor("white")
+
+
+def _delta_text(seconds):
+    if seconds is None:
+        return "--"
+    return f"{seconds:+.2f}"
+
+
+class DeltaLayer(BaseLayer):
+    """Delta ao vivo para a melhor volta, com barra e volta prevista"""
+
+    topics = ("delta",)
+
+    def __init__(self, app, layer_id="delta", title="Delta", initial_rect=None):
+        super().__init__(app, layer_id, title, initial_rect)
+
+        # Configuração com persistência
+        self.cfg_store = ConfigStore()
+        saved_cfg = self.cfg_store.load_layer_config(layer_id)
+        self.alpha = saved_cfg.get("alpha", 220)
+        # delta que enche meia barra (segundos)
+        self.bar_range = saved_cfg.get("bar_range", 2.0)
+
+        self.delta = None
+        # textos exibidos; o layer só repinta quando algum muda
+        self._texts = ("--", "", "")
+
+        self._big_font = QtGui.QFont()
+        self._big_font.setPointSize(20)
+        self._big_font.setBold(True)
+        self._small_font = QtGui.QFont()
+        self._small_font.setPointSize(9)
+
+        self.show()
+
+    def set_power_mode(self, state: str):
+        super().set_power_mode(state)
+        if state != "active":
+            self._set_values(None, ("--", "", ""))
+
+    def update_from_iracing(self, packet):
+        if not isinstance(packet, dict):
+            return
+        delta = packet.get("delta")
+        if delta is None:
+            return
+        texts = (
+            _delta_text(delta.delta),
+            f"Prev. {format_lap_time(delta.predicted)}   vs. ótima {_delta_text(delta.delta_optimal)}",
+            f"Melhor {format_lap_time(delta.best)}   Ótima {format_lap_time(delta.optimal)}",
+        )
+        self._set_values(delta.delta, texts)
+
+    def _set_values(self, delta, texts):
+        # o delta chega a cada tick; a barra anda em pixels, o texto em centésimos
+        old_width = self._bar_width(self.delta)
+        self.delta = delta
+        if texts != self._texts:
+            self._texts = texts
+            self.mark_dirty()
+        elif self._bar_width(delta) != old_width:
+            self.mark_dirty(self._bar_rect().adjusted(0, -2, 0, 2))
+
+    # -------------------
+    # Desenho customizado
+    # -------------------
+    def _bar_rect(self):
+        return QtCore.QRect(8, self.height() // 2 - 4, self.width() - 16, 8)
+
+    def _bar_width(self, delta):
+        """Pixels da barra a partir do centro (negativo = ganhando tempo)"""
+        if delta is None:
+            return 0
+        half = self._bar_rect().width() // 2
+        return int(max(-1.0, min(1.0, delta / self.bar_range)) * half)
+
+    def _draw_background(self, painter, rect):
+        painter.setPen(QtGui.QPen(QtGui.QColor("#444"), 2))
+        painter.setBrush(QtGui.QColor(0, 0, 0, self.alpha))
+        painter.drawRoundedRect(QtCore.QRectF(rect).adjusted(1, 1, -1, -1), 6, 6)
+
+    def paint_layer(self, painter, rect):
+        full = self.rect()
+        painter.drawPixmap(0, 0, self.static_pixmap(("bg", self.alpha), full.size(), self._draw_background))
+
+        delta = self.delta
+        color = NEUTRAL_COLOR if delta is None or delta == 0 else (GAIN_COLOR if delta < 0 else LOSS_COLOR)
+        bar = self._bar_rect()
+        width = self._bar_width(delta)
+        center = bar.center().x()
+        painter.fillRect(bar, QtGui.QColor(40, 40, 40, self.alpha))
+        if width:
+            painter.fillRect(QtCore.QRect(min(center, center + width), bar.y(), abs(width), bar.height()), color)
+        painter.fillRect(QtCore.QRect(center, bar.y() - 2, 1, bar.height() + 4), TEXT_COLOR)
+
+        big, line1, line2 = self._texts
+        top = QtCore.QRect(0, 0, full.width(), bar.y())
+        painter.setFont(self._big_font)
+        painter.setPen(color)
+        painter.drawText(top, QtCore.Qt.AlignCenter, big)
+
+        painter.setFont(self._small_font)
+        painter.setPen(TEXT_COLOR)
+        bottom = QtCore.QRect(0, bar.bottom() + 2, full.width(), full.height() - bar.bottom() - 4)
+        painter.drawText(bottom, QtCore.Qt.AlignCenter, f"{line1}\n{line2}")
+
+    def save_config(self):
+        self.cfg_store.save_layer_config(self.layer_id, {
+            "alpha": self.alpha,
+            "bar_range": self.bar_range,
+        })
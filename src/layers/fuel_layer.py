@@ -3,8 +3,13 @@ from core.config_store import ConfigStore
 from PySide6 import QtCore, QtWidgets, QtGui
 
 
+def _liters(value, digits):
+    return "--" if value is None else f"{value:.{digits}f} L"
+
+
 class FuelLayer(BaseLayer):
-    fuel_updated = QtCore.Signal(dict)
+    fuel_updated = QtCore.Signal(object)
+    topics = ("fuel",)
 
     def __init__(self, app, layer_id="fuel", title="Fuel Calc", initial_rect=None):
         super().__init__(app, layer_id, title, initial_rect)
@@ -19,13 +24,27 @@ class FuelLayer(BaseLayer):
         self.alpha = saved_cfg.get("alpha", 220)
 
         # Tabela 2 colunas (Item | Valor)
-        labels = ["Fuel atual", "Capacidade", "Consumo/volta", "Voltas restantes"]
+        labels = [
+            "Fuel atual",
+            "Capacidade",
+            "Consumo/volta",
+            "Última volta",
+            "Média 3 / 5 voltas",
+            "Média bandeira verde",
+            "Voltas restantes",
+            "Voltas até o fim",
+            "Falta p/ terminar",
+            "Reabastecer",
+            "Paradas",
+            "Janela de box",
+        ]
 
         self.table = QtWidgets.QTableWidget(self)
         self.table.setColumnCount(2)
         self.table.setRowCount(len(labels))
         self.table.setHorizontalHeaderLabels(["Item", "Valor"])
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
@@ -52,7 +71,8 @@ class FuelLayer(BaseLayer):
             }}
         """)
 
-        # Preenche coluna de itens
+        # Preenche coluna de itens; os itens de valor são criados uma vez e só têm o texto trocado
+        self._values = []
         for i, lbl in enumerate(labels):
             item = QtWidgets.QTableWidgetItem(lbl)
             item.setForeground(QtGui.QBrush(QtGui.QColor("white")))
@@ -60,18 +80,27 @@ class FuelLayer(BaseLayer):
             font.setBold(True)
             item.setFont(font)
             self.table.setItem(i, 0, item)
-            self.table.setItem(i, 1, QtWidgets.QTableWidgetItem("--"))
+
+            value = QtWidgets.QTableWidgetItem("--")
+            value.setTextAlignment(QtCore.Qt.AlignCenter)
+            # zebra striping translúcido
+            bg_color = QtGui.QColor(0, 0, 0, self.alpha) if i % 2 == 0 else QtGui.QColor(30, 30, 30, self.alpha)
+            value.setBackground(QtGui.QBrush(bg_color))
+            value.setForeground(QtGui.QBrush(QtGui.QColor("white")))
+            self.table.setItem(i, 1, value)
+            self._values.append(value)
+
+        # conta os repaints da tabela no frames_painted do layer
+        self.track_paints(self.table.viewport())
 
         layout.addWidget(self.table)
         self.setLayout(layout)
+        if not initial_rect:
+            self.resize(300, 320)  # todas as linhas da estratégia sem rolagem
 
         # conecta sinal
         self.fuel_updated.connect(self._update_ui)
 
-        # registra listener
-        if hasattr(self.app, "iracing_client"):
-            self.app.iracing_client.add_listener(self.update_from_iracing)
-
         self.show()
 
     def set_edit_mode(self, editing: bool):
@@ -88,25 +117,34 @@ class FuelLayer(BaseLayer):
         fuel = packet.get("fuel")
         if not fuel:
             return
-        QtCore.QTimer.singleShot(0, lambda: self.fuel_updated.emit(fuel))
+        self.fuel_updated.emit(fuel)
 
     def _update_ui(self, fuel):
+        if fuel.pit_first is None:
+            window = "sem parada" if fuel.refuel == 0 else "--"
+        elif fuel.pit_first == fuel.pit_last:
+            window = f"volta {fuel.pit_last}"
+        else:
+            window = f"voltas {fuel.pit_first}-{fuel.pit_last}"
+        stops = "--" if fuel.stops is None else str(fuel.stops)
         values = [
-            f"{fuel.get('level', 0):.1f} L",
-            f"{fuel.get('capacity', 0):.1f} L",
-            f"{fuel.get('use_per_lap', 0):.2f} L",
-            str(fuel.get('laps', 0))
+            f"{fuel.level:.1f} L",
+            f"{fuel.capacity:.1f} L",
+            f"{fuel.use_per_lap:.2f} L",
+            _liters(fuel.last, 2),
+            f"{_liters(fuel.avg_3, 2)} / {_liters(fuel.avg_5, 2)}",
+            _liters(fuel.avg_green, 2),
+            str(fuel.laps),
+            "--" if fuel.laps_to_go is None else f"{fuel.laps_to_go:.1f}",
+            _liters(fuel.to_finish, 1),
+            _liters(fuel.refuel, 1),
+            stops,
+            window,
         ]
-        for i, val in enumerate(values):
-            item = QtWidgets.QTableWidgetItem(val)
-            item.setTextAlignment(QtCore.Qt.AlignCenter)
-
-            # zebra striping translúcido
-            bg_color = QtGui.QColor(0, 0, 0, self.alpha) if i % 2 == 0 else QtGui.QColor(30, 30, 30, self.alpha)
-            item.setBackground(QtGui.QBrush(bg_color))
-            item.setForeground(QtGui.QBrush(QtGui.QColor("white")))
-
-            self.table.setItem(i, 1, item)
+        for item, val in zip(self._values, values):
+            # setText dispara repaint da célula; só quando o texto mudou
+            if item.text() != val:
+                item.setText(val)
 
     def closeEvent(self, event):
         widths = {}
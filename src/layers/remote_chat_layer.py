@@ -0,0 +1,162 @@
+import os
+import sys
+
+from PySide6 import QtCore, QtNetwork, QtWidgets
+
+from core.chat_protocol import LineReader, configured_channel, encode
+from layers.base_layer import BaseLayer
+
+HELPER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "chat_helper.py")
+# reinícios seguidos antes de desistir (o contador zera depois de HEALTHY_MS no ar)
+MAX_RESTARTS = 5
+HEALTHY_MS = 60000
+
+
+class RemoteTwitchChatLayer(BaseLayer):
+    """Chat da Twitch hospedado no chat_helper.py, em outro processo
+
+    Este widget nunca aparece: guarda o estado do layer (visível, geometria, modo
+    edição, trava, canal) para o OverlayApp/ControlPanel/LayoutStore e repassa tudo
+    ao helper pelo QLocalSocket. Se o helper cair, é reiniciado e recebe o estado de
+    novo; o processo dos overlays não é afetado.
+    """
+
+    def __init__(self, app, layer_id="twitchchat", title="Twitch Chat", initial_rect=None):
+        self._remote_visible = False
+        self._socket = None
+        super().__init__(app, layer_id, title, initial_rect)
+
+        self.channel = configured_channel()
+        self._reader = LineReader()
+        self._stopping = False
+        self._restarts = 0
+
+        self._server = QtNetwork.QLocalServer(self)
+        name = f"m_overlay_chat_{os.getpid()}"
+        QtNetwork.QLocalServer.removeServer(name)  # sobra de uma execução que caiu
+        if not self._server.listen(name):
+            print(f"[RemoteChat] Erro abrindo socket local: {self._server.errorString()}")
+        self._server.newConnection.connect(self._on_new_connection)
+
+        self._process = QtCore.QProcess(self)
+        self._process.setProcessChannelMode(QtCore.QProcess.ForwardedChannels)
+        self._process.finished.connect(self._on_helper_finished)
+        self._healthy = QtCore.QTimer(self)
+        self._healthy.setSingleShot(True)
+        self._healthy.timeout.connect(self._reset_restarts)
+
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.stop_helper)
+        self._start_helper()
+        self.show()
+
+    # ---------- HELPER ----------
+    def _start_helper(self):
+        if self._stopping:
+            return
+        print("[RemoteChat] Iniciando processo do chat")
+        self._process.start(sys.executable, [HELPER_SCRIPT, self._server.serverName()])
+        self._healthy.start(HEALTHY_MS)
+
+    def _reset_restarts(self):
+        self._restarts = 0
+
+    def _on_helper_finished(self, exit_code, exit_status):
+        self._healthy.stop()
+        self._drop_socket()
+        if self._stopping:
+            return
+        self._restarts += 1
+        if self._restarts > MAX_RESTARTS:
+            print(f"[RemoteChat] Chat caiu {MAX_RESTARTS} vezes seguidas; desativado até reabrir o overlay")
+            return
+        delay = min(30, 2 ** (self._restarts - 1))
+        print(f"[RemoteChat] Processo do chat saiu (código {exit_code}); reiniciando em {delay}s")
+        QtCore.QTimer.singleShot(delay * 1000, self._start_helper)
+
+    def stop_helper(self):
+        """Encerra o helper junto com o overlay"""
+        self._stopping = True
+        if self._process.state() == QtCore.QProcess.NotRunning:
+            return
+        self._send({"cmd": "quit"})
+        if not self._process.waitForFinished(2000):
+            self._process.kill()
+            self._process.waitForFinished(1000)
+
+    def _on_new_connection(self):
+        socket = self._server.nextPendingConnection()
+        if socket is None:
+            return
+        self._drop_socket()
+        self._socket = socket
+        socket.readyRead.connect(self._on_ready_read)
+        socket.disconnected.connect(lambda s=socket: self._on_disconnected(s))
+
+    def _on_disconnected(self, socket):
+        if socket is self._socket:
+            self._drop_socket()
+
+    def _drop_socket(self):
+        if self._socket is not None:
+            self._socket.deleteLater()
+            self._socket = None
+            self._reader = LineReader()
+
+    def _on_ready_read(self):
+        for message in self._reader.feed(self._socket.readAll()):
+            event = message.get("event")
+            if event == "ready":
+                self._send_state()
+            elif event == "geometry":
+                # usuário moveu o chat no modo edição: fica no layout salvo pelo overlay
+                # (super() não devolve a geometria ao helper, que já está nela)
+                super().setGeometry(message["x"], message["y"], message["w"], message["h"])
+
+    def _send(self, message):
+        socket = self._socket
+        if socket is not None and socket.state() == QtNetwork.QLocalSocket.ConnectedState:
+            socket.write(encode(message))
+            socket.flush()
+
+    def _send_geometry(self):
+        rect = self.geometry()
+        self._send({"cmd": "geometry", "x": rect.x(), "y": rect.y(), "w": rect.width(), "h": rect.height()})
+
+    def _send_state(self):
+        # helper novo (ou reiniciado): recebe tudo de uma vez
+        self._send({"cmd": "channel", "channel": self.channel})
+        self._send_geometry()
+        self._send({"cmd": "locked", "locked": self._locked})
+        if self._editing:
+            self._send({"cmd": "edit", "editing": True})
+        self._send({"cmd": "show" if self._remote_visible else "hide"})
+
+    # ---------- ESTADO DO LAYER ----------
+    def setVisible(self, visible):
+        # a janela de verdade é a do helper; este widget continua escondido
+        self._remote_visible = visible
+        self._send({"cmd": "show" if visible else "hide"})
+
+    def isVisible(self):
+        return self._remote_visible
+
+    def setGeometry(self, *args):
+        super().setGeometry(*args)
+        self._send_geometry()
+
+    def set_edit_mode(self, editing: bool):
+        self._editing = editing
+        self._send({"cmd": "edit", "editing": editing})
+
+    def set_locked(self, locked: bool):
+        self._locked = locked
+        self._send({"cmd": "locked", "locked": locked})
+
+    def set_channel(self, channel):
+        if channel and channel != self.channel:
+            self.channel = channel
+            self._send({"cmd": "channel", "channel": channel})
+
+    def apply_config(self, cfg):
+        """Configs salvas pelo ControlPanel"""
+        self.set_channel(cfg.get("channel"))
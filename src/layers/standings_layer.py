@@ -1,26 +1,16 @@
 from layers.base_layer import BaseLayer
 from core.config_store import ConfigStore
-from PySide6 import QtCore, QtWidgets, QtGui
+from PySide6 import QtCore, QtWidgets
 from ui.standings_config_dialog import StandingsConfigDialog
-import copy
-
-COUNTRY_FLAGS = {
-    "Brazil": "🇧🇷",
-    "United States": "🇺🇸",
-    "Germany": "🇩🇪",
-    "France": "🇫🇷",
-    "Italy": "🇮🇹",
-    "Spain": "🇪🇸",
-    "Portugal": "🇵🇹",
-    "Argentina": "🇦🇷",
-    "Canada": "🇨🇦",
-    "United Kingdom": "🇬🇧",
-    # pode expandir conforme os países que aparecem
-}
+from core.snapshots import SessionSnapshot
+from core.standings_delta import StandingsDecoder
+from core.extrapolation import Extrapolator, SessionClock
+from ui.standings_model import StandingsModel, COLUMNS
 
 
 class StandingsLayer(BaseLayer):
     standings_updated = QtCore.Signal(dict)
+    topics = ("standings", "session")
 
     def __init__(self, app, layer_id="standings", title="Standings", initial_rect=None):
         super().__init__(app, layer_id, title, initial_rect)
@@ -34,12 +24,12 @@ class StandingsLayer(BaseLayer):
         # Transparência configurável
         self.alpha = saved_cfg.get("alpha", 220)
 
-        # Tabela de standings
-        headers = ["Pos", "Δ", "#", "Logo", "Flag", "Driver", "Lic", "iRating", "Últ. Volta", "Gap"]
-        self.table = QtWidgets.QTableWidget(self)
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
+        # Tabela de standings: model por CarIdx, só as células que mudam são repintadas
+        self.model = StandingsModel(self, alpha=self.alpha)
+        self.table = QtWidgets.QTableView(self)
+        self.model.attach(self.table)
         self.table.verticalHeader().setVisible(False)
+        self.track_paints(self.table.viewport())
 
         # Configuração do header
         header = self.table.horizontalHeader()
@@ -48,14 +38,20 @@ class StandingsLayer(BaseLayer):
 
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.table.setIconSize(QtCore.QSize(24, 12))
 
-        # guarda posição inicial quando não há qualy
-        self._starting_positions = {}
+        # standings chega como diffs (core.standings_delta); sessão como snapshot
+        self._decoder = StandingsDecoder()
+        self._session = SessionSnapshot()
+
+        # gap animado a cada frame entre as amostras de standings (4 Hz), sem polling extra
+        self.smooth_gaps = saved_cfg.get("smooth_gaps", True)
+        max_ahead = saved_cfg.get("max_extrapolation", 0.5)
+        self._clock = SessionClock(max_ahead)
+        self._gaps = Extrapolator(max_ahead=max_ahead)
 
         # Estilos
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: transparent;
                 color: white;
                 font-size: 12px;
@@ -91,11 +87,13 @@ class StandingsLayer(BaseLayer):
             "iRating": 30,
             "Últ. Volta": 40,
             "Gap": 20,
+            "Int.": 20,
+            "Melhor": 40,
+            "Ritmo": 40,
         }
 
         saved_widths = saved_cfg.get("columns_width", {})
-        for col in range(self.table.columnCount()):
-            header_text = self.table.horizontalHeaderItem(col).text()
+        for col, header_text in enumerate(COLUMNS):
             width = saved_widths.get(header_text, default_widths.get(header_text, 80))
             self.table.setColumnWidth(col, width)
 
@@ -122,10 +120,6 @@ class StandingsLayer(BaseLayer):
         # conecta sinal
         self.standings_updated.connect(self._update_ui)
 
-        # registra listener
-        if hasattr(self.app, "iracing_client"):
-            self.app.iracing_client.add_listener(self.update_from_iracing)
-
         self.show()
 
     def set_edit_mode(self, editing: bool):
@@ -139,103 +133,118 @@ class StandingsLayer(BaseLayer):
     def update_from_iracing(self, packet):
         if not isinstance(packet, dict):
             return
-        standings = packet.get("standings")
-        session = packet.get("session")
-        if not standings and not session:
+        if packet.get("standings") is None and packet.get("session") is None:
             return
-        safe_data = copy.deepcopy(packet)
-        QtCore.QTimer.singleShot(0, lambda: self.standings_updated.emit(safe_data))
+        # o bus já entrega no frame da tela, com só o último valor de cada tópico
+        self.standings_updated.emit(packet)
 
     def _update_ui(self, packet):
-        standings = packet.get("standings", [])
-        session = packet.get("session", {})
+        session = packet.get("session")
+        if session is not None:
+            self._session = session
+            self._update_session_label(session)
+        my_driver_id = self._session.my_driver_id
 
-        # filtro "eu + X players"
+        # o cliente só formata a janela "eu + X players"
         saved_cfg = self.cfg_store.load_layer_config(self.layer_id)
         max_players = saved_cfg.get("max_players", 11)
-        my_driver_id = session.get("my_driver_id")
-
-        if max_players and my_driver_id is not None:
-            my_driver = next((d for d in standings if d.get("id") == my_driver_id), None)
-            if my_driver:
-                idx = standings.index(my_driver)
-                half = max_players // 2
-                start = max(0, idx - half)
-                end = min(len(standings), start + max_players)
-                if end - start < max_players:
-                    start = max(0, end - max_players)
-                standings = standings[start:end]
-
-        self.table.setRowCount(len(standings))
-        for i, d in enumerate(standings):
-            pos = QtWidgets.QTableWidgetItem(str(d.get("pos", "--")))
-
-            # --- Delta estilizado ---
-            delta_val = d.get("pos_gain", 0)
-            if delta_val > 0:
-                delta = QtWidgets.QTableWidgetItem(f"+{delta_val}")
-                delta.setForeground(QtGui.QBrush(QtGui.QColor("lime")))
-            elif delta_val < 0:
-                delta = QtWidgets.QTableWidgetItem(str(delta_val))
-                delta.setForeground(QtGui.QBrush(QtGui.QColor("red")))
-            else:
-                delta = QtWidgets.QTableWidgetItem("0")
-                delta.setForeground(QtGui.QBrush(QtGui.QColor("lightgray")))
-
-            car_num = QtWidgets.QTableWidgetItem(str(d.get("car_number", "--")))
-            logo_item = QtWidgets.QTableWidgetItem()
-            if d.get("car_logo"):
-                logo_item.setIcon(QtGui.QIcon(d["car_logo"]))
-            drv = QtWidgets.QTableWidgetItem(d.get("driver", "--"))
-
-            # Flag por país
-            country = (d.get("country") or "").title()
-            flag_item = QtWidgets.QTableWidgetItem(COUNTRY_FLAGS.get(country, "🏳️"))
-            flag_item.setTextAlignment(QtCore.Qt.AlignCenter)
-
-            lic = QtWidgets.QTableWidgetItem(d.get("license", "--"))
-            lic_color = d.get("license_color", "#333")
-            lic.setBackground(QtGui.QBrush(QtGui.QColor(lic_color)))
-
-            ir = QtWidgets.QTableWidgetItem(f"{d.get('irating', '--')} {d.get('ir_delta', '')}")
-            lap = QtWidgets.QTableWidgetItem(d.get("last_lap", "--"))
-            gap = QtWidgets.QTableWidgetItem(d.get("gap", "--"))
-
-            # aplica cor de fundo
-            if d.get("id") == my_driver_id:
-                bg_color = QtGui.QColor(70, 130, 180, 200)  # azul destaque
-            else:
-                bg_color = QtGui.QColor(0, 0, 0, self.alpha) if i % 2 == 0 else QtGui.QColor(30, 30, 30, self.alpha)
-
-            for col, item in enumerate([pos, delta, car_num, logo_item, flag_item, drv, lic, ir, lap, gap]):
-                if item:
-                    if col == 5:  # coluna "Driver"
-                        item.setTextAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
-                    else:
-                        item.setTextAlignment(QtCore.Qt.AlignCenter)
-                    item.setBackground(QtGui.QBrush(bg_color))
-                    self.table.setItem(i, col, item)
-
-            # líder continua dourado
-            if d.get("pos") == 1:
-                for item in [pos, drv, ir, lap, gap]:
-                    item.setForeground(QtGui.QBrush(QtGui.QColor("#FFD700")))
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+        client = getattr(self.app, "iracing_client", None)
+        if client is not None:
+            client.standings_window = max_players
+
+        diff = packet.get("standings")
+        if diff is None:
+            # só a sessão mudou (pode ter mudado o carro destacado)
+            self.model.apply_changes(self._decoder.rows, (), my_driver_id)
+            return
 
+        result = self._decoder.apply(diff)
+        if result is None:
+            # perdeu um diff: mantém a tabela atual e pede um snapshot completo
+            if client is not None:
+                client.request_resync()
+            return
+
+        reordered, changed = result
+        if reordered:
+            self.model.set_rows(self._decoder.rows, my_driver_id)
+        else:
+            self.model.apply_changes(self._decoder.rows, changed, my_driver_id)
+        if self.smooth_gaps:
+            self._sample_gaps()
+
+    # -------------------
+    # Interpolação do gap
+    # -------------------
+    # a animação só roda com o iRacing ativo e enquanto há amostra recente para extrapolar;
+    # fora disso o FrameScheduler pode parar o timer
+    def set_power_mode(self, state: str):
+        super().set_power_mode(state)
+        if state != "active":
+            self._stop_gap_animation()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not event.spontaneous():
+            self._start_gap_animation()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():
+            self._stop_gap_animation()
+
+    def _start_gap_animation(self):
+        frames = getattr(self.app, "frame_scheduler", None)
+        if frames is None or not self.smooth_gaps or self.power_state != "active" or not self.isVisible():
+            return
+        if self._clock.expired():
+            return
+        frames.add_animation(self._animate_gaps)
+
+    def _stop_gap_animation(self):
+        frames = getattr(self.app, "frame_scheduler", None)
+        if frames is not None:
+            frames.remove_animation(self._animate_gaps)
+
+    def _sample_gaps(self):
+        session_time = self._decoder.session_time
+        self._clock.sync(session_time)
+        rows = self._decoder.rows
+        for row in rows:
+            self._gaps.update(row.id, row.gap_s, row.gap_rate, session_time)
+        self._gaps.retain({row.id for row in rows})
+        self._start_gap_animation()
+
+    def _animate_gaps(self, now):
+        session_time = self._clock.now(now)
+        if session_time is None:
+            self._stop_gap_animation()
+            return
+        texts = {}
+        for row in self._decoder.rows:
+            gap = self._gaps.value(row.id, session_time)
+            if gap is not None:
+                texts[row.id] = f"+{gap:.1f}s"
+        self.model.set_gap_texts(texts)
+        if self._clock.expired(now):
+            # sem amostra nova (sim pausado, replay parado): o gap já parou no limite;
+            # volta na próxima amostra de standings
+            self._stop_gap_animation()
+
+    def _update_session_label(self, session):
         # Atualiza infos da sessão
-        sof = session.get("sof", "--")
-        length = session.get("session_length", "--")
-        remain = session.get("time_remain", None)
-        track_temp = session.get("track_temp", "--")
+        sof = session.sof
+        length = session.session_length
+        remain = session.time_remain
+        track_temp = session.track_temp
 
         txt = f"SOF Geral: {sof} | Sessão: {length}"
         if remain:  # só aparece em sessão por tempo
             txt += f" | Restante: {remain}"
         txt += f" | Temp. pista: {track_temp}"
 
-        self.session_label.setText(txt)
+        if txt != self.session_label.text():
+            self.session_label.setText(txt)
 
     def open_config_dialog(self):
         saved_cfg = self.cfg_store.load_layer_config(self.layer_id)
@@ -250,8 +259,7 @@ class StandingsLayer(BaseLayer):
 
     def closeEvent(self, event):
         widths = {}
-        for col in range(self.table.columnCount()):
-            header = self.table.horizontalHeaderItem(col).text()
+        for col, header in enumerate(COLUMNS):
             widths[header] = self.table.columnWidth(col)
 
         state = self.table.horizontalHeader().saveState().toHex().data().decode()
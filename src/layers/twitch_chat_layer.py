@@ -1,27 +1,6 @@
-import json
-import os
 from PySide6 import QtWidgets, QtWebEngineWidgets
 from layers.base_layer import BaseLayer
-
-CONFIG_FILE = "config.json"
-
-
-def load_config():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print("[Config] Erro ao ler config.json:", e)
-    return {}
-
-
-def save_config(data):
-    try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print("[Config] Erro ao salvar config.json:", e)
+from core.chat_protocol import chat_url, configured_channel
 
 
 class TwitchChatLayer(BaseLayer):
@@ -30,13 +9,19 @@ class TwitchChatLayer(BaseLayer):
 
         self.view = QtWebEngineWidgets.QWebEngineView(self)
 
-        cfg = load_config()
-        channel = cfg.get("twitch_channel", "twitch")  # valor padrão
-        url = f"https://www.twitch.tv/embed/{channel}/chat?parent=localhost&darkpopout"
-
-        self.view.setUrl(url)
+        self.channel = None
+        self.set_channel(configured_channel())
         self.show()
 
+    def set_channel(self, channel):
+        if channel and channel != self.channel:
+            self.channel = channel
+            self.view.setUrl(chat_url(channel))
+
+    def apply_config(self, cfg):
+        """Configs salvas pelo ControlPanel"""
+        self.set_channel(cfg.get("channel"))
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
         self.view.setGeometry(self.rect().adjusted(5, 25, -5, -5))
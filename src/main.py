@@ -1,6 +1,10 @@
+import time
+
+STARTED = time.perf_counter()  # antes de importar o Qt: entra na medida de inicialização
+
 from core.app import OverlayApp
 import sys
 
 if __name__ == "__main__":
-    app = OverlayApp(sys.argv)
-    sys.exit(app.exec())
\ No newline at end of file
+    app = OverlayApp(sys.argv, started=STARTED)
+    sys.exit(app.exec())
@@ -2,7 +2,7 @@ import os
 import json
 from PySide6 import QtWidgets, QtGui, QtCore
 from ui.standings_config_dialog import StandingsConfigDialog
-from layers.twitch_chat_layer import save_config, load_config
+from core.config_store import save_config, load_config
 
 
 class ControlPanel(QtWidgets.QWidget):
@@ -136,9 +136,6 @@ class ControlPanel(QtWidgets.QWidget):
         for layer in self.app.layers.values():
             if hasattr(layer, "set_edit_mode"):
                 layer.set_edit_mode(checked)
-        if not checked:
-            for lid, cb in self.checkboxes.items():
-                self.app.toggle_layer_visibility(lid, cb.isChecked())
 
     # -------- Configs por layer --------
     def open_layer_config(self, layer_id):
@@ -149,7 +146,7 @@ class ControlPanel(QtWidgets.QWidget):
         dialog.setModal(True)
         layout = QtWidgets.QVBoxLayout(dialog)
 
-        if layer_id == "twitchchat":
+        if layer_id in ("twitchchat", "chat"):
             inp = QtWidgets.QLineEdit(cfg.get("channel", ""))
             layout.addWidget(QtWidgets.QLabel("Canal da Twitch"))
             layout.addWidget(inp)
@@ -243,6 +240,11 @@ class ControlPanel(QtWidgets.QWidget):
         data["layer_configs"][layer_id].update(cfg)
         save_config(data)
 
+        # layer já criado aplica na hora (ex.: troca de canal do chat)
+        layer = self.app.layers.get(layer_id)
+        if layer is not None and hasattr(layer, "apply_config"):
+            layer.apply_config(cfg)
+
     # -------- Auxiliares de cor --------
     def pick_color(self, button):
         color = QtWidgets.QColorDialog.getColor()
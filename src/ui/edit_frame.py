@@ -0,0 +1,130 @@
+from PySide6 import QtCore, QtGui, QtWidgets
+
+BAR_H = 18  # barra de arrastar no topo
+GRIP = 14  # cantos de redimensionar
+BORDER = 2
+MIN_W, MIN_H = 80, 40
+
+BAR_COLOR = QtGui.QColor(255, 216, 0, 200)
+BORDER_COLOR = QtGui.QColor(255, 216, 0, 230)
+GRIP_COLOR = QtGui.QColor(255, 255, 255, 230)
+
+CORNERS = {
+    "top_left": QtCore.Qt.TopEdge | QtCore.Qt.LeftEdge,
+    "top_right": QtCore.Qt.TopEdge | QtCore.Qt.RightEdge,
+    "bottom_left": QtCore.Qt.BottomEdge | QtCore.Qt.LeftEdge,
+    "bottom_right": QtCore.Qt.BottomEdge | QtCore.Qt.RightEdge,
+}
+CURSORS = {
+    "move": QtCore.Qt.SizeAllCursor,
+    "top_left": QtCore.Qt.SizeFDiagCursor,
+    "bottom_right": QtCore.Qt.SizeFDiagCursor,
+    "top_right": QtCore.Qt.SizeBDiagCursor,
+    "bottom_left": QtCore.Qt.SizeBDiagCursor,
+}
+
+
+class EditFrame(QtWidgets.QWidget):
+    """Alças do modo edição desenhadas dentro da janela do layer
+
+    Filho do layer, por cima do conteúdo, com máscara só na barra, nos cantos e na
+    borda: o resto dos cliques chega nos widgets de baixo (ex.: redimensionar colunas
+    da tabela). Mostrar/esconder é um repaint; a janela nativa não é recriada.
+    """
+
+    def __init__(self, layer):
+        super().__init__(layer)
+        self.layer = layer
+        self.setMouseTracking(True)
+        self._drag = None  # (área, posição global inicial, geometria inicial)
+        self.hide()
+
+    def sync(self):
+        """Acompanha o tamanho do layer e fica acima dos filhos"""
+        self.setGeometry(self.layer.rect())
+        self.setMask(self._handles_region())
+        self.raise_()
+
+    # ---------- HIT-TEST ----------
+    def _bar_rect(self):
+        return QtCore.QRect(0, 0, self.width(), BAR_H)
+
+    def _grip_rects(self):
+        w, h = self.width(), self.height()
+        return {
+            "top_left": QtCore.QRect(0, 0, GRIP, GRIP),
+            "top_right": QtCore.QRect(w - GRIP, 0, GRIP, GRIP),
+            "bottom_left": QtCore.QRect(0, h - GRIP, GRIP, GRIP),
+            "bottom_right": QtCore.QRect(w - GRIP, h - GRIP, GRIP, GRIP),
+        }
+
+    def hit_test(self, pos):
+        """"move", um canto ("top_left", ...) ou None"""
+        for name, rect in self._grip_rects().items():
+            if rect.contains(pos):
+                return name
+        if self._bar_rect().contains(pos):
+            return "move"
+        return None
+
+    def _handles_region(self):
+        region = QtGui.QRegion(self._bar_rect())
+        for rect in self._grip_rects().values():
+            region += QtGui.QRegion(rect)
+        inner = self.rect().adjusted(BORDER, BORDER, -BORDER, -BORDER)
+        return region + (QtGui.QRegion(self.rect()) - QtGui.QRegion(inner))
+
+    # ---------- DESENHO ----------
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self._bar_rect(), BAR_COLOR)
+        painter.setPen(QtGui.QPen(BORDER_COLOR, BORDER))
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        for rect in self._grip_rects().values():
+            painter.fillRect(rect, GRIP_COLOR)
+        painter.setPen(QtGui.QColor("black"))
+        painter.drawText(
+            self._bar_rect().adjusted(GRIP + 4, 0, -GRIP - 4, 0),
+            QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft,
+            self.layer.title,
+        )
+        painter.end()
+
+    # ---------- MOUSE ----------
+    def mousePressEvent(self, event):
+        area = self.hit_test(event.position().toPoint())
+        if area is None or event.button() != QtCore.Qt.LeftButton:
+            return super().mousePressEvent(event)
+        # move/resize do sistema quando a plataforma oferece; senão, feito aqui
+        handle = self.layer.windowHandle()
+        if handle is not None:
+            started = handle.startSystemMove() if area == "move" else handle.startSystemResize(CORNERS[area])
+            if started:
+                return
+        self._drag = (area, event.globalPosition().toPoint(), self.layer.geometry())
+
+    def mouseMoveEvent(self, event):
+        if self._drag is None:
+            area = self.hit_test(event.position().toPoint())
+            self.setCursor(CURSORS.get(area, QtCore.Qt.ArrowCursor))
+            return
+        area, start_pos, start_rect = self._drag
+        delta = event.globalPosition().toPoint() - start_pos
+        if area == "move":
+            self.layer.move(start_rect.topLeft() + delta)
+            return
+        edges = CORNERS[area]
+        rect = QtCore.QRect(start_rect)
+        if edges & QtCore.Qt.LeftEdge:
+            rect.setLeft(min(rect.left() + delta.x(), rect.right() - MIN_W))
+        if edges & QtCore.Qt.RightEdge:
+            rect.setRight(max(rect.right() + delta.x(), rect.left() + MIN_W))
+        if edges & QtCore.Qt.TopEdge:
+            rect.setTop(min(rect.top() + delta.y(), rect.bottom() - MIN_H))
+        if edges & QtCore.Qt.BottomEdge:
+            rect.setBottom(max(rect.bottom() + delta.y(), rect.top() + MIN_H))
+        self.layer.setGeometry(rect)
+
+    def mouseReleaseEvent(self, event):
+        self._drag = None
@@ -0,0 +1,156 @@
+import os
+from collections import OrderedDict
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+# tamanho de cada célula do atlas e do que é desenhado dentro dela
+CELL_W, CELL_H = 48, 16
+LOGO_SIZE = QtCore.QSize(24, 12)
+FLAG_SIZE = QtCore.QSize(18, 14)
+BADGE_SIZE = QtCore.QSize(44, 14)
+DEFAULT_FLAG = "🏳️"
+
+# role usado pelo model para apontar o sprite de uma célula
+SPRITE_ROLE = int(QtCore.Qt.UserRole) + 1
+
+
+class SpriteAtlas:
+    """Um único QPixmap com sprites pré-escalados (logos, bandeiras, badges de licença)
+
+    Cada sprite é carregado/desenhado uma vez e copiado para uma célula do atlas; o
+    paint só faz drawPixmap de um retângulo do atlas. Quando as células acabam, o
+    sprite usado há mais tempo é substituído (LRU). Arquivos que não existem ficam
+    num cache negativo e não são procurados de novo.
+    """
+
+    def __init__(self, capacity=256, columns=16):
+        self.capacity = capacity
+        self.columns = columns
+        rows = (capacity + columns - 1) // columns
+        self.pixmap = QtGui.QPixmap(columns * CELL_W, rows * CELL_H)
+        self.pixmap.fill(QtCore.Qt.transparent)
+        self._slots = OrderedDict()  # chave -> QRect (ordem = uso, mais recente no fim)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._missing = set()
+        self.loads = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def lookup(self, key):
+        """QRect do sprite já carregado (None se não está no atlas); nunca decodifica"""
+        rect = self._slots.get(key)
+        if rect is not None:
+            self._slots.move_to_end(key)
+        return rect
+
+    def is_missing(self, key):
+        return key in self._missing
+
+    def ensure(self, key):
+        """Garante o sprite no atlas; decodifica/desenha só na primeira vez"""
+        rect = self.lookup(key)
+        if rect is not None or key in self._missing:
+            return rect
+
+        image = self._render(key)
+        if image is None:
+            self._missing.add(key)
+            return None
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            _old_key, old_rect = self._slots.popitem(last=False)
+            slot = (old_rect.y() // CELL_H) * self.columns + old_rect.x() // CELL_W
+
+        x = (slot % self.columns) * CELL_W
+        y = (slot // self.columns) * CELL_H
+        painter = QtGui.QPainter(self.pixmap)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.fillRect(x, y, CELL_W, CELL_H, QtCore.Qt.transparent)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        painter.drawImage(x, y, image)
+        painter.end()
+
+        rect = QtCore.QRect(x, y, image.width(), image.height())
+        self._slots[key] = rect
+        self.loads += 1
+        return rect
+
+    def clear_missing(self):
+        """Esquece o cache negativo (ex.: assets novos instalados)"""
+        self._missing.clear()
+
+    # -------------------
+    # Renderização de cada tipo de sprite
+    # -------------------
+    def _render(self, key):
+        kind = key[0]
+        if kind == "logo":
+            return self._render_logo(key[1])
+        if kind == "flag":
+            return self._render_text(key[1], FLAG_SIZE)
+        if kind == "lic":
+            return self._render_badge(key[1], key[2])
+        return None
+
+    @staticmethod
+    def _render_logo(path):
+        if not path or not os.path.exists(path):
+            return None
+        image = QtGui.QImage(path)
+        if image.isNull():
+            return None
+        return image.scaled(LOGO_SIZE, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+
+    @staticmethod
+    def _blank(size):
+        image = QtGui.QImage(size, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        return image
+
+    def _render_text(self, text, size):
+        image = self._blank(size)
+        painter = QtGui.QPainter(image)
+        font = painter.font()
+        font.setPixelSize(size.height() - 2)
+        painter.setFont(font)
+        painter.drawText(image.rect(), QtCore.Qt.AlignCenter, text)
+        painter.end()
+        return image
+
+    def _render_badge(self, text, color):
+        image = self._blank(BADGE_SIZE)
+        painter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        background = QtGui.QColor(color)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QtCore.QRectF(image.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        # texto escuro em licenças claras
+        painter.setPen(QtGui.QColor("black" if background.lightness() > 150 else "white"))
+        font = painter.font()
+        font.setPixelSize(BADGE_SIZE.height() - 3)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.drawText(image.rect(), QtCore.Qt.AlignCenter, str(text))
+        painter.end()
+        return image
+
+
+class SpriteDelegate(QtWidgets.QStyledItemDelegate):
+    """Pinta o fundo normal da célula e, por cima, o sprite apontado por SPRITE_ROLE"""
+
+    def __init__(self, atlas, parent=None):
+        super().__init__(parent)
+        self.atlas = atlas
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        source = index.data(SPRITE_ROLE)
+        if source is None:
+            return
+        target = QtCore.QRect(QtCore.QPoint(0, 0), source.size())
+        target.moveCenter(option.rect.center())
+        painter.drawPixmap(target, self.atlas.pixmap, source)
@@ -0,0 +1,276 @@
+from PySide6 import QtCore, QtGui
+
+from ui.sprite_atlas import DEFAULT_FLAG, SPRITE_ROLE, SpriteAtlas, SpriteDelegate
+
+COUNTRY_FLAGS = {
+    "Brazil": "🇧🇷",
+    "United States": "🇺🇸",
+    "Germany": "🇩🇪",
+    "France": "🇫🇷",
+    "Italy": "🇮🇹",
+    "Spain": "🇪🇸",
+    "Portugal": "🇵🇹",
+    "Argentina": "🇦🇷",
+    "Canada": "🇨🇦",
+    "United Kingdom": "🇬🇧",
+    # pode expandir conforme os países que aparecem
+}
+
+COLUMNS = ["Pos", "Δ", "#", "Logo", "Flag", "Driver", "Lic", "iRating", "Últ. Volta", "Gap", "Int.", "Melhor", "Ritmo"]
+(
+    COL_POS, COL_DELTA, COL_NUMBER, COL_LOGO, COL_FLAG, COL_DRIVER, COL_LIC, COL_IRATING, COL_LAP, COL_GAP,
+    COL_INTERVAL, COL_BEST, COL_PACE,
+) = range(len(COLUMNS))
+# colunas douradas/negrito na linha do líder
+LEADER_COLUMNS = {COL_POS, COL_DRIVER, COL_IRATING, COL_LAP, COL_GAP}
+# colunas desenhadas a partir do SpriteAtlas
+SPRITE_COLUMNS = (COL_LOGO, COL_FLAG, COL_LIC)
+
+# cores e fontes criadas uma vez, não a cada célula
+GAIN_COLOR = QtGui.QColor("lime")
+LOSS_COLOR = QtGui.QColor("red")
+NEUTRAL_COLOR = QtGui.QColor("lightgray")
+LEADER_COLOR = QtGui.QColor("#FFD700")
+ME_COLOR = QtGui.QColor(70, 130, 180, 200)  # azul destaque
+CENTER = int(QtCore.Qt.AlignCenter)
+LEFT = int(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
+
+# roles como int: comparar com o enum do PySide6 a cada chamada de data() é caro
+DISPLAY = int(QtCore.Qt.DisplayRole)
+FONT = int(QtCore.Qt.FontRole)
+ALIGNMENT = int(QtCore.Qt.TextAlignmentRole)
+BACKGROUND = int(QtCore.Qt.BackgroundRole)
+FOREGROUND = int(QtCore.Qt.ForegroundRole)
+
+
+def sprite_key(row, col):
+    """Chave do sprite da célula no atlas (None se a coluna não tem sprite)"""
+    if col == COL_LOGO:
+        return ("logo", row.car_logo) if row.car_logo else None
+    if col == COL_FLAG:
+        return ("flag", COUNTRY_FLAGS.get((row.country or "").title(), DEFAULT_FLAG))
+    if col == COL_LIC:
+        return ("lic", row.license, row.license_color)
+    return None
+
+
+def cell_keys(row):
+    """O que cada coluna exibe; duas linhas com a mesma chave pintam a célula igual"""
+    leader = row.pos == 1
+    return (
+        (row.pos, leader),
+        row.pos_gain,
+        row.car_number,
+        row.car_logo,
+        row.country,
+        (row.driver, leader),
+        (row.license, row.license_color),
+        (row.irating, row.ir_delta, leader),
+        (row.last_lap, leader),
+        (row.gap, leader),
+        row.interval,
+        row.best_lap,
+        row.pace,
+    )
+
+
+class StandingsModel(QtCore.QAbstractTableModel):
+    """Standings por CarIdx: ultrapassagens viram moveRows e só células alteradas emitem dataChanged"""
+
+    def __init__(self, parent=None, alpha=220, atlas=None):
+        super().__init__(parent)
+        self.alpha = alpha
+        # logos, bandeiras e badges de licença: decodificados uma vez, desenhados do atlas
+        self.atlas = atlas or SpriteAtlas()
+        self._rows = []  # StandingsRow na ordem exibida
+        self._keys = []  # cell_keys de cada linha, para comparar no próximo tick
+        self._row_of = {}  # CarIdx -> linha
+        self.my_driver_id = None
+        # texto do gap interpolado até o frame atual (CarIdx -> str); substitui row.gap
+        self._gap_text = {}
+        self._bold = QtGui.QFont()
+        self._bold.setBold(True)
+        self._zebra = None
+        self.set_alpha(alpha)
+
+    def attach(self, view):
+        """Liga o model a uma QTableView, com o delegate que desenha os sprites"""
+        view.setModel(self)
+        self._delegate = SpriteDelegate(self.atlas, view)
+        for col in SPRITE_COLUMNS:
+            view.setItemDelegateForColumn(col, self._delegate)
+
+    def set_alpha(self, alpha):
+        self.alpha = alpha
+        self._zebra = (QtGui.QColor(0, 0, 0, alpha), QtGui.QColor(30, 30, 30, alpha))
+        if self._rows:
+            self._emit_rows_changed(0, len(self._rows) - 1)
+
+    # -------------------
+    # QAbstractTableModel
+    # -------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == DISPLAY:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if role == DISPLAY:
+            if col == COL_GAP:
+                return self._gap_text.get(row.id, row.gap)
+            return self._display(row, col)
+        if role == ALIGNMENT:
+            return LEFT if col == COL_DRIVER else CENTER
+        if role == SPRITE_ROLE:
+            key = sprite_key(row, col)
+            if key is None:
+                return None
+            # normalmente já está no atlas (carregado quando a linha chegou)
+            return self.atlas.lookup(key) or self.atlas.ensure(key)
+        if role == BACKGROUND:
+            if row.id == self.my_driver_id:
+                return ME_COLOR
+            return self._zebra[index.row() % 2]
+        if role == FOREGROUND:
+            if col == COL_DELTA:
+                if row.pos_gain > 0:
+                    return GAIN_COLOR
+                return LOSS_COLOR if row.pos_gain < 0 else NEUTRAL_COLOR
+            if row.pos == 1 and col in LEADER_COLUMNS:
+                return LEADER_COLOR
+            return None
+        if role == FONT:
+            if row.pos == 1 and col in LEADER_COLUMNS:
+                return self._bold
+            return None
+        return None
+
+    @staticmethod
+    def _display(row, col):
+        if col == COL_POS:
+            return str(row.pos)
+        if col == COL_DELTA:
+            return f"+{row.pos_gain}" if row.pos_gain > 0 else str(row.pos_gain)
+        if col == COL_NUMBER:
+            return str(row.car_number)
+        if col == COL_DRIVER:
+            return row.driver
+        if col == COL_IRATING:
+            return f"{row.irating} {row.ir_delta}"
+        if col == COL_LAP:
+            return row.last_lap
+        if col == COL_GAP:
+            return row.gap
+        if col == COL_INTERVAL:
+            return row.interval
+        if col == COL_BEST:
+            return row.best_lap
+        if col == COL_PACE:
+            return row.pace
+        return None
+
+    # -------------------
+    # Atualização incremental
+    # -------------------
+    def set_rows(self, rows, my_driver_id=None):
+        """Aplica um novo tick: remove/insere/move linhas por CarIdx e emite só o que mudou"""
+        if my_driver_id != self.my_driver_id:
+            self.my_driver_id = my_driver_id
+            if self._rows:
+                self._emit_rows_changed(0, len(self._rows) - 1)
+
+        new_ids = [row.id for row in rows]
+        wanted = set(new_ids)
+
+        # 1) quem saiu da janela
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i].id not in wanted:
+                self.beginRemoveRows(QtCore.QModelIndex(), i, i)
+                del self._rows[i]
+                del self._keys[i]
+                self.endRemoveRows()
+
+        # 2) quem entrou, já perto da posição final
+        present = {row.id for row in self._rows}
+        for i, row in enumerate(rows):
+            if row.id not in present:
+                at = min(i, len(self._rows))
+                self.beginInsertRows(QtCore.QModelIndex(), at, at)
+                self._rows.insert(at, row)
+                self._keys.insert(at, cell_keys(row))
+                self.endInsertRows()
+                self._load_sprites(row)
+
+        # 3) ultrapassagens: move cada carro para a posição nova (zebra das linhas movidas muda junto)
+        for i, car_idx in enumerate(new_ids):
+            if self._rows[i].id == car_idx:
+                continue
+            j = next(k for k in range(i + 1, len(self._rows)) if self._rows[k].id == car_idx)
+            self.beginMoveRows(QtCore.QModelIndex(), j, j, QtCore.QModelIndex(), i)
+            self._rows.insert(i, self._rows.pop(j))
+            self._keys.insert(i, self._keys.pop(j))
+            self.endMoveRows()
+            self._emit_rows_changed(i, j)
+
+        # 4) valores: dataChanged só nas faixas de colunas que mudaram
+        for i, row in enumerate(rows):
+            self._refresh_row(i, row)
+        self._row_of = {car_idx: i for i, car_idx in enumerate(new_ids)}
+
+    def apply_changes(self, rows, changed_ids, my_driver_id=None):
+        """Só valores mudaram (mesmos carros, mesma ordem): custo proporcional a `changed_ids`"""
+        if my_driver_id != self.my_driver_id:
+            self.set_rows(rows, my_driver_id)
+            return
+        for car_idx in changed_ids:
+            i = self._row_of.get(car_idx)
+            if i is not None:
+                self._refresh_row(i, rows[i])
+
+    def set_gap_texts(self, texts):
+        """Gaps interpolados {CarIdx: texto}; só as células cujo texto mudou são repintadas"""
+        old = self._gap_text
+        self._gap_text = texts
+        for car_idx in old.keys() | texts.keys():
+            if old.get(car_idx) != texts.get(car_idx):
+                i = self._row_of.get(car_idx)
+                if i is not None:
+                    index = self.index(i, COL_GAP)
+                    self.dataChanged.emit(index, index)
+
+    def _refresh_row(self, i, row):
+        keys = cell_keys(row)
+        old = self._keys[i]
+        self._rows[i] = row
+        if keys == old:
+            return
+        self._keys[i] = keys
+        if any(keys[col] != old[col] for col in SPRITE_COLUMNS):
+            self._load_sprites(row)
+        first = None
+        for col in range(len(COLUMNS) + 1):
+            changed = col < len(COLUMNS) and keys[col] != old[col]
+            if changed and first is None:
+                first = col
+            elif not changed and first is not None:
+                self.dataChanged.emit(self.index(i, first), self.index(i, col - 1))
+                first = None
+
+    def _load_sprites(self, row):
+        # fora do paint: quando o carro entra na tabela ou o DriverInfo muda
+        for col in SPRITE_COLUMNS:
+            key = sprite_key(row, col)
+            if key is not None:
+                self.atlas.ensure(key)
+
+    def _emit_rows_changed(self, first, last):
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(COLUMNS) - 1))